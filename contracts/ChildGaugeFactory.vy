@@ -3,10 +3,10 @@
 @title Child Liquidity Gauge Factory
 @license MIT
 @author Curve Finance
-@custom:version 2.0.0
+@custom:version 2.1.0
 """
 
-version: public(constant(String[8])) = "2.0.0"
+version: public(constant(String[8])) = "2.1.0"
 
 
 from vyper.interfaces import ERC20
@@ -15,6 +15,9 @@ interface ChildGauge:
     def initialize(_lp_token: address, _root: address, _manager: address): nonpayable
     def integrate_fraction(_user: address) -> uint256: view
     def user_checkpoint(_user: address) -> bool: nonpayable
+    def claim_rewards(_addr: address): nonpayable
+    def lp_token() -> address: view
+    def manager() -> address: view
 
 interface CallProxy:
     def anyCall(
@@ -53,6 +56,16 @@ event UpdateCallProxy:
     _old_call_proxy: address
     _new_call_proxy: address
 
+event UpdateCloneBlueprint:
+    _old_blueprint: address
+    _new_blueprint: address
+
+event UpdateRootCloneArgs:
+    _clone_args: bool
+
+event UpdateSplitEmissionRequests:
+    _split: bool
+
 event UpdateMirrored:
     _gauge: indexed(address)
     _mirrored: bool
@@ -62,7 +75,31 @@ event TransferOwnership:
     _new_owner: address
 
 
+struct GaugeParams:
+    lp_token: address
+    salt: bytes32
+    manager: address
+
+struct GaugeAddresses:
+    root: address
+    child: address
+
+struct GaugeInfo:
+    gauge: address
+    lp_token: address
+    manager: address
+    gauge_data: uint256
+
+
 WEEK: constant(uint256) = 86400 * 7
+MAX_MINT: constant(uint256) = 32
+MAX_DEPLOY: constant(uint256) = 32
+MAX_PREDICT: constant(uint256) = 512
+MAX_PAGE: constant(uint256) = 256
+# largest list of gauges whose `transmit_emissions_many` calldata fits in 1024 bytes
+MAX_EMISSION_REQUESTS: constant(uint256) = 29
+# ERC-5202 blueprint holding the clone initcode of `_gauge_codehash`, preceded by the 0xfe7100 preamble
+CLONE_BLUEPRINT_CODEHASH: constant(bytes32) = 0x3cfea834fb129f2bf0bfccf41647e488b1c99e904a878608968901da32848088
 
 
 crv: public(ERC20)
@@ -70,6 +107,12 @@ crv: public(ERC20)
 
 get_implementation: public(address)
 voting_escrow: public(address)
+# gauges are deployed as immutable-args clones from this blueprint, or minimal proxies if unset
+clone_blueprint: public(address)
+next_clone_lp_token: address
+# initcode hashes, updated with the implementation and the deployment mode
+gauge_codehash: public(bytes32)
+root_codehash: public(bytes32)
 
 owner: public(address)
 future_owner: public(address)
@@ -77,7 +120,10 @@ manager: public(address)
 
 root_factory: public(address)
 root_implementation: public(address)
+root_clone_args: public(bool)
 call_proxy: public(address)
+# one request per gauge, for root bridgers handling a single transfer per transaction
+split_emission_requests: public(bool)
 # [last_request][has_counterpart][is_valid_gauge]
 gauge_data: public(HashMap[address, uint256])
 # user -> gauge -> value
@@ -86,6 +132,9 @@ minted: public(HashMap[address, HashMap[address, uint256]])
 get_gauge_from_lp_token: public(HashMap[address, address])
 get_gauge_count: public(uint256)
 get_gauge: public(address[max_value(int128)])
+# every gauge deployed for an LP token, `get_gauge_from_lp_token` only keeps the latest
+get_lp_token_gauge_count: public(HashMap[address, uint256])
+get_lp_token_gauge: public(HashMap[address, address[max_value(uint256)]])
 
 
 @external
@@ -106,6 +155,7 @@ def __init__(_call_proxy: address, _root_factory: address, _root_impl: address,
     assert _root_impl != empty(address)
     self.root_factory = _root_factory
     self.root_implementation = _root_impl
+    self.root_codehash = self._gauge_codehash(_root_impl, False)
     log UpdateRoot(_root_factory, _root_impl)
 
     self.owner = _owner
@@ -116,30 +166,65 @@ def __init__(_call_proxy: address, _root_factory: address, _root_impl: address,
 
 
 @internal
-def _psuedo_mint(_gauge: address, _user: address):
+def _request_emissions(_gauges: DynArray[address, MAX_MINT]):
+    """
+    @notice Request emissions for `_gauges` with as few cross chain messages as possible
+    @dev Requests are only batched within a call, so none wait for a later transaction.
+        With `split_emission_requests` every gauge is requested in its own message
+    """
+    if self.split_emission_requests:
+        for gauge in _gauges:
+            CallProxy(self.call_proxy).anyCall(
+                self,
+                _abi_encode(gauge, method_id=method_id("transmit_emissions(address)")),
+                empty(address),
+                1,
+            )
+        return
+
+    count: uint256 = len(_gauges)
+    gauges: DynArray[address, MAX_EMISSION_REQUESTS] = []
+    for i in range(MAX_MINT):
+        if i == count:
+            break
+        gauges.append(_gauges[i])
+        if len(gauges) == MAX_EMISSION_REQUESTS or i + 1 == count:
+            CallProxy(self.call_proxy).anyCall(
+                self,
+                _abi_encode(gauges, method_id=method_id("transmit_emissions_many(address[])")),
+                empty(address),
+                1,
+            )
+            gauges = []
+
+
+@internal
+def _psuedo_mint(_gauge: address, _user: address) -> (uint256, bool):
+    """
+    @notice Record everything which belongs to `_user` in `_gauge` as minted
+    @dev The caller is responsible for transferring the returned amount of CRV
+        and for requesting emissions
+    @return Amount of CRV to transfer to `_user`, whether to request emissions
+    """
     gauge_data: uint256 = self.gauge_data[_gauge]
     assert gauge_data != 0  # dev: invalid gauge
 
     # if is_mirrored and last_request != this week
-    if gauge_data & 2 != 0 and (gauge_data >> 2) / WEEK != block.timestamp / WEEK:
-        CallProxy(self.call_proxy).anyCall(
-            self,
-            _abi_encode(_gauge, method_id=method_id("transmit_emissions(address)")),
-            empty(address),
-            1,
-        )
+    request: bool = gauge_data & 2 != 0 and (gauge_data >> 2) / WEEK != block.timestamp / WEEK
+    if request:
         # update last request time
-        self.gauge_data[_gauge] = block.timestamp << 2 + 3
+        self.gauge_data[_gauge] = (block.timestamp << 2) + 3
 
     assert ChildGauge(_gauge).user_checkpoint(_user)
     total_mint: uint256 = ChildGauge(_gauge).integrate_fraction(_user)
     to_mint: uint256 = total_mint - self.minted[_user][_gauge]
 
     if to_mint != 0 and self.crv != empty(ERC20):
-        assert self.crv.transfer(_user, to_mint, default_return_value=True)
         self.minted[_user][_gauge] = total_mint
 
         log Minted(_user, _gauge, total_mint)
+        return to_mint, request
+    return 0, request
 
 
 @external
@@ -149,30 +234,106 @@ def mint(_gauge: address):
     @notice Mint everything which belongs to `msg.sender` and send to them
     @param _gauge `LiquidityGauge` address to get mintable amount from
     """
-    self._psuedo_mint(_gauge, msg.sender)
+    to_mint: uint256 = 0
+    request: bool = False
+    to_mint, request = self._psuedo_mint(_gauge, msg.sender)
+    if request:
+        self._request_emissions([_gauge])
+
+    if to_mint != 0:
+        assert self.crv.transfer(msg.sender, to_mint, default_return_value=True)
 
 
 @external
 @nonreentrant("lock")
-def mint_many(_gauges: address[32]):
+def mint_many(_gauges: DynArray[address, MAX_MINT]):
     """
     @notice Mint everything which belongs to `msg.sender` across multiple gauges
+    @dev CRV owed across all gauges is sent in a single transfer, emissions
+        are requested in a single cross chain message unless `split_emission_requests`.
+        Requests are only batched within this call, not across transactions
     @param _gauges List of `LiquidityGauge` addresses
     """
-    for i in range(32):
-        if _gauges[i] == empty(address):
-            pass
-        self._psuedo_mint(_gauges[i], msg.sender)
+    to_mint: uint256 = 0
+    requests: DynArray[address, MAX_MINT] = []
+    for gauge in _gauges:
+        if gauge == empty(address):
+            continue
+        minted: uint256 = 0
+        request: bool = False
+        minted, request = self._psuedo_mint(gauge, msg.sender)
+        to_mint += minted
+        if request:
+            requests.append(gauge)
+    self._request_emissions(requests)
+
+    if to_mint != 0:
+        assert self.crv.transfer(msg.sender, to_mint, default_return_value=True)
 
 
 @external
-def deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address = msg.sender) -> address:
+@nonreentrant("lock")
+def claim_many(_gauges: DynArray[address, MAX_MINT]):
     """
-    @notice Deploy a liquidity gauge
-    @param _lp_token The token to deposit in the gauge
-    @param _salt A value to deterministically deploy a gauge
-    @param _manager The address to set as manager of the gauge
+    @notice Mint CRV and claim reward tokens of `msg.sender` across multiple gauges
+    @dev CRV owed across all gauges is sent in a single transfer. Reward tokens are sent
+        by each gauge, to the default reward receiver of `msg.sender` when set
+    @param _gauges List of `LiquidityGauge` addresses
+    """
+    to_mint: uint256 = 0
+    requests: DynArray[address, MAX_MINT] = []
+    for gauge in _gauges:
+        if gauge == empty(address):
+            continue
+        minted: uint256 = 0
+        request: bool = False
+        minted, request = self._psuedo_mint(gauge, msg.sender)
+        to_mint += minted
+        if request:
+            requests.append(gauge)
+        ChildGauge(gauge).claim_rewards(msg.sender)
+    self._request_emissions(requests)
+
+    if to_mint != 0:
+        assert self.crv.transfer(msg.sender, to_mint, default_return_value=True)
+
+
+@pure
+@internal
+def _gauge_codehash(_implementation: address, _clone_args: bool) -> bytes32:
+    """
+    @notice Hash of the initcode deploying a gauge of `_implementation`
+    @dev Immutable-args clones fetch their args from `clone_args` of the deployer, and
+        return the EIP-1167 runtime with the args appended, so the hash is independent of them
     """
+    if _clone_args:
+        return keccak256(
+            concat(
+                0x63a51db7ff60e01b6000526000600060046000335afa15605757,  # staticcall(gas, caller, clone_args())
+                0x69363d3d373d3d3d363d7360b01b600052,  # mstore(0x00, EIP-1167 runtime[0:10])
+                0x6e5af43d82803e903d91602b57fd5bf360881b601e52,  # mstore(0x1e, EIP-1167 runtime[30:45])
+                0x601460143803600a393d6000602d3e3d602d016000f35b600080fd,  # copy implementation and args, return
+                convert(_implementation, bytes20),
+            )
+        )
+    return keccak256(
+        concat(
+            0x602d3d8160093d39f3363d3d373d3d3d363d73,
+            convert(_implementation, bytes20),
+            0x5af43d82803e903d91602b57fd5bf3,
+        )
+    )
+
+
+@pure
+@internal
+def _create2_address(_deployer: address, _salt: bytes32, _codehash: bytes32) -> address:
+    digest: bytes32 = keccak256(concat(0xFF, convert(_deployer, bytes20), _salt, _codehash))
+    return convert(convert(digest, uint256) & convert(max_value(uint160), uint256), address)
+
+
+@internal
+def _deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address, _root_codehash: bytes32) -> address:
     if self.get_gauge_from_lp_token[_lp_token] != empty(address):
         # overwriting lp_token -> gauge mapping requires
         assert msg.sender == self.owner  # dev: only owner
@@ -180,9 +341,21 @@ def deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address = msg.sen
     gauge_data: uint256 = 1  # set is_valid_gauge = True
     implementation: address = self.get_implementation
     salt: bytes32 = keccak256(_abi_encode(chain.id, _salt))
-    gauge: address = create_minimal_proxy_to(
-        implementation, salt=salt
-    )
+    gauge: address = empty(address)
+    blueprint: address = self.clone_blueprint
+    if blueprint == empty(address):
+        gauge = create_minimal_proxy_to(implementation, salt=salt)
+    else:
+        # read back by the initcode through `clone_args`
+        self.next_clone_lp_token = _lp_token
+        gauge = create_from_blueprint(
+            blueprint,
+            slice(convert(implementation, bytes32), 12, 20),
+            raw_args=True,
+            code_offset=3,
+            salt=salt,
+        )
+        self.next_clone_lp_token = empty(address)
 
     if msg.sender == self.call_proxy:
         gauge_data += 2  # set mirrored = True
@@ -202,16 +375,12 @@ def deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address = msg.sen
     self.get_gauge_count = idx + 1
     self.get_gauge_from_lp_token[_lp_token] = gauge
 
+    idx = self.get_lp_token_gauge_count[_lp_token]
+    self.get_lp_token_gauge[_lp_token][idx] = gauge
+    self.get_lp_token_gauge_count[_lp_token] = idx + 1
+
     # derive root gauge address
-    gauge_codehash: bytes32 = keccak256(
-        concat(
-            0x602d3d8160093d39f3363d3d373d3d3d363d73,
-            convert(self.root_implementation, bytes20),
-            0x5af43d82803e903d91602b57fd5bf3,
-        )
-    )
-    digest: bytes32 = keccak256(concat(0xFF, convert(self.root_factory, bytes20), salt, gauge_codehash))
-    root: address = convert(convert(digest, uint256) & convert(max_value(uint160), uint256), address)
+    root: address = self._create2_address(self.root_factory, salt, _root_codehash)
 
     # If root is uninitialized, self.owner can always set the root gauge manually
     # on the gauge contract itself via set_root_gauge method
@@ -221,6 +390,32 @@ def deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address = msg.sen
     return gauge
 
 
+@external
+def deploy_gauge(_lp_token: address, _salt: bytes32, _manager: address = msg.sender) -> address:
+    """
+    @notice Deploy a liquidity gauge
+    @param _lp_token The token to deposit in the gauge
+    @param _salt A value to deterministically deploy a gauge
+    @param _manager The address to set as manager of the gauge
+    """
+    return self._deploy_gauge(_lp_token, _salt, _manager, self.root_codehash)
+
+
+@external
+def deploy_gauges(_params: DynArray[GaugeParams, MAX_DEPLOY]) -> DynArray[address, MAX_DEPLOY]:
+    """
+    @notice Deploy multiple liquidity gauges
+    @dev The root gauge codehash is read once for all gauges
+    @param _params List of LP token, salt and manager of each gauge
+    @return The deployed gauges
+    """
+    root_codehash: bytes32 = self.root_codehash
+    gauges: DynArray[address, MAX_DEPLOY] = []
+    for params in _params:
+        gauges.append(self._deploy_gauge(params.lp_token, params.salt, params.manager, root_codehash))
+    return gauges
+
+
 @external
 def set_crv(_crv: ERC20):
     """
@@ -247,9 +442,38 @@ def set_root(_factory: address, _implementation: address):
 
     self.root_factory = _factory
     self.root_implementation = _implementation
+    self.root_codehash = self._gauge_codehash(_implementation, self.root_clone_args)
     log UpdateRoot(_factory, _implementation)
 
 
+@external
+def set_root_clone_args(_clone_args: bool):
+    """
+    @notice Set whether root gauges are deployed as immutable-args clones
+    @dev Used only to derive the root gauge address on deployment
+    @param _clone_args True if the root factory has a clone blueprint set
+    """
+    assert msg.sender in [self.owner, self.manager]  # dev: access denied
+
+    self.root_clone_args = _clone_args
+    self.root_codehash = self._gauge_codehash(self.root_implementation, _clone_args)
+    log UpdateRootCloneArgs(_clone_args)
+
+
+@external
+def set_split_emission_requests(_split: bool):
+    """
+    @notice Set whether emissions are requested in one cross chain message per gauge
+    @dev Required when the root bridger of this chain rejects the root factory in `check`,
+        as `transmit_emissions_many` then only bridges the first gauge of a batch
+    @param _split True to request every gauge in its own message
+    """
+    assert msg.sender in [self.owner, self.manager]  # dev: access denied
+
+    self.split_emission_requests = _split
+    log UpdateSplitEmissionRequests(_split)
+
+
 @external
 def set_voting_escrow(_voting_escrow: address):
     """
@@ -272,6 +496,22 @@ def set_implementation(_implementation: address):
 
     log UpdateImplementation(self.get_implementation, _implementation)
     self.get_implementation = _implementation
+    self.gauge_codehash = self._gauge_codehash(_implementation, self.clone_blueprint != empty(address))
+
+
+@external
+def set_clone_blueprint(_blueprint: address):
+    """
+    @notice Deploy gauges as immutable-args clones, or minimal proxies if `_blueprint` is empty
+    @dev Clones read their LP token from code instead of storage
+    @param _blueprint The ERC-5202 blueprint of the clone initcode
+    """
+    assert msg.sender == self.owner  # dev: only owner
+    assert _blueprint == empty(address) or _blueprint.codehash == CLONE_BLUEPRINT_CODEHASH  # dev: invalid blueprint
+
+    log UpdateCloneBlueprint(self.clone_blueprint, _blueprint)
+    self.clone_blueprint = _blueprint
+    self.gauge_codehash = self._gauge_codehash(self.get_implementation, _blueprint != empty(address))
 
 
 @external
@@ -337,6 +577,86 @@ def accept_transfer_ownership():
     self.owner = msg.sender
 
 
+@view
+@external
+def predict_gauges(_salts: DynArray[bytes32, MAX_PREDICT]) -> DynArray[GaugeAddresses, MAX_PREDICT]:
+    """
+    @notice Predict the addresses of the root and child gauges deployed with each salt on this chain
+    @param _salts List of salts passed to `deploy_gauge`
+    @return List of root and child gauge addresses
+    """
+    codehash: bytes32 = self.gauge_codehash
+    root_factory: address = self.root_factory
+    root_codehash: bytes32 = self.root_codehash
+
+    addresses: DynArray[GaugeAddresses, MAX_PREDICT] = []
+    for gauge_salt in _salts:
+        salt: bytes32 = keccak256(_abi_encode(chain.id, gauge_salt))
+        addresses.append(GaugeAddresses({
+            root: self._create2_address(root_factory, salt, root_codehash),
+            child: self._create2_address(self, salt, codehash),
+        }))
+    return addresses
+
+
+@view
+@internal
+def _gauge_info(_gauge: address) -> GaugeInfo:
+    return GaugeInfo({
+        gauge: _gauge,
+        lp_token: ChildGauge(_gauge).lp_token(),
+        manager: ChildGauge(_gauge).manager(),
+        gauge_data: self.gauge_data[_gauge],
+    })
+
+
+@view
+@external
+def get_gauges(_start: uint256, _count: uint256) -> DynArray[GaugeInfo, MAX_PAGE]:
+    """
+    @notice Query a page of the gauges deployed by this factory
+    @dev Managers are not indexed, gauges update them without notifying the factory
+    @param _start Index of the first gauge to query
+    @param _count Number of gauges to query, at most 256
+    @return List of gauge, LP token, manager and gauge data, in the order of `get_gauge`
+    """
+    gauges: DynArray[GaugeInfo, MAX_PAGE] = []
+    end: uint256 = min(_start + _count, self.get_gauge_count)
+    for i in range(_start, _start + MAX_PAGE):
+        if i >= end:
+            break
+        gauges.append(self._gauge_info(self.get_gauge[i]))
+    return gauges
+
+
+@view
+@external
+def get_lp_token_gauges(_lp_token: address, _start: uint256, _count: uint256) -> DynArray[GaugeInfo, MAX_PAGE]:
+    """
+    @notice Query a page of the gauges deployed for `_lp_token`, including replaced ones
+    @param _lp_token The LP token of the gauges
+    @param _start Index of the first gauge to query
+    @param _count Number of gauges to query, at most 256
+    @return List of gauge, LP token, manager and gauge data, in the order of `get_lp_token_gauge`
+    """
+    gauges: DynArray[GaugeInfo, MAX_PAGE] = []
+    end: uint256 = min(_start + _count, self.get_lp_token_gauge_count[_lp_token])
+    for i in range(_start, _start + MAX_PAGE):
+        if i >= end:
+            break
+        gauges.append(self._gauge_info(self.get_lp_token_gauge[_lp_token][i]))
+    return gauges
+
+
+@view
+@external
+def clone_args() -> address:
+    """
+    @notice Immutable args of the gauge being deployed, read by the clone initcode
+    """
+    return self.next_clone_lp_token
+
+
 @view
 @external
 def is_valid_gauge(_gauge: address) -> bool:
@@ -0,0 +1,108 @@
+# pragma version 0.3.10
+"""
+@title Child Emissions Distributor
+@license MIT
+@author Curve Finance
+@custom:version 0.0.1
+@notice Splits CRV bridged in batches by the root `BatchBridger` across child gauges
+"""
+
+version: public(constant(String[8])) = "0.0.1"
+
+
+from vyper.interfaces import ERC20
+
+interface CallProxy:
+    def context() -> (address, uint256): view
+
+interface ChildGauge:
+    def notify_emissions(): nonpayable
+
+interface Factory:
+    def crv() -> ERC20: view
+
+
+event Distribute:
+    _gauge: indexed(address)
+    _amount: uint256
+
+
+MAX_PENDING: constant(uint256) = 29
+MAX_DISTRIBUTE: constant(uint256) = 64
+ROOT_CHAIN_ID: constant(uint256) = 1
+
+FACTORY: public(immutable(Factory))
+CALL_PROXY: public(immutable(CallProxy))
+ROOT_BRIDGER: public(immutable(address))
+
+# child gauge -> CRV announced by the root chain and not yet distributed
+owed: public(HashMap[address, uint256])
+
+
+@external
+def __init__(_factory: Factory, _call_proxy: CallProxy, _root_bridger: address):
+    """
+    @param _factory The child gauge factory
+    @param _call_proxy The anyCall proxy relaying the split of each batch
+    @param _root_bridger The `BatchBridger` on the root chain
+    """
+    FACTORY = _factory
+    CALL_PROXY = _call_proxy
+    ROOT_BRIDGER = _root_bridger
+
+
+@internal
+def _distribute(_gauge: address, _crv: ERC20, _balance: uint256) -> uint256:
+    """
+    @notice Send the CRV owed to `_gauge` if it has arrived
+    @return The CRV balance left
+    """
+    amount: uint256 = self.owed[_gauge]
+    if amount == 0 or amount > _balance:
+        return _balance
+
+    self.owed[_gauge] = 0
+    assert _crv.transfer(_gauge, amount, default_return_value=True)
+    ChildGauge(_gauge).notify_emissions()
+
+    log Distribute(_gauge, amount)
+    return _balance - amount
+
+
+@external
+def receive_emissions(_emissions: DynArray[uint256, MAX_PENDING]):
+    """
+    @notice Record the split of a batch bridged by the root `BatchBridger`
+    @dev Gauges are paid right away when the batch arrived ahead of the message
+    @param _emissions List of [uint96 amount][address child gauge]
+    """
+    assert msg.sender == CALL_PROXY.address  # dev: only call proxy
+    sender: address = empty(address)
+    chain_id: uint256 = 0
+    sender, chain_id = CALL_PROXY.context()
+    assert sender == ROOT_BRIDGER and chain_id == ROOT_CHAIN_ID  # dev: invalid sender
+
+    for emission in _emissions:
+        gauge: address = convert(emission % 2 ** 160, address)
+        self.owed[gauge] += emission >> 160
+
+    crv: ERC20 = FACTORY.crv()
+    balance: uint256 = crv.balanceOf(self)
+    for emission in _emissions:
+        balance = self._distribute(convert(emission % 2 ** 160, address), crv, balance)
+
+
+@external
+def distribute(_gauges: DynArray[address, MAX_DISTRIBUTE]):
+    """
+    @notice Send the CRV owed to `_gauges` once the bridged batch arrived
+    @dev Owed amounts are paid from the CRV balance shared by every batch, so a gauge
+        can be paid with CRV bridged for another batch still in flight. Every batch
+        announced by the root bridger is bridged in full, the gauges left owed are paid
+        once it arrives
+    @param _gauges List of child gauges
+    """
+    crv: ERC20 = FACTORY.crv()
+    balance: uint256 = crv.balanceOf(self)
+    for gauge in _gauges:
+        balance = self._distribute(gauge, crv, balance)
@@ -0,0 +1,116 @@
+# pragma version 0.3.10
+"""
+@title Multi Reward Forwarder
+@license MIT
+@author Curve Finance
+@custom:version 0.0.1
+@notice Forwards reward tokens to many gauges from a single contract
+"""
+
+version: public(constant(String[8])) = "0.0.1"
+
+
+from vyper.interfaces import ERC20
+
+
+interface Gauge:
+    def deposit_reward_token(_reward_token: address, _amount: uint256, _epoch: uint256): nonpayable
+
+
+event TransferOwnership:
+    _old_owner: address
+    _new_owner: address
+
+
+struct Route:
+    gauge: address
+    reward_token: address
+
+struct Deposit:
+    gauge: address
+    reward_token: address
+    amount: uint256
+    epoch: uint256
+
+
+MAX_DEPOSITS: constant(uint256) = 64
+
+
+owner: public(address)
+future_owner: public(address)
+
+
+@external
+def __init__(_owner: address):
+    self.owner = _owner
+    log TransferOwnership(empty(address), _owner)
+
+
+@external
+def deposit_reward_tokens(_deposits: DynArray[Deposit, MAX_DEPOSITS]):
+    """
+    @notice Deposit reward tokens held by this contract in gauges
+    @dev This contract should be set as the distributor of each reward token in the
+        gauge, and `allow` called for each route, else the tx will fail.
+    @param _deposits List of gauge, reward token, amount and epoch of each deposit
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    for deposit in _deposits:
+        Gauge(deposit.gauge).deposit_reward_token(deposit.reward_token, deposit.amount, deposit.epoch)
+
+
+@external
+def allow(_routes: DynArray[Route, MAX_DEPOSITS]):
+    """
+    @notice Allow each reward token to be transferred from self to its gauge
+    @dev Restricted to the owner, unlike `RewardForwarder.allow` the spender is
+        not fixed and could otherwise pull the balance of this contract
+    @param _routes List of gauge and reward token pairs
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    for route in _routes:
+        response: Bytes[32] = raw_call(
+            route.reward_token,
+            _abi_encode(route.gauge, max_value(uint256), method_id=method_id("approve(address,uint256)")),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
+
+
+@external
+def recover(_token: ERC20, _amount: uint256, _receiver: address):
+    """
+    @notice Transfer tokens held by this contract
+    @param _token The token to transfer
+    @param _amount The amount of `_token` to transfer
+    @param _receiver The account receiving the tokens
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    assert _token.transfer(_receiver, _amount, default_return_value=True)
+
+
+@external
+def commit_transfer_ownership(_future_owner: address):
+    """
+    @notice Transfer ownership to `_future_owner`
+    @param _future_owner The account to commit as the future owner
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    self.future_owner = _future_owner
+
+
+@external
+def accept_transfer_ownership():
+    """
+    @notice Accept the transfer of ownership
+    @dev Only the committed future owner can call this function
+    """
+    assert msg.sender == self.future_owner  # dev: only future owner
+
+    log TransferOwnership(self.owner, msg.sender)
+    self.owner = msg.sender
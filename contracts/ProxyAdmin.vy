@@ -4,10 +4,10 @@
 @notice Thin proxy allowing shared ownership of contracts
 @author Ben Hauser
 @license MIT
-@custom:version 0.0.1
+@custom:version 0.1.0
 """
 
-version: public(constant(String[8])) = "0.0.1"
+version: public(constant(String[8])) = "0.1.0"
 
 
 event TransactionExecuted:
@@ -35,6 +35,15 @@ event AcceptAdminChange:
     current_admin: address
 
 
+struct Transaction:
+    target: address
+    calldata: Bytes[1024]
+    value: uint256
+
+
+MAX_TRANSACTIONS: constant(uint256) = 64
+
+
 admins: public(address[2])
 
 pending_current_admin: uint256
@@ -66,6 +75,27 @@ def execute(_target: address, _calldata: Bytes[100000]):
     log TransactionExecuted(msg.sender, _target, _calldata, msg.value)
 
 
+@payable
+@external
+def execute_many(_transactions: DynArray[Transaction, MAX_TRANSACTIONS]):
+    """
+    @notice Execute many contract calls in order
+    @dev Atomic, any failing call reverts the whole batch. The values of the calls
+         must sum up to the Ether sent when calling this function
+    @param _transactions List of target, calldata and value of each call
+    """
+    assert msg.sender in self.admins  # dev: only admin
+
+    total_value: uint256 = 0
+    for transaction in _transactions:
+        total_value += transaction.value
+    assert total_value == msg.value  # dev: invalid value
+
+    for transaction in _transactions:
+        raw_call(transaction.target, transaction.calldata, value=transaction.value)
+        log TransactionExecuted(msg.sender, transaction.target, transaction.calldata, transaction.value)
+
+
 @view
 @external
 def get_admin_change_status() -> (address, address, bool):
@@ -3,19 +3,25 @@
 @title Root Liquidity Gauge Factory
 @license MIT
 @author Curve Finance
-@custom:version 1.0.2
+@custom:version 1.1.0
 """
 
-version: public(constant(String[8])) = "1.0.2"
+version: public(constant(String[8])) = "1.1.0"
 
 
 interface Bridger:
     def check(_addr: address) -> bool: view
+    def cost() -> uint256: view
 
 interface RootGauge:
     def bridger() -> Bridger: view
     def initialize(_bridger: Bridger, _chain_id: uint256, _child: address): nonpayable
-    def transmit_emissions(): nonpayable
+    def transmit_emissions() -> bool: nonpayable
+    def user_checkpoint(_user: address) -> bool: nonpayable
+    def pending_emissions() -> uint256: view
+    def child_gauge() -> address: view
+    def is_killed() -> bool: view
+    def chain_id() -> uint256: view
 
 interface CallProxy:
     def anyCall(
@@ -35,6 +41,11 @@ event DeployedGauge:
     _salt: bytes32
     _gauge: RootGauge
 
+event UpdateMinBridgeAmount:
+    _chain_id: indexed(uint256)
+    _old_amount: uint256
+    _new_amount: uint256
+
 event TransferOwnership:
     _old_owner: address
     _new_owner: address
@@ -47,12 +58,63 @@ event UpdateImplementation:
     _old_implementation: address
     _new_implementation: address
 
+event UpdateCloneBlueprint:
+    _old_blueprint: address
+    _new_blueprint: address
+
+event UpdateChildCloneArgs:
+    _chain_id: indexed(uint256)
+    _clone_args: bool
+
+
+struct GaugeParams:
+    chain_id: uint256
+    salt: bytes32
+    value: uint256
+
+struct GaugeSalt:
+    chain_id: uint256
+    salt: bytes32
+
+struct GaugeAddresses:
+    root: address
+    child: address
+
+struct GaugeInfo:
+    gauge: RootGauge
+    child_gauge: address
+    is_killed: bool
+
+struct ChildGaugeParams:
+    chain_id: uint256
+    lp_token: address
+    salt: bytes32
+    manager: address
+    value: uint256
+
+
+MAX_TRANSMIT: constant(uint256) = 64
+MAX_CHECKPOINT: constant(uint256) = 128
+MAX_DEPLOY: constant(uint256) = 32
+MAX_PREDICT: constant(uint256) = 512
+MAX_PAGE: constant(uint256) = 256
+# ERC-5202 blueprint holding the clone initcode of `_gauge_codehash`, preceded by the 0xfe7100 preamble
+CLONE_BLUEPRINT_CODEHASH: constant(bytes32) = 0x3cfea834fb129f2bf0bfccf41647e488b1c99e904a878608968901da32848088
+
 
 call_proxy: public(CallProxy)
 get_bridger: public(HashMap[uint256, Bridger])
 get_child_factory: public(HashMap[uint256, address])
 get_child_implementation: public(HashMap[uint256, address])
+get_child_clone_args: public(HashMap[uint256, bool])
+# initcode hashes, updated with the implementation and the deployment mode
+get_child_codehash: public(HashMap[uint256, bytes32])
+gauge_codehash: public(bytes32)
 get_implementation: public(address)
+# gauges are deployed as immutable-args clones from this blueprint, or minimal proxies if unset
+clone_blueprint: public(address)
+next_clone_chain_id: uint256
+min_bridge_amount: public(HashMap[uint256, uint256])
 
 get_gauge: public(HashMap[uint256, RootGauge[max_value(uint256)]])
 get_gauge_count: public(HashMap[uint256, uint256])
@@ -71,6 +133,36 @@ def __init__(_call_proxy: CallProxy, _owner: address):
     log TransferOwnership(empty(address), _owner)
 
 
+@internal
+def _transmit_emissions(_gauge: RootGauge):
+    # in most cases this will return True
+    # for special bridges *cough cough Multichain, we can only do
+    # one bridge per tx, therefore this will verify msg.sender in [tx.origin, self.call_proxy]
+    assert _gauge.bridger().check(msg.sender)
+    _gauge.transmit_emissions()
+
+
+@view
+@internal
+def _will_bridge(_gauge: RootGauge) -> bool:
+    """
+    @notice Check whether `transmit_emissions` of `_gauge` would bridge now
+    @dev False for older implementations without `pending_emissions`
+    """
+    success: bool = False
+    response: Bytes[32] = b""
+    success, response = raw_call(
+        _gauge.address,
+        method_id("pending_emissions()"),
+        max_outsize=32,
+        is_static_call=True,
+        revert_on_failure=False
+    )
+    if not success or len(response) == 0:
+        return False
+    return convert(response, uint256) >= max(self.min_bridge_amount[_gauge.chain_id()], 1)
+
+
 @external
 def transmit_emissions(_gauge: RootGauge):
     """
@@ -79,30 +171,286 @@ def transmit_emissions(_gauge: RootGauge):
         The way that gauges work, this can also be called on the root
         chain without a request.
     """
-    # in most cases this will return True
-    # for special bridges *cough cough Multichain, we can only do
-    # one bridge per tx, therefore this will verify msg.sender in [tx.origin, self.call_proxy]
-    assert _gauge.bridger().check(msg.sender)
-    _gauge.transmit_emissions()
+    self._transmit_emissions(_gauge)
+
+
+@payable
+@external
+def transmit_emissions_many(_gauges: DynArray[RootGauge, MAX_TRANSMIT]) -> DynArray[bool, MAX_TRANSMIT]:
+    """
+    @notice Call `transmit_emissions` on multiple root gauges
+    @dev Entrypoint for keepers and the batched emission requests of child factories.
+        Invalid gauges, gauges failing the bridger check or with nothing to transmit are
+        skipped, gauges holding less than the minimum bridge amount of their chain report False.
+        Bridgers rejecting this contract in `check` handle a single transfer per tx,
+        only the first gauge transmitting through each of them is bridged.
+        `msg.value` tops up gauges holding less than the cost of their bridger, only in full
+        and once they hold enough to bridge. Whatever is left is refunded to the caller.
+    @param _gauges List of root gauges
+    @return Whether emissions were transmitted, for each gauge
+    """
+    value: uint256 = msg.value
+    transmitted: DynArray[bool, MAX_TRANSMIT] = []
+    # bridgers which already bridged in this call and cannot bridge again
+    restricted: DynArray[Bridger, MAX_TRANSMIT] = []
+
+    for gauge in _gauges:
+        if not self.is_valid_gauge[gauge]:
+            transmitted.append(False)
+            continue
+        bridger: Bridger = gauge.bridger()
+        if bridger in restricted or not bridger.check(msg.sender):
+            transmitted.append(False)
+            continue
+
+        cost: uint256 = bridger.cost()
+        # a top up stays in the gauge, only send it to gauges which will bridge
+        if cost > gauge.address.balance and value >= cost - gauge.address.balance and self._will_bridge(gauge):
+            top_up: uint256 = cost - gauge.address.balance
+            raw_call(gauge.address, b"", value=top_up)
+            value -= top_up
+
+        success: bool = False
+        response: Bytes[32] = b""
+        success, response = raw_call(
+            gauge.address,
+            method_id("transmit_emissions()"),
+            max_outsize=32,
+            revert_on_failure=False
+        )
+        # older implementations return nothing and always bridge
+        if success and len(response) != 0:
+            success = convert(response, uint256) != 0
+        if success and not bridger.check(self):
+            restricted.append(bridger)
+        transmitted.append(success)
+
+    if value != 0:
+        raw_call(msg.sender, b"", value=value)
+    return transmitted
+
+
+@external
+def checkpoint_chain(_chain_id: uint256, _start: uint256, _count: uint256):
+    """
+    @notice Checkpoint a page of the root gauges deployed for `_chain_id`
+    @dev Gauges of a chain checkpointed together share the gauge controller's total
+        weight and the CRV inflation reads, only the first gauge pays for them cold
+    @param _chain_id The chain identifier of the gauges
+    @param _start Index of the first gauge to checkpoint
+    @param _count Number of gauges to checkpoint, at most 128
+    """
+    end: uint256 = min(_start + _count, self.get_gauge_count[_chain_id])
+    for i in range(_start, _start + MAX_CHECKPOINT):
+        if i >= end:
+            break
+        self.get_gauge[_chain_id][i].user_checkpoint(empty(address))
+
+
+@external
+def checkpoint_many(_gauges: DynArray[RootGauge, MAX_CHECKPOINT]):
+    """
+    @notice Checkpoint multiple root gauges, updating their total emissions without bridging
+    @param _gauges List of root gauges
+    """
+    for gauge in _gauges:
+        gauge.user_checkpoint(empty(address))
+
+
+@view
+@external
+def pending_emissions(_chain_id: uint256, _start: uint256, _count: uint256) -> DynArray[uint256, MAX_CHECKPOINT]:
+    """
+    @notice Query the amount of CRV each root gauge of `_chain_id` would bridge now
+    @param _chain_id The chain identifier of the gauges
+    @param _start Index of the first gauge to query
+    @param _count Number of gauges to query, at most 128
+    @return Pending emissions, in the order of `get_gauge`
+    """
+    pending: DynArray[uint256, MAX_CHECKPOINT] = []
+    end: uint256 = min(_start + _count, self.get_gauge_count[_chain_id])
+    for i in range(_start, _start + MAX_CHECKPOINT):
+        if i >= end:
+            break
+        pending.append(self.get_gauge[_chain_id][i].pending_emissions())
+    return pending
+
 
+@view
+@external
+def bridge_shortfall(_chain_id: uint256, _start: uint256, _count: uint256) -> DynArray[uint256, MAX_CHECKPOINT]:
+    """
+    @notice Query how much CRV each root gauge of `_chain_id` lacks to reach the minimum bridge amount
+    @param _chain_id The chain identifier of the gauges
+    @param _start Index of the first gauge to query
+    @param _count Number of gauges to query, at most 128
+    @return Missing amount of CRV, 0 for gauges ready to bridge, in the order of `get_gauge`
+    """
+    min_amount: uint256 = self.min_bridge_amount[_chain_id]
+    shortfall: DynArray[uint256, MAX_CHECKPOINT] = []
+    end: uint256 = min(_start + _count, self.get_gauge_count[_chain_id])
+    for i in range(_start, _start + MAX_CHECKPOINT):
+        if i >= end:
+            break
+        pending: uint256 = self.get_gauge[_chain_id][i].pending_emissions()
+        shortfall.append(min_amount - min(pending, min_amount))
+    return shortfall
+
+
+@view
+@external
+def get_gauges(_chain_id: uint256, _start: uint256, _count: uint256) -> DynArray[GaugeInfo, MAX_PAGE]:
+    """
+    @notice Query a page of the root gauges deployed for `_chain_id`
+    @param _chain_id The chain identifier of the gauges
+    @param _start Index of the first gauge to query
+    @param _count Number of gauges to query, at most 256
+    @return List of gauge, child gauge and kill status, in the order of `get_gauge`
+    """
+    gauges: DynArray[GaugeInfo, MAX_PAGE] = []
+    end: uint256 = min(_start + _count, self.get_gauge_count[_chain_id])
+    for i in range(_start, _start + MAX_PAGE):
+        if i >= end:
+            break
+        gauge: RootGauge = self.get_gauge[_chain_id][i]
+        gauges.append(GaugeInfo({gauge: gauge, child_gauge: gauge.child_gauge(), is_killed: gauge.is_killed()}))
+    return gauges
+
+
+@view
+@external
+def predict_gauges(_salts: DynArray[GaugeSalt, MAX_PREDICT]) -> DynArray[GaugeAddresses, MAX_PREDICT]:
+    """
+    @notice Predict the addresses of the root and child gauges deployed with each salt
+    @dev Reverts for chains without a child factory and implementation set
+    @param _salts List of chain identifier and salt passed to `deploy_gauge`
+    @return List of root and child gauge addresses
+    """
+    codehash: bytes32 = self.gauge_codehash
+    chain_id: uint256 = 0
+    child_factory: address = empty(address)
+    child_codehash: bytes32 = empty(bytes32)
+
+    addresses: DynArray[GaugeAddresses, MAX_PREDICT] = []
+    for gauge_salt in _salts:
+        if child_factory == empty(address) or gauge_salt.chain_id != chain_id:
+            chain_id = gauge_salt.chain_id
+            child_factory, child_codehash = self._child_codehash(chain_id)
+
+        salt: bytes32 = keccak256(_abi_encode(chain_id, gauge_salt.salt))
+        addresses.append(GaugeAddresses({
+            root: self._create2_address(self, salt, codehash),
+            child: self._create2_address(child_factory, salt, child_codehash),
+        }))
+    return addresses
+
+
+@view
+@external
+def clone_args() -> (address, uint256):
+    """
+    @notice Immutable args of the gauge being deployed, read by the clone initcode
+    """
+    return self, self.next_clone_chain_id
 
+
+@pure
+@internal
+def _gauge_codehash(_implementation: address, _clone_args: bool) -> bytes32:
+    """
+    @notice Hash of the initcode deploying a gauge of `_implementation`
+    @dev Immutable-args clones fetch their args from `clone_args` of the deployer, and
+        return the EIP-1167 runtime with the args appended, so the hash is independent of them
+    """
+    if _clone_args:
+        return keccak256(
+            concat(
+                0x63a51db7ff60e01b6000526000600060046000335afa15605757,  # staticcall(gas, caller, clone_args())
+                0x69363d3d373d3d3d363d7360b01b600052,  # mstore(0x00, EIP-1167 runtime[0:10])
+                0x6e5af43d82803e903d91602b57fd5bf360881b601e52,  # mstore(0x1e, EIP-1167 runtime[30:45])
+                0x601460143803600a393d6000602d3e3d602d016000f35b600080fd,  # copy implementation and args, return
+                convert(_implementation, bytes20),
+            )
+        )
+    return keccak256(
+        concat(0x602d3d8160093d39f3363d3d373d3d3d363d73, convert(_implementation, bytes20), 0x5af43d82803e903d91602b57fd5bf3))
+
+
+@view
 @internal
-def _get_child(_chain_id: uint256, salt: bytes32) -> address:
+def _child_codehash(_chain_id: uint256) -> (address, bytes32):
     """
     @dev zkSync address derivation is ignored, so need to set child address through a vote manually
+    @return The child factory and the codehash of its gauges
     """
     child_factory: address = self.get_child_factory[_chain_id]
-    child_impl: bytes20 = convert(self.get_child_implementation[_chain_id], bytes20)
+    child_codehash: bytes32 = self.get_child_codehash[_chain_id]
 
     assert child_factory != empty(address)  # dev: child factory not set
-    assert child_impl != empty(bytes20)  # dev: child implementation not set
+    assert child_codehash != empty(bytes32)  # dev: child implementation not set
 
-    gauge_codehash: bytes32 = keccak256(
-        concat(0x602d3d8160093d39f3363d3d373d3d3d363d73, child_impl, 0x5af43d82803e903d91602b57fd5bf3))
-    digest: bytes32 = keccak256(concat(0xFF, convert(child_factory, bytes20), salt, gauge_codehash))
+    return child_factory, child_codehash
+
+
+@internal
+def _set_child_codehash(_chain_id: uint256, _child_impl: address, _clone_args: bool):
+    child_codehash: bytes32 = empty(bytes32)
+    if _child_impl != empty(address):
+        child_codehash = self._gauge_codehash(_child_impl, _clone_args)
+    self.get_child_codehash[_chain_id] = child_codehash
+
+
+@pure
+@internal
+def _create2_address(_deployer: address, _salt: bytes32, _codehash: bytes32) -> address:
+    digest: bytes32 = keccak256(concat(0xFF, convert(_deployer, bytes20), _salt, _codehash))
     return convert(convert(digest, uint256) & convert(max_value(uint160), uint256), address)
 
 
+@internal
+def _deploy_gauge(
+    _chain_id: uint256,
+    _salt: bytes32,
+    _value: uint256,
+    _bridger: Bridger,
+    _child_factory: address,
+    _child_codehash: bytes32,
+) -> RootGauge:
+    implementation: address = self.get_implementation
+    salt: bytes32 = keccak256(_abi_encode(_chain_id, _salt))
+    gauge: RootGauge = empty(RootGauge)
+    blueprint: address = self.clone_blueprint
+    if blueprint == empty(address):
+        gauge = RootGauge(create_minimal_proxy_to(
+            implementation,
+            value=_value,
+            salt=salt,
+        ))
+    else:
+        # read back by the initcode through `clone_args`
+        self.next_clone_chain_id = _chain_id
+        gauge = RootGauge(create_from_blueprint(
+            blueprint,
+            slice(convert(implementation, bytes32), 12, 20),
+            raw_args=True,
+            value=_value,
+            code_offset=3,
+            salt=salt,
+        ))
+        self.next_clone_chain_id = 0
+    child: address = self._create2_address(_child_factory, salt, _child_codehash)
+
+    idx: uint256 = self.get_gauge_count[_chain_id]
+    self.get_gauge[_chain_id][idx] = gauge
+    self.get_gauge_count[_chain_id] = idx + 1
+    self.is_valid_gauge[gauge] = True
+
+    gauge.initialize(_bridger, _chain_id, child)
+
+    log DeployedGauge(implementation, _chain_id, msg.sender, _salt, gauge)
+    return gauge
+
+
 @payable
 @external
 def deploy_gauge(_chain_id: uint256, _salt: bytes32) -> RootGauge:
@@ -114,28 +462,44 @@ def deploy_gauge(_chain_id: uint256, _salt: bytes32) -> RootGauge:
     bridger: Bridger = self.get_bridger[_chain_id]
     assert bridger != empty(Bridger)  # dev: chain id not supported
 
-    implementation: address = self.get_implementation
-    salt: bytes32 = keccak256(_abi_encode(_chain_id, _salt))
-    gauge: RootGauge = RootGauge(create_minimal_proxy_to(
-        implementation,
-        value=msg.value,
-        salt=salt,
-    ))
-    child: address = self._get_child(_chain_id, salt)
+    child_factory: address = empty(address)
+    child_codehash: bytes32 = empty(bytes32)
+    child_factory, child_codehash = self._child_codehash(_chain_id)
+    return self._deploy_gauge(_chain_id, _salt, msg.value, bridger, child_factory, child_codehash)
 
-    idx: uint256 = self.get_gauge_count[_chain_id]
-    self.get_gauge[_chain_id][idx] = gauge
-    self.get_gauge_count[_chain_id] = idx + 1
-    self.is_valid_gauge[gauge] = True
 
-    gauge.initialize(bridger, _chain_id, child)
+@payable
+@external
+def deploy_gauges(_params: DynArray[GaugeParams, MAX_DEPLOY]) -> DynArray[RootGauge, MAX_DEPLOY]:
+    """
+    @notice Deploy multiple root liquidity gauges
+    @dev The child factory and codehash are read once for consecutive gauges of the same chain
+    @param _params List of chain identifier, salt and ETH sent along to each gauge
+    @return The deployed gauges
+    """
+    gauges: DynArray[RootGauge, MAX_DEPLOY] = []
+    chain_id: uint256 = 0
+    bridger: Bridger = empty(Bridger)
+    child_factory: address = empty(address)
+    child_codehash: bytes32 = empty(bytes32)
+    total_value: uint256 = 0
+
+    for params in _params:
+        if bridger == empty(Bridger) or params.chain_id != chain_id:
+            chain_id = params.chain_id
+            bridger = self.get_bridger[chain_id]
+            assert bridger != empty(Bridger)  # dev: chain id not supported
+            child_factory, child_codehash = self._child_codehash(chain_id)
 
-    log DeployedGauge(implementation, _chain_id, msg.sender, _salt, gauge)
-    return gauge
+        gauges.append(self._deploy_gauge(chain_id, params.salt, params.value, bridger, child_factory, child_codehash))
+        total_value += params.value
 
+    assert total_value == msg.value  # dev: invalid value
+    return gauges
 
-@external
-def deploy_child_gauge(_chain_id: uint256, _lp_token: address, _salt: bytes32, _manager: address = msg.sender):
+
+@internal
+def _deploy_child_gauge(_chain_id: uint256, _lp_token: address, _salt: bytes32, _manager: address):
     bridger: Bridger = self.get_bridger[_chain_id]
     assert bridger != empty(Bridger)  # dev: chain id not supported
 
@@ -152,6 +516,37 @@ def deploy_child_gauge(_chain_id: uint256, _lp_token: address, _salt: bytes32, _
     )
 
 
+@external
+def deploy_child_gauge(_chain_id: uint256, _lp_token: address, _salt: bytes32, _manager: address = msg.sender):
+    self._deploy_child_gauge(_chain_id, _lp_token, _salt, _manager)
+
+
+@payable
+@external
+def deploy_child_gauges(_params: DynArray[ChildGaugeParams, MAX_DEPLOY]) -> DynArray[address, MAX_DEPLOY]:
+    """
+    @notice Deploy multiple child liquidity gauges, and their root gauges through the call proxy
+    @dev ETH is sent to the root gauge ahead of its deployment, e.g. to pay for bridging to Arbitrum
+    @param _params List of chain identifier, LP token, salt, manager and ETH sent to the root gauge
+    @return The addresses the root gauges will be deployed at
+    """
+    codehash: bytes32 = self.gauge_codehash
+    roots: DynArray[address, MAX_DEPLOY] = []
+    total_value: uint256 = 0
+
+    for params in _params:
+        self._deploy_child_gauge(params.chain_id, params.lp_token, params.salt, params.manager)
+
+        root: address = self._create2_address(self, keccak256(_abi_encode(params.chain_id, params.salt)), codehash)
+        if params.value != 0:
+            send(root, params.value)
+            total_value += params.value
+        roots.append(root)
+
+    assert total_value == msg.value  # dev: invalid value
+    return roots
+
+
 @external
 def set_child(_chain_id: uint256, _bridger: Bridger, _child_factory: address, _child_impl: address):
     """
@@ -167,6 +562,21 @@ def set_child(_chain_id: uint256, _bridger: Bridger, _child_factory: address, _c
     self.get_bridger[_chain_id] = _bridger
     self.get_child_factory[_chain_id] = _child_factory
     self.get_child_implementation[_chain_id] = _child_impl
+    self._set_child_codehash(_chain_id, _child_impl, self.get_child_clone_args[_chain_id])
+
+
+@external
+def set_min_bridge_amount(_chain_id: uint256, _amount: uint256):
+    """
+    @notice Set the minimum amount of CRV root gauges of `_chain_id` bridge at once
+    @dev Gauges hold their emissions until reaching it, saving the bridging cost of dust
+    @param _chain_id The chain identifier to set the minimum for
+    @param _amount The minimum amount of CRV, 0 to bridge any amount
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    log UpdateMinBridgeAmount(_chain_id, self.min_bridge_amount[_chain_id], _amount)
+    self.min_bridge_amount[_chain_id] = _amount
 
 
 @external
@@ -180,6 +590,38 @@ def set_implementation(_implementation: address):
 
     log UpdateImplementation(self.get_implementation, _implementation)
     self.get_implementation = _implementation
+    self.gauge_codehash = self._gauge_codehash(_implementation, self.clone_blueprint != empty(address))
+
+
+@external
+def set_clone_blueprint(_blueprint: address):
+    """
+    @notice Deploy gauges as immutable-args clones, or minimal proxies if `_blueprint` is empty
+    @dev Clones read their factory and chain id from code instead of storage. Changing the
+        deployment mode require change on all child factories
+    @param _blueprint The ERC-5202 blueprint of the clone initcode
+    """
+    assert msg.sender == self.owner  # dev: only owner
+    assert _blueprint == empty(address) or _blueprint.codehash == CLONE_BLUEPRINT_CODEHASH  # dev: invalid blueprint
+
+    log UpdateCloneBlueprint(self.clone_blueprint, _blueprint)
+    self.clone_blueprint = _blueprint
+    self.gauge_codehash = self._gauge_codehash(self.get_implementation, _blueprint != empty(address))
+
+
+@external
+def set_child_clone_args(_chain_id: uint256, _clone_args: bool):
+    """
+    @notice Set whether child gauges of `_chain_id` are deployed as immutable-args clones
+    @dev Needed in child gauge address derivation
+    @param _chain_id The chain identifier of the child factory
+    @param _clone_args True if the child factory has a clone blueprint set
+    """
+    assert msg.sender == self.owner  # dev: only owner
+
+    self.get_child_clone_args[_chain_id] = _clone_args
+    self._set_child_codehash(_chain_id, self.get_child_implementation[_chain_id], _clone_args)
+    log UpdateChildCloneArgs(_chain_id, _clone_args)
 
 
 @external
@@ -3,10 +3,10 @@
 @title Root Gauge Factory Proxy Owner
 @license MIT
 @author CurveFi
-@custom:version 1.0.1
+@custom:version 1.1.0
 """
 
-version: public(constant(String[8])) = "1.0.1"
+version: public(constant(String[8])) = "1.1.0"
 
 
 interface Factory:
@@ -16,6 +16,9 @@ interface Factory:
     def set_bridger(_chain_id: uint256, _bridger: address): nonpayable
     def set_call_proxy(_new_call_proxy: address): nonpayable
     def set_implementation(_implementation: address): nonpayable
+    def set_min_bridge_amount(_chain_id: uint256, _amount: uint256): nonpayable
+    def set_clone_blueprint(_blueprint: address): nonpayable
+    def set_child_clone_args(_chain_id: uint256, _clone_args: bool): nonpayable
 
 interface LiquidityGauge:
     def set_killed(_killed: bool): nonpayable
@@ -34,6 +37,9 @@ event SetManager:
     _manager: indexed(address)
 
 
+MAX_GAUGES: constant(uint256) = 64
+
+
 ownership_admin: public(address)
 emergency_admin: public(address)
 
@@ -125,6 +131,23 @@ def set_child_gauge(_root: LiquidityGauge, _child: address):
     _root.set_child_gauge(_child)
 
 
+@external
+def set_child_gauge_many(_roots: DynArray[LiquidityGauge, MAX_GAUGES], _children: DynArray[address, MAX_GAUGES]):
+    """
+    @notice Set the child gauge addresses of many root gauges
+    @dev Atomic, any failing gauge reverts the whole batch
+    @param _roots Root gauge addresses
+    @param _children Child gauge addresses, one for each root gauge
+    """
+    assert msg.sender == self.ownership_admin, "Access denied"
+    assert len(_roots) == len(_children)  # dev: length mismatch
+
+    for i in range(MAX_GAUGES):
+        if i == len(_roots):
+            break
+        _roots[i].set_child_gauge(_children[i])
+
+
 @external
 def set_killed(_gauge: LiquidityGauge, _is_killed: bool):
     """
@@ -138,6 +161,20 @@ def set_killed(_gauge: LiquidityGauge, _is_killed: bool):
     _gauge.set_killed(_is_killed)
 
 
+@external
+def set_killed_many(_gauges: DynArray[LiquidityGauge, MAX_GAUGES], _is_killed: bool):
+    """
+    @notice Set the killed status for many gauges
+    @dev Atomic, any failing gauge reverts the whole batch
+    @param _gauges Gauge addresses
+    @param _is_killed Killed status to set
+    """
+    assert msg.sender in [self.ownership_admin, self.emergency_admin], "Access denied"
+
+    for gauge in _gauges:
+        gauge.set_killed(_is_killed)
+
+
 @external
 def set_child(_factory: Factory, _chain_id: uint256, _bridger: address, _child_factory: address, _child_impl: address):
     """
@@ -176,3 +213,33 @@ def set_call_proxy(_factory: Factory, _new_call_proxy: address):
     assert msg.sender in [self.ownership_admin, self.manager]
 
     _factory.set_call_proxy(_new_call_proxy)
+
+
+@external
+def set_min_bridge_amount(_factory: Factory, _chain_id: uint256, _amount: uint256):
+    """
+    @notice Set the minimum amount of CRV bridged at once for `_chain_id` on `_factory`
+    """
+    assert msg.sender in [self.ownership_admin, self.manager]
+
+    _factory.set_min_bridge_amount(_chain_id, _amount)
+
+
+@external
+def set_clone_blueprint(_factory: Factory, _blueprint: address):
+    """
+    @notice Set the clone blueprint used by `_factory`
+    """
+    assert msg.sender in [self.ownership_admin, self.manager]
+
+    _factory.set_clone_blueprint(_blueprint)
+
+
+@external
+def set_child_clone_args(_factory: Factory, _chain_id: uint256, _clone_args: bool):
+    """
+    @notice Set whether child gauges of `_chain_id` are immutable-args clones on `_factory`
+    """
+    assert msg.sender in [self.ownership_admin, self.manager]
+
+    _factory.set_child_clone_args(_chain_id, _clone_args)
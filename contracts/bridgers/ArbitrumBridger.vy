@@ -1,14 +1,26 @@
 # @version 0.3.1
 """
 @notice Curve Arbitrum Bridge Wrapper
+@dev The retryable ticket submission cost is quoted on every bridge from the L1 basefee
+    and the size of the gateway calldata, with the formula of the Arbitrum Inbox
 """
 from vyper.interfaces import ERC20
 
 
+interface Gateway:
+    def getOutboundCalldata(
+        _token: address,
+        _from: address,
+        _to: address,
+        _amount: uint256,
+        _data: Bytes[128],
+    ) -> Bytes[2048]: view
+
 interface GatewayRouter:
     def getGateway(_token: address) -> address: view
-    def outboundTransfer(  # emits DepositInitiated event with Inbox sequence #
+    def outboundTransferCustomRefund(  # emits DepositInitiated event with Inbox sequence #
         _token: address,
+        _refund_to: address,
         _to: address,
         _amount: uint256,
         _max_gas: uint256,
@@ -25,35 +37,76 @@ event UpdateSubmissionData:
     _old_submission_data: uint256[3]
     _new_submission_data: uint256[3]
 
+event UpdateRefund:
+    _old_refund: address
+    _new_refund: address
 
-CRV20: constant(address) = 0xD533a949740bb3306d119CC777fa900bA034cd52
-GATEWAY: constant(address) = 0xa3A7B6F88361F48403514059F1F16C8E78d60EeC
-GATEWAY_ROUTER: constant(address) = 0x72Ce9c846789fdB6fC1f34aC4AD25Dd9ef7031ef
 
+MARGIN_PRECISION: constant(uint256) = 10000
 
-# [gas_limit uint64][gas_price uint64][max_submission_cost uint64]
+CRV20: immutable(address)
+GATEWAY: immutable(address)
+GATEWAY_ROUTER: immutable(address)
+
+
+# [gas_limit uint64][gas_price uint64][submission_margin uint64]
 submission_data: uint256
 is_approved: public(HashMap[address, bool])
+refund: public(address)
 
 owner: public(address)
 future_owner: public(address)
 
 
 @external
-def __init__(_gas_limit: uint256, _gas_price: uint256, _max_submission_cost: uint256):
-    for value in [_gas_limit, _gas_price, _max_submission_cost]:
+def __init__(
+    _crv: address,
+    _gateway_router: address,
+    _gas_limit: uint256,
+    _gas_price: uint256,
+    _submission_margin: uint256,
+    _refund: address,
+):
+    """
+    @param _crv The CRV token
+    @param _gateway_router The L1 gateway router of Arbitrum
+    @param _gas_limit The gas limit for the retryable ticket tx
+    @param _gas_price The gas price for the retryable ticket tx
+    @param _submission_margin Multiplier of the quoted submission cost, in basis points
+    @param _refund The L2 account receiving the excess fees, usually `ArbitrumRefund`
+    """
+    for value in [_gas_limit, _gas_price, _submission_margin]:
         assert value < 2 ** 64
+    assert _submission_margin >= MARGIN_PRECISION
+
+    self.submission_data = shift(_gas_limit, 128) + shift(_gas_price, 64) + _submission_margin
+    log UpdateSubmissionData([0, 0, 0], [_gas_limit, _gas_price, _submission_margin])
+
+    self.refund = _refund
+    log UpdateRefund(ZERO_ADDRESS, _refund)
 
-    self.submission_data = shift(_gas_limit, 128) + shift(_gas_price, 64) + _max_submission_cost
-    log UpdateSubmissionData([0, 0, 0], [_gas_limit, _gas_price, _max_submission_cost])
+    gateway: address = GatewayRouter(_gateway_router).getGateway(_crv)
+    assert ERC20(_crv).approve(gateway, MAX_UINT256)
+    self.is_approved[_crv] = True
 
-    assert ERC20(CRV20).approve(GATEWAY, MAX_UINT256)
-    self.is_approved[CRV20] = True
+    CRV20 = _crv
+    GATEWAY = gateway
+    GATEWAY_ROUTER = _gateway_router
 
     self.owner = msg.sender
     log TransferOwnership(ZERO_ADDRESS, msg.sender)
 
 
+@view
+@internal
+def _submission_cost(
+    _gateway: address, _token: address, _to: address, _amount: uint256, _margin: uint256
+) -> uint256:
+    # Inbox.calculateRetryableSubmissionFee: (1400 + 6 * calldata length) * basefee
+    data_length: uint256 = len(Gateway(_gateway).getOutboundCalldata(_token, self, _to, _amount, b""))
+    return (1400 + 6 * data_length) * block.basefee * _margin / MARGIN_PRECISION
+
+
 @payable
 @external
 def bridge(_token: address, _to: address, _amount: uint256):
@@ -65,26 +118,30 @@ def bridge(_token: address, _to: address, _amount: uint256):
     """
     assert ERC20(_token).transferFrom(msg.sender, self, _amount)
 
-    if _token != CRV20 and not self.is_approved[_token]:
-        assert ERC20(_token).approve(GatewayRouter(GATEWAY_ROUTER).getGateway(_token), MAX_UINT256)
-        self.is_approved[_token] = True
+    gateway: address = GATEWAY
+    if _token != CRV20:
+        gateway = GatewayRouter(GATEWAY_ROUTER).getGateway(_token)
+        if not self.is_approved[_token]:
+            assert ERC20(_token).approve(gateway, MAX_UINT256)
+            self.is_approved[_token] = True
 
     data: uint256 = self.submission_data
     gas_limit: uint256 = shift(data, -128)
     gas_price: uint256 = shift(data, -64) % 2 ** 64
-    max_submission_cost: uint256 = data % 2 ** 64
+    max_submission_cost: uint256 = self._submission_cost(gateway, _token, _to, _amount, data % 2 ** 64)
 
-    # NOTE: Excess ETH fee is refunded to this bridger's address on L2.
+    # NOTE: Excess ETH fee is refunded to `self.refund` on L2.
     # After bridging, the token should arrive on Arbitrum within 10 minutes. If it
     # does not, the L2 transaction may have failed due to an insufficient amount
-    # within `max_submission_cost + (gas_limit * gas_price)`
+    # within `gas_limit * gas_price`
     # In this case, the transaction can be manually broadcasted on Arbitrum by calling
     # `ArbRetryableTicket(0x000000000000000000000000000000000000006e).redeem(redemption-TxID)`
     # The calldata for this manual transaction is easily obtained by finding the reverted
     # transaction in the tx history for 0x000000000000000000000000000000000000006e on Arbiscan.
     # https://developer.offchainlabs.com/docs/l1_l2_messages#retryable-transaction-lifecycle
-    GatewayRouter(GATEWAY_ROUTER).outboundTransfer(
+    GatewayRouter(GATEWAY_ROUTER).outboundTransferCustomRefund(
         _token,
+        self.refund,
         _to,
         _amount,
         gas_limit,
@@ -98,11 +155,13 @@ def bridge(_token: address, _to: address, _amount: uint256):
 @external
 def cost() -> uint256:
     """
-    @notice Cost in ETH to bridge
+    @notice Cost in ETH to bridge CRV in the current block
     """
     data: uint256 = self.submission_data
     # gas_limit * gas_price + max_submission_cost
-    return shift(data, -128) * (shift(data, -64) % 2 ** 64) + data % 2 ** 64
+    return shift(data, -128) * (shift(data, -64) % 2 ** 64) + self._submission_cost(
+        GATEWAY, CRV20, ZERO_ADDRESS, 0, data % 2 ** 64
+    )
 
 
 @pure
@@ -116,26 +175,40 @@ def check(_account: address) -> bool:
 
 
 @external
-def set_submission_data(_gas_limit: uint256, _gas_price: uint256, _max_submission_cost: uint256):
+def set_submission_data(_gas_limit: uint256, _gas_price: uint256, _submission_margin: uint256):
     """
     @notice Update the arb retryable ticket submission data
     @param _gas_limit The gas limit for the retryable ticket tx
     @param _gas_price The gas price for the retryable ticket tx
-    @param _max_submission_cost The max submission cost for the retryable ticket
+    @param _submission_margin Multiplier of the quoted submission cost, in basis points
     """
     assert msg.sender == self.owner
 
-    for value in [_gas_limit, _gas_price, _max_submission_cost]:
+    for value in [_gas_limit, _gas_price, _submission_margin]:
         assert value < 2 ** 64
+    assert _submission_margin >= MARGIN_PRECISION
 
     data: uint256 = self.submission_data
-    self.submission_data = shift(_gas_limit, 128) + shift(_gas_price, 64) + _max_submission_cost
+    self.submission_data = shift(_gas_limit, 128) + shift(_gas_price, 64) + _submission_margin
     log UpdateSubmissionData(
         [shift(data, -128), shift(data, -64) % 2 ** 64, data % 2 ** 64],
-        [_gas_limit, _gas_price, _max_submission_cost]
+        [_gas_limit, _gas_price, _submission_margin]
     )
 
 
+@external
+def set_refund(_refund: address):
+    """
+    @notice Set the L2 account receiving the excess fees of retryable tickets
+    @dev Contracts on L1 are aliased by the Inbox, use the address of `ArbitrumRefund` on L2
+    @param _refund The refund account
+    """
+    assert msg.sender == self.owner
+
+    log UpdateRefund(self.refund, _refund)
+    self.refund = _refund
+
+
 @external
 def commit_transfer_ownership(_future_owner: address):
     """
@@ -179,8 +252,17 @@ def gas_price() -> uint256:
 
 @view
 @external
-def max_submission_cost() -> uint256:
+def submission_margin() -> uint256:
     """
-    @notice Get max submission cost for L2 retryable ticket
+    @notice Get multiplier of the quoted submission cost, in basis points
     """
     return self.submission_data % 2 ** 64
+
+
+@view
+@external
+def max_submission_cost() -> uint256:
+    """
+    @notice Get max submission cost for a CRV retryable ticket in the current block
+    """
+    return self._submission_cost(GATEWAY, CRV20, ZERO_ADDRESS, 0, self.submission_data % 2 ** 64)
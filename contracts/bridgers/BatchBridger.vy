@@ -0,0 +1,161 @@
+# @version 0.3.10
+"""
+@title Curve Batch Bridge Wrapper
+@notice Collects the emissions of many root gauges and bridges them in a single transfer
+@dev Set as the bridger of a chain in the root factory. The CRV of every `bridge` call
+    is held until `flush`, which bridges the total to the child `EmissionsDistributor`
+    through the underlying bridger, and sends the split across gauges with anyCall.
+"""
+from vyper.interfaces import ERC20
+
+
+interface Bridger:
+    def bridge(_token: ERC20, _to: address, _amount: uint256): payable
+    def cost() -> uint256: view
+
+interface Factory:
+    def is_valid_gauge(_gauge: address) -> bool: view
+
+interface CallProxy:
+    def anyCall(
+        _to: address, _data: Bytes[1024], _fallback: address, _to_chain_id: uint256
+    ): nonpayable
+
+
+event Flush:
+    _amount: uint256
+    _count: uint256
+
+
+# largest list of emissions whose `receive_emissions` calldata fits in 1024 bytes
+MAX_PENDING: constant(uint256) = 29
+# emissions keep queueing while this contract lacks the ETH to flush
+MAX_QUEUE: constant(uint256) = 4 * MAX_PENDING
+
+CRV: public(immutable(ERC20))
+FACTORY: public(immutable(Factory))
+BRIDGER: public(immutable(Bridger))
+CALL_PROXY: public(immutable(CallProxy))
+DISTRIBUTOR: public(immutable(address))
+CHAIN_ID: public(immutable(uint256))
+
+# [uint96 amount][address child gauge] * MAX_QUEUE
+pending: public(DynArray[uint256, MAX_QUEUE])
+
+
+@external
+def __init__(_crv: ERC20, _factory: Factory, _bridger: Bridger, _call_proxy: CallProxy, _distributor: address, _chain_id: uint256):
+    """
+    @param _crv The CRV token
+    @param _factory The root gauge factory
+    @param _bridger The bridger of the chain moving the batched CRV
+    @param _call_proxy The anyCall proxy sending the split of each batch
+    @param _distributor The `EmissionsDistributor` on the child chain
+    @param _chain_id The chain id of the child chain
+    """
+    CRV = _crv
+    FACTORY = _factory
+    BRIDGER = _bridger
+    CALL_PROXY = _call_proxy
+    DISTRIBUTOR = _distributor
+    CHAIN_ID = _chain_id
+
+    assert _crv.approve(_bridger.address, max_value(uint256))
+
+
+@payable
+@external
+def __default__():
+    pass
+
+
+@internal
+def _flush(_value: uint256) -> uint256:
+    pending: DynArray[uint256, MAX_QUEUE] = self.pending
+    count: uint256 = len(pending)
+    if count == 0:
+        return 0
+
+    amount: uint256 = 0
+    for emission in pending:
+        amount += emission >> 160
+    BRIDGER.bridge(CRV, DISTRIBUTOR, amount, value=_value)
+
+    # the total is bridged at once, the split is sent in messages of at most MAX_PENDING
+    emissions: DynArray[uint256, MAX_PENDING] = []
+    for i in range(MAX_QUEUE):
+        if i == count:
+            break
+        emissions.append(pending[i])
+        if len(emissions) == MAX_PENDING or i + 1 == count:
+            CALL_PROXY.anyCall(
+                DISTRIBUTOR,
+                _abi_encode(emissions, method_id=method_id("receive_emissions(uint256[])")),
+                empty(address),
+                CHAIN_ID,
+            )
+            emissions = []
+    self.pending = empty(DynArray[uint256, MAX_QUEUE])
+
+    log Flush(amount, count)
+    return _value
+
+
+@payable
+@external
+def bridge(_token: ERC20, _to: address, _amount: uint256):
+    """
+    @notice Queue CRV emissions of a root gauge for the next batch
+    @dev A full batch is flushed, paying the bridging cost from the ETH held by this contract.
+        Without enough ETH, emissions keep queueing until someone calls `flush` with value
+    @param _token The token to bridge, must be CRV
+    @param _to The child gauge to send the token to
+    @param _amount The amount of the token to bridge
+    """
+    assert FACTORY.is_valid_gauge(msg.sender)  # dev: invalid gauge
+    assert _token == CRV  # dev: invalid token
+    assert _amount < 2 ** 96  # dev: amount overflow
+    assert len(self.pending) < MAX_QUEUE  # dev: queue full
+    assert CRV.transferFrom(msg.sender, self, _amount)
+
+    self.pending.append((_amount << 160) | convert(_to, uint256))
+    if len(self.pending) >= MAX_PENDING:
+        cost: uint256 = BRIDGER.cost()
+        if self.balance >= cost:
+            self._flush(cost)
+
+
+@payable
+@external
+def flush():
+    """
+    @notice Bridge all queued emissions in a single transfer
+    @dev `msg.value` pays the cost of the underlying bridger, the excess is refunded.
+        The ETH held by this contract only makes up for full batches
+    """
+    cost: uint256 = BRIDGER.cost()
+    if len(self.pending) < MAX_PENDING:
+        assert msg.value >= cost  # dev: insufficient value
+    spent: uint256 = self._flush(cost)
+
+    if msg.value > spent:
+        raw_call(msg.sender, b"", value=msg.value - spent)
+
+
+@view
+@external
+def cost() -> uint256:
+    """
+    @notice Cost in ETH to queue emissions, bridging is paid on `flush`
+    """
+    return 0
+
+
+@view
+@external
+def check(_account: address) -> bool:
+    """
+    @notice Dummy method to check if caller is allowed to bridge
+    @param _account The account to check
+    """
+    return True
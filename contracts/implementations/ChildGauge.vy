@@ -5,7 +5,7 @@
 @license Copyright (c) Curve.Fi, 2020-2024 - all rights reserved
 @author Curve.Fi
 @notice Layer2/Cross-Chain Gauge
-@custom:version 1.1.0
+@custom:version 1.2.0
 """
 
 
@@ -16,6 +16,9 @@ implements: ERC20
 interface ERC20Extended:
     def symbol() -> String[32]: view
 
+interface ERC2612:
+    def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32): nonpayable
+
 interface ERC1271:
     def isValidSignature(_hash: bytes32, _signature: Bytes[65]) -> bytes4: view
 
@@ -75,12 +78,21 @@ struct Reward:
     last_update: uint256
     integral: uint256
 
+struct RewardEpoch:
+    amount: uint256
+    duration: uint256
+
 
 MAX_REWARDS: constant(uint256) = 8
+MAX_QUEUED_EPOCHS: constant(uint256) = 16
+MAX_KICK: constant(uint256) = 256
+MAX_DEPOSIT: constant(uint256) = 64
 TOKENLESS_PRODUCTION: constant(uint256) = 40
 WEEK: constant(uint256) = 604800
+# EIP-1167 runtime followed by the LP token
+CLONE_CODESIZE: constant(uint256) = 45 + 32
 
-VERSION: constant(String[8]) = "1.1.0"
+VERSION: constant(String[8]) = "1.2.0"
 
 EIP712_TYPEHASH: constant(bytes32) = keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract,bytes32 salt)")
 EIP2612_TYPEHASH: constant(bytes32) = keccak256("Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)")
@@ -105,7 +117,8 @@ nonces: public(HashMap[address, uint256])
 # Gauge
 FACTORY: immutable(Factory)
 manager: public(address)
-lp_token: public(address)
+# only written for minimal proxies, clones hold the LP token in code
+proxy_lp_token: address
 
 is_killed: public(bool)
 
@@ -113,8 +126,19 @@ inflation_rate: public(HashMap[uint256, uint256])
 
 # For tracking external rewards
 reward_count: public(uint256)
-reward_data: public(HashMap[address, Reward])
-reward_remaining: public(HashMap[address, uint256])  # fixes bad precision
+# reward token -> [address distributor][uint48 period_finish][uint48 last_update]
+reward_state: HashMap[address, uint256]
+# reward token -> [uint128 rate][uint128 remaining]
+# remaining fixes bad precision
+reward_amounts: HashMap[address, uint256]
+# reward token -> 1e18 * ∫(rate(t) / totalSupply(t) dt) from 0 till last_update
+reward_integral: HashMap[address, uint256]
+# [uint32 nonce] * MAX_REWARDS, bumped every time the stream of a reward token is funded
+reward_nonces: uint256
+# reward token -> queue position -> [uint128 amount][uint128 duration]
+reward_epochs: HashMap[address, HashMap[uint256, uint256]]
+# reward token -> [uint128 first queued position][uint128 next free position]
+reward_queue: HashMap[address, uint256]
 
 # claimant -> default reward receiver
 rewards_receiver: public(HashMap[address, address])
@@ -125,6 +149,9 @@ reward_integral_for: public(HashMap[address, HashMap[address, uint256]])
 # user -> token -> [uint128 claimable amount][uint128 claimed amount]
 claim_data: HashMap[address, HashMap[address, uint256]]
 
+# user -> [uint32 nonce + 1] * MAX_REWARDS of finished streams the user is fully settled on
+reward_settled_for: HashMap[address, uint256]
+
 working_balances: public(HashMap[address, uint256])
 working_supply: public(uint256)
 
@@ -157,7 +184,8 @@ def __init__(_factory: Factory):
     @notice Deployer
     @param _factory Factory for deploying this gauge
     """
-    self.lp_token = 0x000000000000000000000000000000000000dEaD
+    self.proxy_lp_token = 0x000000000000000000000000000000000000dEaD
+    self.period_timestamp[0] = block.timestamp
 
     FACTORY = _factory
 
@@ -169,10 +197,13 @@ def initialize(_lp_token: address, _root: address, _manager: address):
     @param _lp_token Token to lock in
     @param _root Address of mirror Root gauge
     @param _manager Manager of rewards for the gauge
+    @dev Clones hold `_lp_token` in code, so it is only written for minimal proxies
     """
-    assert self.lp_token == empty(address)  # dev: already initialized
+    assert self.period_timestamp[0] == 0  # dev: already initialized
 
-    self.lp_token = _lp_token
+    gauge: address = self
+    if gauge.codesize != CLONE_CODESIZE:
+        self.proxy_lp_token = _lp_token
     self.root_gauge = _root
     self.manager = _manager
     log SetGaugeManager(_manager)
@@ -203,48 +234,75 @@ def initialize(_lp_token: address, _root: address, _manager: address):
 
 
 @internal
-def _checkpoint(_user: address):
+def _sweep_emissions():
     """
-    @notice Checkpoint a user calculating their CRV entitlement
-    @param _user User address
+    @notice Fold CRV held by the gauge into the inflation rate for the rest of the week
+    @dev Must only be called once the period is checkpointed at `block.timestamp`
+    """
+    crv: ERC20 = FACTORY.crv()
+    if crv != empty(ERC20):
+        crv_balance: uint256 = crv.balanceOf(self)
+        if crv_balance != 0:
+            current_week: uint256 = block.timestamp / WEEK
+            self.inflation_rate[current_week] += crv_balance / ((current_week + 1) * WEEK - block.timestamp)
+            crv.transfer(FACTORY.address, crv_balance)
+
+
+@view
+@internal
+def _integrate_inv_supply(_period_time: uint256, _integrate_inv_supply: uint256) -> uint256:
+    """
+    @notice Project the CRV integral of the last period up to `block.timestamp`
+    @param _period_time Timestamp of the last period
+    @param _integrate_inv_supply Integral of the last period
+    @return The integral at `block.timestamp`
+    """
+    working_supply: uint256 = self.working_supply
+    if working_supply == 0:
+        return _integrate_inv_supply
+
+    # CRV is only ever folded into the inflation rate of the current week, right after
+    # the period is checkpointed at `block.timestamp`. Any week after the one of the last
+    # checkpoint therefore has a rate of 0, and catching up over a dormant stretch reduces
+    # to the remainder of that single week, no matter how many weeks were missed
+    dt: uint256 = min((_period_time + WEEK) / WEEK * WEEK, block.timestamp) - _period_time
+    return _integrate_inv_supply + self.inflation_rate[_period_time / WEEK] * 10 ** 18 * dt / working_supply
+
+
+@internal
+def _checkpoint_global() -> uint256:
+    """
+    @notice Checkpoint the gauge's CRV integral up to `block.timestamp`
+    @return The integral of the current period
     """
     period: int128 = self.period
     period_time: uint256 = self.period_timestamp[period]
     integrate_inv_supply: uint256 = self.integrate_inv_supply[period]
 
     if block.timestamp > period_time:
+        integrate_inv_supply = self._integrate_inv_supply(period_time, integrate_inv_supply)
 
-        working_supply: uint256 = self.working_supply
-        prev_week_time: uint256 = period_time
-        week_time: uint256 = min((period_time + WEEK) / WEEK * WEEK, block.timestamp)
+        # the integral can only move once per block, so only the first checkpoint
+        # within a block needs to record a new period
+        period += 1
+        self.period = period
+        self.period_timestamp[period] = block.timestamp
+        self.integrate_inv_supply[period] = integrate_inv_supply
 
-        for i in range(256):
-            dt: uint256 = week_time - prev_week_time
+        # CRV arriving without `notify_emissions` is picked up by the first checkpoint of a
+        # later block, ordinary actions within the same block skip the balance query
+        self._sweep_emissions()
 
-            if working_supply != 0:
-                # we don't have to worry about crossing inflation epochs
-                # and if we miss any weeks, those weeks inflation rates will be 0 for sure
-                # but that means no one interacted with the gauge for that long
-                integrate_inv_supply += self.inflation_rate[prev_week_time / WEEK] * 10 ** 18 * dt / working_supply
+    return integrate_inv_supply
 
-            if week_time == block.timestamp:
-                break
-            prev_week_time = week_time
-            week_time = min(week_time + WEEK, block.timestamp)
 
-    # check CRV balance and increase weekly inflation rate by delta for the rest of the week
-    crv: ERC20 = FACTORY.crv()
-    if crv != empty(ERC20):
-        crv_balance: uint256 = crv.balanceOf(self)
-        if crv_balance != 0:
-            current_week: uint256 = block.timestamp / WEEK
-            self.inflation_rate[current_week] += crv_balance / ((current_week + 1) * WEEK - block.timestamp)
-            crv.transfer(FACTORY.address, crv_balance)
-
-    period += 1
-    self.period = period
-    self.period_timestamp[period] = block.timestamp
-    self.integrate_inv_supply[period] = integrate_inv_supply
+@internal
+def _checkpoint(_user: address):
+    """
+    @notice Checkpoint a user calculating their CRV entitlement
+    @param _user User address
+    """
+    integrate_inv_supply: uint256 = self._checkpoint_global()
 
     working_balance: uint256 = self.working_balances[_user]
     self.integrate_fraction[_user] += working_balance * (integrate_inv_supply - self.integrate_inv_supply_of[_user]) / 10 ** 18
@@ -252,6 +310,140 @@ def _checkpoint(_user: address):
     self.integrate_checkpoint_of[_user] = block.timestamp
 
 
+@internal
+def _integrate_reward(_token: address, _state: uint256, _integral: uint256, _total_supply: uint256) -> (uint256, uint256, uint256):
+    """
+    @notice Update the integral of a reward token up to `block.timestamp` or the end of its stream
+    @return The reward state, the integral and the duration distributed (or pending when there is no supply)
+    """
+    state: uint256 = _state
+    integral: uint256 = _integral
+    period_finish: uint256 = (state >> 48) % 2**48
+    last_update: uint256 = min(block.timestamp, period_finish)
+    duration: uint256 = last_update - state % 2**48
+
+    if duration != 0 and _total_supply != 0:
+        state = state - state % 2**48 + last_update
+        self.reward_state[_token] = state
+
+        amounts: uint256 = self.reward_amounts[_token]
+        rate: uint256 = amounts >> 128
+        remaining: uint256 = amounts % 2**128
+        excess: uint256 = remaining - (period_finish - last_update + duration) * rate
+        integral_change: uint256 = (duration * rate + excess) * 10**18 / _total_supply
+        integral += integral_change
+        self.reward_integral[_token] = integral
+        # There is still calculation error in user's claimable amount,
+        # but it has 18-decimal precision through LP(_total_supply) – safe
+        remaining -= integral_change * _total_supply / 10**18
+        self.reward_amounts[_token] = (rate << 128) | remaining
+
+    return state, integral, duration
+
+
+@internal
+def _roll_reward_epochs(_token: address, _state: uint256, _integral: uint256, _total_supply: uint256) -> (uint256, uint256, uint256):
+    """
+    @notice Start the epochs queued for a reward token which began since its stream finished
+    @dev Each epoch starts at the finish of the previous one, along with what is left of it
+    @return The reward state, the integral and the duration distributed of the last epoch started
+    """
+    state: uint256 = _state
+    integral: uint256 = _integral
+    duration: uint256 = 0
+
+    queue: uint256 = self.reward_queue[_token]
+    position: uint256 = queue >> 128
+    end: uint256 = queue % 2**128
+    for i in range(MAX_QUEUED_EPOCHS):
+        period_finish: uint256 = (state >> 48) % 2**48
+        # without supply, the epoch started can't be distributed and the next one can't start
+        if position == end or period_finish > block.timestamp or (i != 0 and _total_supply == 0):
+            break
+
+        epoch: uint256 = self.reward_epochs[_token][position]
+        position += 1
+
+        epoch_duration: uint256 = epoch % 2**128
+        total_amount: uint256 = (epoch >> 128) + self.reward_amounts[_token] % 2**128
+        self.reward_amounts[_token] = ((total_amount / epoch_duration) << 128) | total_amount
+        state = (state >> 96 << 96) | ((period_finish + epoch_duration) << 48) | period_finish
+        self.reward_state[_token] = state
+
+        state, integral, duration = self._integrate_reward(_token, state, integral, _total_supply)
+
+    if position != queue >> 128:
+        self.reward_queue[_token] = (position << 128) | end
+    return state, integral, duration
+
+
+@view
+@internal
+def _reward_integral(_token: address, _total_supply: uint256) -> uint256:
+    """
+    @notice Query the integral of a reward token at `block.timestamp`, including queued epochs
+    @dev Same arithmetic as `_integrate_reward` and `_roll_reward_epochs`, without writing state
+    """
+    integral: uint256 = self.reward_integral[_token]
+    state: uint256 = self.reward_state[_token]
+    amounts: uint256 = self.reward_amounts[_token]
+    queue: uint256 = self.reward_queue[_token]
+    position: uint256 = queue >> 128
+    for i in range(MAX_QUEUED_EPOCHS + 1):
+        period_finish: uint256 = (state >> 48) % 2**48
+        last_update: uint256 = min(block.timestamp, period_finish)
+        duration: uint256 = last_update - state % 2**48
+        if duration == 0:
+            break
+
+        rate: uint256 = amounts >> 128
+        remaining: uint256 = amounts % 2**128
+        excess: uint256 = remaining - (period_finish - last_update + duration) * rate
+        integral_change: uint256 = (duration * rate + excess) * 10**18 / _total_supply
+        integral += integral_change
+        remaining -= integral_change * _total_supply / 10**18
+
+        # the stream was distributed up to its finish, the next epoch starts along with what is left
+        if period_finish > block.timestamp or position == queue % 2**128:
+            break
+        epoch: uint256 = self.reward_epochs[_token][position]
+        position += 1
+        total_amount: uint256 = (epoch >> 128) + remaining
+        amounts = ((total_amount / (epoch % 2**128)) << 128) | total_amount
+        state = ((period_finish + epoch % 2**128) << 48) | period_finish
+    return integral
+
+
+@view
+@internal
+def _queued_reward_amount(_reward_token: address) -> uint256:
+    """
+    @notice Query the amount of a reward token queued in epochs which have not started
+    """
+    queue: uint256 = self.reward_queue[_reward_token]
+    position: uint256 = queue >> 128
+    end: uint256 = queue % 2**128
+    amount: uint256 = 0
+    for i in range(position, position + MAX_QUEUED_EPOCHS):
+        if i == end:
+            break
+        amount += self.reward_epochs[_reward_token][i] >> 128
+    return amount
+
+
+@internal
+def _bump_reward_nonce(_reward_token: address):
+    """
+    @notice Invalidate users settled on the stream of a reward token
+    """
+    for i in range(MAX_REWARDS):
+        if self.reward_tokens[i] == _reward_token:
+            offset: uint256 = 32 * i
+            nonces: uint256 = self.reward_nonces
+            self.reward_nonces = nonces - (((nonces >> offset) % 2**32) << offset) + ((((nonces >> offset) + 1) % 2**32) << offset)
+            break
+
+
 @internal
 def _checkpoint_rewards(_user: address, _total_supply: uint256, _claim: bool, _receiver: address):
     """
@@ -260,6 +452,8 @@ def _checkpoint_rewards(_user: address, _total_supply: uint256, _claim: bool, _r
 
     user_balance: uint256 = 0
     receiver: address = _receiver
+    nonces: uint256 = 0
+    settled: uint256 = 0
     if _user != empty(address):
         user_balance = self.balanceOf[_user]
         if _claim and _receiver == empty(address):
@@ -268,29 +462,33 @@ def _checkpoint_rewards(_user: address, _total_supply: uint256, _claim: bool, _r
             if receiver == empty(address):
                 # if no default receiver is set, direct claims to the user
                 receiver = _user
+        nonces = self.reward_nonces
+        settled = self.reward_settled_for[_user]
+    new_settled: uint256 = settled
 
     reward_count: uint256 = self.reward_count
     for i in range(MAX_REWARDS):
         if i == reward_count:
             break
+        offset: uint256 = 32 * i
+        nonce: uint256 = ((nonces >> offset) + 1) % 2**32
+        if _user != empty(address) and (settled >> offset) % 2**32 == nonce:
+            # the stream finished without being funded again and the user has already
+            # accounted for all of it, so neither the integral nor their share can move
+            continue
         token: address = self.reward_tokens[i]
 
-        integral: uint256 = self.reward_data[token].integral
-        period_finish: uint256 = self.reward_data[token].period_finish
-        last_update: uint256 = min(block.timestamp, period_finish)
-        duration: uint256 = last_update - self.reward_data[token].last_update
-
-        if duration != 0 and _total_supply != 0:
-            self.reward_data[token].last_update = last_update
-
-            rate: uint256 = self.reward_data[token].rate
-            excess: uint256 = self.reward_remaining[token] - (period_finish - last_update + duration) * rate
-            integral_change: uint256 = (duration * rate + excess) * 10**18 / _total_supply
-            integral += integral_change
-            self.reward_data[token].integral = integral
-            # There is still calculation error in user's claimable amount,
-            # but it has 18-decimal precision through LP(_total_supply) – safe
-            self.reward_remaining[token] -= integral_change * _total_supply / 10**18
+        state: uint256 = 0
+        integral: uint256 = 0
+        duration: uint256 = 0
+        state, integral, duration = self._integrate_reward(
+            token, self.reward_state[token], self.reward_integral[token], _total_supply
+        )
+        if duration != 0 and _total_supply != 0 and (state >> 48) % 2**48 <= block.timestamp:
+            # the stream was just distributed up to its finish, move on to the epochs queued
+            # after it. Epochs queued once it is over start right away in `queue_reward_epochs`
+            state, integral, duration = self._roll_reward_epochs(token, state, integral, _total_supply)
+        period_finish: uint256 = (state >> 48) % 2**48
 
         if _user != empty(address):
             integral_for: uint256 = self.reward_integral_for[token][_user]
@@ -310,24 +508,74 @@ def _checkpoint_rewards(_user: address, _total_supply: uint256, _claim: bool, _r
                 elif new_claimable > 0:
                     self.claim_data[_user][token] = total_claimed + (total_claimable << 128)
 
+            # the integral is final once it has been updated up to `period_finish`
+            # and no epoch is queued after it
+            if period_finish <= block.timestamp and (duration == 0 or _total_supply != 0):
+                if _claim or total_claimable == 0:
+                    new_settled = new_settled - (((new_settled >> offset) % 2**32) << offset) + (nonce << offset)
 
+    if new_settled != settled:
+        self.reward_settled_for[_user] = new_settled
+
+
+@view
 @internal
-def _update_liquidity_limit(_user: address, _user_balance: uint256, _total_supply: uint256):
+def _ve_total_supply() -> uint256:
     """
-    @notice Calculate working balances to apply amplification of CRV production.
-    @dev https://resources.curve.fi/reward-gauges/boosting-your-crv-rewards/#boost-info
+    @notice Query the total supply of the voting escrow oracle
+    @dev Read once per call and passed to every `_update_liquidity_limit` of the call
+    @return Total voting escrow supply, 0 if no oracle is set
+    """
+    ve: address = self.voting_escrow
+    if ve == empty(address):
+        return 0
+    return ERC20(ve).totalSupply()
+
+
+@view
+@internal
+def _lp_token() -> address:
+    """
+    @notice Query the LP token, from code for immutable-args clones
+    @dev `self.code` would read the implementation, the clone is read with `extcodecopy`
+    """
+    gauge: address = self
+    if gauge.codesize == CLONE_CODESIZE:
+        return extract32(slice(gauge.code, 45, 32), 0, output_type=address)
+    return self.proxy_lp_token
+
+
+@view
+@internal
+def _working_balance(_user: address, _user_balance: uint256, _total_supply: uint256, _ve_total_supply: uint256) -> uint256:
+    """
+    @notice Calculate the boosted working balance of a user
     @param _user The user address
     @param _user_balance User's amount of liquidity (LP tokens)
     @param _total_supply Total amount of liquidity (LP tokens)
+    @param _ve_total_supply Total voting escrow supply, as returned by `_ve_total_supply`
+    @return The working balance
     """
     working_balance: uint256 = _user_balance * TOKENLESS_PRODUCTION / 100
 
-    ve: address = self.voting_escrow
-    if ve != empty(address):
-        ve_ts: uint256 = ERC20(ve).totalSupply()
-        if ve_ts != 0:
-            working_balance += _total_supply * ERC20(ve).balanceOf(_user) / ve_ts * (100 - TOKENLESS_PRODUCTION) / 100
-            working_balance = min(_user_balance, working_balance)
+    if _ve_total_supply != 0:
+        working_balance += _total_supply * ERC20(self.voting_escrow).balanceOf(_user) / _ve_total_supply * (100 - TOKENLESS_PRODUCTION) / 100
+        working_balance = min(_user_balance, working_balance)
+
+    return working_balance
+
+
+@internal
+def _update_liquidity_limit(_user: address, _user_balance: uint256, _total_supply: uint256, _ve_total_supply: uint256):
+    """
+    @notice Calculate working balances to apply amplification of CRV production.
+    @dev https://resources.curve.fi/reward-gauges/boosting-your-crv-rewards/#boost-info
+    @param _user The user address
+    @param _user_balance User's amount of liquidity (LP tokens)
+    @param _total_supply Total amount of liquidity (LP tokens)
+    @param _ve_total_supply Total voting escrow supply, as returned by `_ve_total_supply`
+    """
+    working_balance: uint256 = self._working_balance(_user, _user_balance, _total_supply, _ve_total_supply)
 
     old_working_balance: uint256 = self.working_balances[_user]
     self.working_balances[_user] = working_balance
@@ -353,13 +601,14 @@ def _transfer(_from: address, _to: address, _value: uint256):
             self._checkpoint_rewards(_from, total_supply, False, empty(address))
         new_balance: uint256 = self.balanceOf[_from] - _value
         self.balanceOf[_from] = new_balance
-        self._update_liquidity_limit(_from, new_balance, total_supply)
+        ve_total_supply: uint256 = self._ve_total_supply()
+        self._update_liquidity_limit(_from, new_balance, total_supply, ve_total_supply)
 
         if is_rewards:
             self._checkpoint_rewards(_to, total_supply, False, empty(address))
         new_balance = self.balanceOf[_to] + _value
         self.balanceOf[_to] = new_balance
-        self._update_liquidity_limit(_to, new_balance, total_supply)
+        self._update_liquidity_limit(_to, new_balance, total_supply, ve_total_supply)
 
     log Transfer(_from, _to, _value)
 
@@ -367,6 +616,28 @@ def _transfer(_from: address, _to: address, _value: uint256):
 # External User Facing Functions
 
 
+@internal
+def _deposit(_value: uint256, _addr: address, _claim_rewards: bool, _ve_total_supply: uint256):
+    """
+    @notice Credit `_addr` with `_value` gauge tokens
+    @dev The caller checkpoints `_addr` beforehand and transfers the LP tokens afterwards
+    """
+    is_rewards: bool = self.reward_count != 0
+    total_supply: uint256 = self.totalSupply
+    if is_rewards:
+        self._checkpoint_rewards(_addr, total_supply, _claim_rewards, empty(address))
+
+    total_supply += _value
+    new_balance: uint256 = self.balanceOf[_addr] + _value
+    self.balanceOf[_addr] = new_balance
+    self.totalSupply = total_supply
+
+    self._update_liquidity_limit(_addr, new_balance, total_supply, _ve_total_supply)
+
+    log Deposit(_addr, _value)
+    log Transfer(empty(address), _addr, _value)
+
+
 @external
 @nonreentrant('lock')
 def deposit(_value: uint256, _addr: address = msg.sender, _claim_rewards: bool = False):
@@ -381,22 +652,71 @@ def deposit(_value: uint256, _addr: address = msg.sender, _claim_rewards: bool =
     self._checkpoint(_addr)
 
     if _value != 0:
-        is_rewards: bool = self.reward_count != 0
-        total_supply: uint256 = self.totalSupply
-        if is_rewards:
-            self._checkpoint_rewards(_addr, total_supply, _claim_rewards, empty(address))
+        self._deposit(_value, _addr, _claim_rewards, self._ve_total_supply())
+        ERC20(self._lp_token()).transferFrom(msg.sender, self, _value)
 
-        total_supply += _value
-        new_balance: uint256 = self.balanceOf[_addr] + _value
-        self.balanceOf[_addr] = new_balance
-        self.totalSupply = total_supply
 
-        self._update_liquidity_limit(_addr, new_balance, total_supply)
+@external
+@nonreentrant('lock')
+def deposit_with_permit(
+    _value: uint256,
+    _deadline: uint256,
+    _v: uint8,
+    _r: bytes32,
+    _s: bytes32,
+    _addr: address = msg.sender,
+    _claim_rewards: bool = False,
+):
+    """
+    @notice Deposit `_value` LP tokens approved with an EIP-2612 permit
+    @dev The permit is skipped when the allowance is already enough, so a permit
+        submitted by anyone else beforehand does not make the deposit fail
+    @param _value Number of tokens to deposit
+    @param _deadline The timestamp after which the permit is no longer valid
+    @param _v The bytes[64] of the permit signature of `msg.sender`
+    @param _r The bytes[0:32] of the permit signature of `msg.sender`
+    @param _s The bytes[32:64] of the permit signature of `msg.sender`
+    @param _addr Address to deposit for
+    @param _claim_rewards Whether to claim already accrued rewards
+    """
+    assert _addr != empty(address)  # dev: cannot deposit for zero address
+    self._checkpoint(_addr)
 
-        ERC20(self.lp_token).transferFrom(msg.sender, self, _value)
+    if _value != 0:
+        lp_token: address = self._lp_token()
+        if ERC20(lp_token).allowance(msg.sender, self) < _value:
+            ERC2612(lp_token).permit(msg.sender, self, _value, _deadline, _v, _r, _s)
 
-        log Deposit(_addr, _value)
-        log Transfer(empty(address), _addr, _value)
+        self._deposit(_value, _addr, _claim_rewards, self._ve_total_supply())
+        ERC20(lp_token).transferFrom(msg.sender, self, _value)
+
+
+@external
+@nonreentrant('lock')
+def deposit_for_many(_addrs: DynArray[address, MAX_DEPOSIT], _values: DynArray[uint256, MAX_DEPOSIT]):
+    """
+    @notice Deposit LP tokens for multiple addresses
+    @dev The LP tokens of all deposits are pulled in a single transfer
+    @param _addrs List of addresses to deposit for
+    @param _values Number of tokens to deposit for each address
+    """
+    assert len(_addrs) == len(_values)  # dev: length mismatch
+    ve_total_supply: uint256 = self._ve_total_supply()
+
+    total: uint256 = 0
+    for i in range(MAX_DEPOSIT):
+        if i == len(_addrs):
+            break
+        addr: address = _addrs[i]
+        assert addr != empty(address)  # dev: cannot deposit for zero address
+        self._checkpoint(addr)
+
+        if _values[i] != 0:
+            self._deposit(_values[i], addr, False, ve_total_supply)
+            total += _values[i]
+
+    if total != 0:
+        ERC20(self._lp_token()).transferFrom(msg.sender, self, total)
 
 
 @external
@@ -422,9 +742,9 @@ def withdraw(_value: uint256, _claim_rewards: bool = False, _receiver: address =
         self.balanceOf[msg.sender] = new_balance
         self.totalSupply = total_supply
 
-        self._update_liquidity_limit(msg.sender, new_balance, total_supply)
+        self._update_liquidity_limit(msg.sender, new_balance, total_supply, self._ve_total_supply())
 
-        ERC20(self.lp_token).transfer(_receiver, _value)
+        ERC20(self._lp_token()).transfer(_receiver, _value)
 
         log Withdraw(msg.sender, _value)
         log Transfer(msg.sender, empty(address), _value)
@@ -598,10 +918,42 @@ def user_checkpoint(addr: address) -> bool:
     """
     assert msg.sender in [addr, FACTORY.address]  # dev: unauthorized
     self._checkpoint(addr)
-    self._update_liquidity_limit(addr, self.balanceOf[addr], self.totalSupply)
+    self._update_liquidity_limit(addr, self.balanceOf[addr], self.totalSupply, self._ve_total_supply())
     return True
 
 
+@external
+def kick_many(_users: DynArray[address, MAX_KICK]):
+    """
+    @notice Lower the boosted working balances of `_users` whose voting escrow balance decayed
+    @dev Callable by anyone, users whose working balance would not decrease are skipped
+    @param _users Users to kick
+    """
+    integrate_inv_supply: uint256 = self._checkpoint_global()
+    total_supply: uint256 = self.totalSupply
+    ve_total_supply: uint256 = self._ve_total_supply()
+    working_supply: uint256 = self.working_supply
+
+    for user in _users:
+        old_working_balance: uint256 = self.working_balances[user]
+        user_balance: uint256 = self.balanceOf[user]
+        working_balance: uint256 = self._working_balance(user, user_balance, total_supply, ve_total_supply)
+        if working_balance >= old_working_balance:
+            continue
+
+        # checkpoint the user against the shared integral before lowering the balance
+        self.integrate_fraction[user] += old_working_balance * (integrate_inv_supply - self.integrate_inv_supply_of[user]) / 10 ** 18
+        self.integrate_inv_supply_of[user] = integrate_inv_supply
+        self.integrate_checkpoint_of[user] = block.timestamp
+
+        self.working_balances[user] = working_balance
+        working_supply = working_supply + working_balance - old_working_balance
+
+        log UpdateLiquidityLimit(user, user_balance, total_supply, working_balance, working_supply)
+
+    self.working_supply = working_supply
+
+
 @external
 def set_rewards_receiver(_receiver: address):
     """
@@ -655,7 +1007,8 @@ def deposit_reward_token(_reward_token: address, _amount: uint256, _epoch: uint2
     @param _amount The amount of `_reward_token` being deposited
     @param _epoch The duration the rewards are distributed across. Between 3 days and a year, week by default
     """
-    assert msg.sender == self.reward_data[_reward_token].distributor
+    state: uint256 = self.reward_state[_reward_token]
+    assert msg.sender == convert(state >> 96, address)
     assert 3 * WEEK / 7 <= _epoch and _epoch <= WEEK * 4 * 12, "Epoch duration"
 
     self._checkpoint_rewards(empty(address), self.totalSupply, False, empty(address))
@@ -670,12 +1023,89 @@ def deposit_reward_token(_reward_token: address, _amount: uint256, _epoch: uint2
     )
     amount_received = ERC20(_reward_token).balanceOf(self) - amount_received
 
-    total_amount: uint256 = amount_received + self.reward_remaining[_reward_token]
-    self.reward_data[_reward_token].rate = total_amount / _epoch
-    self.reward_remaining[_reward_token] = total_amount
+    total_amount: uint256 = amount_received + self.reward_amounts[_reward_token] % 2**128
+    # queued epochs are added to what is left when they start
+    assert total_amount + self._queued_reward_amount(_reward_token) < 2**128  # dev: reward amount overflow
+    self.reward_amounts[_reward_token] = ((total_amount / _epoch) << 128) | total_amount
+
+    self.reward_state[_reward_token] = (state >> 96 << 96) | ((block.timestamp + _epoch) << 48) | block.timestamp
+
+    # the stream moves again, invalidate users settled on the previous one
+    self._bump_reward_nonce(_reward_token)
+
+
+@external
+@nonreentrant("lock")
+def queue_reward_epochs(
+    _reward_token: address,
+    _amounts: DynArray[uint256, MAX_QUEUED_EPOCHS],
+    _epochs: DynArray[uint256, MAX_QUEUED_EPOCHS],
+):
+    """
+    @notice Deposit a reward token for distribution over consecutive epochs
+    @dev Epochs start one after the other once the current stream finishes, right away
+        if it already has. Fee on transfer tokens are spread pro rata across epochs.
+    @param _reward_token The reward token being deposited
+    @param _amounts The amount of `_reward_token` distributed in each epoch
+    @param _epochs The duration of each epoch. Between 3 days and a year
+    """
+    state: uint256 = self.reward_state[_reward_token]
+    assert msg.sender == convert(state >> 96, address)
+    assert len(_amounts) == len(_epochs) and len(_amounts) != 0  # dev: invalid epochs
+
+    total_supply: uint256 = self.totalSupply
+    self._checkpoint_rewards(empty(address), total_supply, False, empty(address))
+
+    queue: uint256 = self.reward_queue[_reward_token]
+    position: uint256 = queue >> 128
+    end: uint256 = queue % 2**128
+    assert end - position + len(_amounts) <= MAX_QUEUED_EPOCHS  # dev: queue full
+
+    total_amount: uint256 = 0
+    for amount in _amounts:
+        total_amount += amount
+
+    # transferFrom reward token and use transferred amount henceforth:
+    amount_received: uint256 = ERC20(_reward_token).balanceOf(self)
+    assert ERC20(_reward_token).transferFrom(
+        msg.sender,
+        self,
+        total_amount,
+        default_return_value=True
+    )
+    amount_received = ERC20(_reward_token).balanceOf(self) - amount_received
+
+    queued: uint256 = 0
+    for i in range(MAX_QUEUED_EPOCHS):
+        if i == len(_amounts):
+            break
+        epoch: uint256 = _epochs[i]
+        assert 3 * WEEK / 7 <= epoch and epoch <= WEEK * 4 * 12, "Epoch duration"
+
+        amount: uint256 = _amounts[i]
+        if amount_received != total_amount:
+            amount = amount_received - queued
+            if i + 1 < len(_amounts):
+                amount = _amounts[i] * amount_received / total_amount
+        assert amount < 2**128  # dev: reward amount overflow
+        queued += amount
+
+        self.reward_epochs[_reward_token][end] = (amount << 128) | epoch
+        end += 1
 
-    self.reward_data[_reward_token].last_update = block.timestamp
-    self.reward_data[_reward_token].period_finish = block.timestamp + _epoch
+    # epochs are added to what is left of the stream when they start
+    remaining: uint256 = self.reward_amounts[_reward_token] % 2**128
+    assert remaining + self._queued_reward_amount(_reward_token) + queued < 2**128  # dev: reward amount overflow
+    self.reward_queue[_reward_token] = (position << 128) | end
+
+    state = self.reward_state[_reward_token]
+    if (state >> 48) % 2**48 <= block.timestamp:
+        # the stream already finished, the first epoch starts now
+        state = (state >> 96 << 96) | (block.timestamp << 48) | block.timestamp
+        self._roll_reward_epochs(_reward_token, state, self.reward_integral[_reward_token], total_supply)
+
+    # the stream moves again, invalidate users settled on the previous one
+    self._bump_reward_nonce(_reward_token)
 
 
 @external
@@ -688,13 +1118,15 @@ def recover_remaining(_reward_token: address):
     """
     self._checkpoint_rewards(empty(address), self.totalSupply, False, empty(address))
 
-    period_finish: uint256 = self.reward_data[_reward_token].period_finish
+    state: uint256 = self.reward_state[_reward_token]
+    period_finish: uint256 = (state >> 48) % 2**48
     assert period_finish < block.timestamp
-    assert self.reward_data[_reward_token].last_update >= period_finish
+    assert state % 2**48 >= period_finish
 
-    assert ERC20(_reward_token).transfer(self.reward_data[_reward_token].distributor,
-        self.reward_remaining[_reward_token], default_return_value=True)
-    self.reward_remaining[_reward_token] = 0
+    amounts: uint256 = self.reward_amounts[_reward_token]
+    assert ERC20(_reward_token).transfer(convert(state >> 96, address),
+        amounts % 2**128, default_return_value=True)
+    self.reward_amounts[_reward_token] = amounts >> 128 << 128
 
 
 @external
@@ -710,9 +1142,9 @@ def add_reward(_reward_token: address, _distributor: address):
 
     reward_count: uint256 = self.reward_count
     assert reward_count < MAX_REWARDS
-    assert self.reward_data[_reward_token].distributor == empty(address)
+    assert self.reward_state[_reward_token] >> 96 == 0
 
-    self.reward_data[_reward_token].distributor = _distributor
+    self.reward_state[_reward_token] = convert(_distributor, uint256) << 96
     self.reward_tokens[reward_count] = _reward_token
     self.reward_count = reward_count + 1
     log AddReward(_reward_token, reward_count)
@@ -726,13 +1158,14 @@ def set_reward_distributor(_reward_token: address, _distributor: address):
     @param _reward_token The reward token to reassign distribution rights to
     @param _distributor The address of the new distributor
     """
-    current_distributor: address = self.reward_data[_reward_token].distributor
+    state: uint256 = self.reward_state[_reward_token]
+    current_distributor: address = convert(state >> 96, address)
 
     assert msg.sender in [current_distributor, FACTORY.owner(), self.manager]
     assert current_distributor != empty(address)
     assert _distributor != empty(address)
 
-    self.reward_data[_reward_token].distributor = _distributor
+    self.reward_state[_reward_token] = (convert(_distributor, uint256) << 96) | (state % 2**96)
     log SetDistributor(_reward_token, _distributor)
 
 
@@ -761,6 +1194,20 @@ def set_root_gauge(_root: address):
     self.root_gauge = _root
 
 
+@external
+def notify_emissions():
+    """
+    @notice Fold CRV bridged to the gauge into the inflation rate
+    @dev Callable by anyone, CRV is otherwise picked up by the first checkpoint of a later block
+    """
+    if self.period_timestamp[self.period] == block.timestamp:
+        # already checkpointed within this block, only the sweep is left
+        self._sweep_emissions()
+    else:
+        # sweeps as part of the checkpoint
+        self._checkpoint_global()
+
+
 @external
 def update_voting_escrow():
     """
@@ -772,6 +1219,54 @@ def update_voting_escrow():
 # View Methods
 
 
+@view
+@external
+def reward_data(_reward_token: address) -> Reward:
+    """
+    @notice Get the distribution data of a reward token
+    @param _reward_token Token to get reward data for
+    @return Reward Distributor, period finish, rate, last update and integral
+    """
+    state: uint256 = self.reward_state[_reward_token]
+    return Reward({
+        distributor: convert(state >> 96, address),
+        period_finish: (state >> 48) % 2**48,
+        rate: self.reward_amounts[_reward_token] >> 128,
+        last_update: state % 2**48,
+        integral: self.reward_integral[_reward_token],
+    })
+
+
+@view
+@external
+def reward_remaining(_reward_token: address) -> uint256:
+    """
+    @notice Get the amount of a reward token not yet accounted to users
+    @param _reward_token Token to get remaining amount for
+    @return uint256 Remaining reward token amount
+    """
+    return self.reward_amounts[_reward_token] % 2**128
+
+
+@view
+@external
+def queued_reward_epochs(_reward_token: address) -> DynArray[RewardEpoch, MAX_QUEUED_EPOCHS]:
+    """
+    @notice Get the epochs queued after the current stream of a reward token
+    @dev Epochs which already started are only removed from the queue by the next checkpoint
+    @param _reward_token Token to get queued epochs for
+    @return Amount and duration of each queued epoch, in order
+    """
+    epochs: DynArray[RewardEpoch, MAX_QUEUED_EPOCHS] = []
+    queue: uint256 = self.reward_queue[_reward_token]
+    for position in range(queue >> 128, (queue >> 128) + MAX_QUEUED_EPOCHS):
+        if position == queue % 2**128:
+            break
+        epoch: uint256 = self.reward_epochs[_reward_token][position]
+        epochs.append(RewardEpoch({amount: epoch >> 128, duration: epoch % 2**128}))
+    return epochs
+
+
 @view
 @external
 def claimed_reward(_addr: address, _token: address) -> uint256:
@@ -793,12 +1288,10 @@ def claimable_reward(_user: address, _reward_token: address) -> uint256:
     @param _reward_token Token to get reward amount for
     @return uint256 Claimable reward token amount
     """
-    integral: uint256 = self.reward_data[_reward_token].integral
+    integral: uint256 = self.reward_integral[_reward_token]
     total_supply: uint256 = self.totalSupply
     if total_supply != 0:
-        last_update: uint256 = min(block.timestamp, self.reward_data[_reward_token].period_finish)
-        duration: uint256 = last_update - self.reward_data[_reward_token].last_update
-        integral += (duration * self.reward_data[_reward_token].rate * 10**18 / total_supply)
+        integral = self._reward_integral(_reward_token, total_supply)
 
     integral_for: uint256 = self.reward_integral_for[_reward_token][_user]
     new_claimable: uint256 = self.balanceOf[_user] * (integral - integral_for) / 10**18
@@ -818,6 +1311,21 @@ def claimable_tokens(addr: address) -> uint256:
     return self.integrate_fraction[addr] - FACTORY.minted(addr, self)
 
 
+@view
+@external
+def claimable_tokens_view(addr: address) -> uint256:
+    """
+    @notice Get the number of claimable tokens per user without checkpointing
+    @dev Matches `claimable_tokens` at the current block
+    @param addr User to check for
+    @return uint256 number of claimable tokens per user
+    """
+    period: int128 = self.period
+    integrate_inv_supply: uint256 = self._integrate_inv_supply(self.period_timestamp[period], self.integrate_inv_supply[period])
+    integrate_fraction: uint256 = self.integrate_fraction[addr] + self.working_balances[addr] * (integrate_inv_supply - self.integrate_inv_supply_of[addr]) / 10 ** 18
+    return integrate_fraction - FACTORY.minted(addr, self)
+
+
 @view
 @external
 def integrate_checkpoint() -> uint256:
@@ -857,3 +1365,13 @@ def factory() -> Factory:
     @return address of factory
     """
     return FACTORY
+
+
+@view
+@external
+def lp_token() -> address:
+    """
+    @notice Get the LP token deposited into this gauge
+    @return address of LP token
+    """
+    return self._lp_token()
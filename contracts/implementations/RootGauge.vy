@@ -3,10 +3,10 @@
 @title Root Liquidity Gauge Implementation
 @license MIT
 @author Curve Finance
-@custom:version 1.0.1
+@custom:version 1.1.0
 """
 
-version: public(constant(String[8])) = "1.0.1"
+version: public(constant(String[8])) = "1.1.0"
 
 interface CRV20:
     def rate() -> uint256: view
@@ -25,10 +25,12 @@ interface GaugeController:
 
 interface Factory:
     def get_bridger(_chain_id: uint256) -> Bridger: view
+    def min_bridge_amount(_chain_id: uint256) -> uint256: view
     def owner() -> address: view
 
 interface Minter:
     def mint(_gauge: address): nonpayable
+    def minted(_user: address, _gauge: address) -> uint256: view
 
 
 struct InflationParams:
@@ -41,16 +43,19 @@ YEAR: constant(uint256) = 86400 * 365
 RATE_DENOMINATOR: constant(uint256) = 10 ** 18
 RATE_REDUCTION_COEFFICIENT: constant(uint256) = 1189207115002721024  # 2 ** (1/4) * 1e18
 RATE_REDUCTION_TIME: constant(uint256) = YEAR
+# EIP-1167 runtime followed by the factory and the chain id
+CLONE_CODESIZE: constant(uint256) = 45 + 64
 
 CRV: immutable(CRV20)
 GAUGE_CONTROLLER: immutable(GaugeController)
 MINTER: immutable(Minter)
 
 
-chain_id: public(uint256)
 bridger: public(Bridger)
 child_gauge: public(address)
-factory: public(Factory)
+# only written for minimal proxies, clones hold the factory and the chain id in code
+proxy_chain_id: uint256
+proxy_factory: Factory
 inflation_params: public(InflationParams)
 
 last_period: public(uint256)
@@ -61,7 +66,8 @@ is_killed: public(bool)
 
 @external
 def __init__(_crv_token: CRV20, _gauge_controller: GaugeController, _minter: Minter):
-    self.factory = Factory(0x000000000000000000000000000000000000dEaD)
+    self.proxy_factory = Factory(0x000000000000000000000000000000000000dEaD)
+    self.last_period = block.timestamp / WEEK
 
     # assign immutable variables
     CRV = _crv_token
@@ -75,20 +81,42 @@ def __default__():
     pass
 
 
+@view
+@internal
+def _clone_args() -> (Factory, uint256):
+    """
+    @notice Query the factory and the chain id, from code for immutable-args clones
+    @dev `self.code` would read the implementation, the clone is read with `extcodecopy`
+    """
+    gauge: address = self
+    if gauge.codesize == CLONE_CODESIZE:
+        args: Bytes[64] = slice(gauge.code, 45, 64)
+        return Factory(extract32(args, 0, output_type=address)), extract32(args, 32, output_type=uint256)
+    return self.proxy_factory, self.proxy_chain_id
+
+
 @external
-def transmit_emissions():
+def transmit_emissions() -> bool:
     """
     @notice Mint any new emissions and transmit across to child gauge
+    @dev CRV is held by the gauge until it reaches the minimum bridge amount of the chain
+    @return Whether the emissions were bridged
     """
-    assert msg.sender == self.factory.address  # dev: call via factory
+    factory: Factory = empty(Factory)
+    chain_id: uint256 = 0
+    factory, chain_id = self._clone_args()
+    assert msg.sender == factory.address  # dev: call via factory
 
     MINTER.mint(self)
     minted: uint256 = CRV.balanceOf(self)
 
     assert minted != 0  # dev: nothing minted
-    bridger: Bridger = self.bridger
+    if minted < factory.min_bridge_amount(chain_id):
+        return False
 
+    bridger: Bridger = self.bridger
     bridger.bridge(CRV, self.child_gauge, minted, value=bridger.cost())
+    return True
 
 
 @view
@@ -103,6 +131,39 @@ def integrate_fraction(_user: address) -> uint256:
     return 0
 
 
+@view
+@internal
+def _emissions(_last_period: uint256, _current_period: uint256, _params: InflationParams) -> (uint256, InflationParams):
+    """
+    @notice Calculate the emissions of the periods from `_last_period` up to (but not including) `_current_period`
+    @return The emissions and the inflation params at `_current_period`
+    """
+    params: InflationParams = _params
+    emissions: uint256 = 0
+
+    # only calculate emissions for at most 256 periods since the last checkpoint
+    for i in range(_last_period, _last_period + 256):
+        if i == _current_period:
+            # don't calculate emissions for the current period
+            break
+        period_time: uint256 = i * WEEK
+        weight: uint256 = GAUGE_CONTROLLER.gauge_relative_weight(self, period_time)
+
+        if period_time <= params.finish_time and params.finish_time < period_time + WEEK:
+            # calculate with old rate
+            emissions += weight * params.rate * (params.finish_time - period_time) / 10 ** 18
+            # update rate
+            params.rate = params.rate * RATE_DENOMINATOR / RATE_REDUCTION_COEFFICIENT
+            # calculate with new rate
+            emissions += weight * params.rate * (period_time + WEEK - params.finish_time) / 10 ** 18
+            # update finish time
+            params.finish_time += RATE_REDUCTION_TIME
+        else:
+            emissions += weight * params.rate * WEEK / 10 ** 18
+
+    return emissions, params
+
+
 @external
 def user_checkpoint(_user: address) -> bool:
     """
@@ -118,33 +179,18 @@ def user_checkpoint(_user: address) -> bool:
     # last period is always less than or equal to current period and we only calculate
     # emissions up to current period (not including it)
     if last_period != current_period:
-        # checkpoint the gauge filling in any missing weight data
-        GAUGE_CONTROLLER.checkpoint_gauge(self)
-
         params: InflationParams = self.inflation_params
         emissions: uint256 = 0
 
-        # only calculate emissions for at most 256 periods since the last checkpoint
-        for i in range(last_period, last_period + 256):
-            if i == current_period:
-                # don't calculate emissions for the current period
-                break
-            period_time: uint256 = i * WEEK
-            weight: uint256 = GAUGE_CONTROLLER.gauge_relative_weight(self, period_time)
-
-            if period_time <= params.finish_time and params.finish_time < period_time + WEEK:
-                # calculate with old rate
-                emissions += weight * params.rate * (params.finish_time - period_time) / 10 ** 18
-                # update rate
-                params.rate = params.rate * RATE_DENOMINATOR / RATE_REDUCTION_COEFFICIENT
-                # calculate with new rate
-                emissions += weight * params.rate * (period_time + WEEK - params.finish_time) / 10 ** 18
-                # update finish time
-                params.finish_time += RATE_REDUCTION_TIME
-                # update storage
+        # killed gauges emit nothing, unkilling resets the params and the last period
+        if params.rate != 0:
+            # checkpoint the gauge filling in any missing weight data
+            GAUGE_CONTROLLER.checkpoint_gauge(self)
+
+            finish_time: uint256 = params.finish_time
+            emissions, params = self._emissions(last_period, current_period, params)
+            if params.finish_time != finish_time:
                 self.inflation_params = params
-            else:
-                emissions += weight * params.rate * WEEK / 10 ** 18
 
         self.last_period = current_period
         self.total_emissions += emissions
@@ -152,13 +198,38 @@ def user_checkpoint(_user: address) -> bool:
     return True
 
 
+@view
+@external
+def pending_emissions() -> uint256:
+    """
+    @notice Query the pending CRV: unminted emissions plus held balance
+    @dev Weeks the gauge controller was not checkpointed for count as zero weight,
+        any checkpoint of this gauge fills them in. Nothing is bridged below the
+        minimum bridge amount of the chain, see `RootGaugeFactory.bridge_shortfall`
+    """
+    total_emissions: uint256 = self.total_emissions
+    last_period: uint256 = self.last_period
+    current_period: uint256 = block.timestamp / WEEK
+    params: InflationParams = self.inflation_params
+
+    if last_period != current_period and params.rate != 0:
+        emissions: uint256 = 0
+        emissions, params = self._emissions(last_period, current_period, params)
+        total_emissions += emissions
+
+    return total_emissions - MINTER.minted(self, self) + CRV.balanceOf(self)
+
+
 @external
 def set_killed(_is_killed: bool):
     """
     @notice Set the gauge kill status
     @dev Inflation params are modified accordingly to disable/enable emissions
     """
-    assert msg.sender == self.factory.owner()
+    factory: Factory = empty(Factory)
+    chain_id: uint256 = 0
+    factory, chain_id = self._clone_args()
+    assert msg.sender == factory.owner()
 
     if _is_killed:
         self.inflation_params.rate = 0
@@ -177,8 +248,12 @@ def update_bridger():
     @notice Update the bridger used by this contract
     @dev Bridger contracts should prevent bridging if ever updated
     """
+    factory: Factory = empty(Factory)
+    chain_id: uint256 = 0
+    factory, chain_id = self._clone_args()
+
     # reset approval
-    bridger: Bridger = self.factory.get_bridger(self.chain_id)
+    bridger: Bridger = factory.get_bridger(chain_id)
     CRV.approve(self.bridger.address, 0)
     CRV.approve(bridger.address, max_value(uint256))
     self.bridger = bridger
@@ -190,7 +265,10 @@ def set_child_gauge(_child: address):
     @notice Set Child contract in case something went wrong (e.g. between implementation updates or zkSync)
     @param _child Child gauge to set
     """
-    assert msg.sender == self.factory.owner()
+    factory: Factory = empty(Factory)
+    chain_id: uint256 = 0
+    factory, chain_id = self._clone_args()
+    assert msg.sender == factory.owner()
     assert _child != empty(address)
 
     self.child_gauge = _child
@@ -200,13 +278,16 @@ def set_child_gauge(_child: address):
 def initialize(_bridger: Bridger, _chain_id: uint256, _child: address):
     """
     @notice Proxy initialization method
+    @dev Clones hold the factory and `_chain_id` in code, so they are only written for minimal proxies
     """
-    assert self.factory == empty(Factory)  # dev: already initialized
+    assert self.last_period == 0  # dev: already initialized
 
     self.child_gauge = _child
-    self.chain_id = _chain_id
     self.bridger = _bridger
-    self.factory = Factory(msg.sender)
+    gauge: address = self
+    if gauge.codesize != CLONE_CODESIZE:
+        self.proxy_chain_id = _chain_id
+        self.proxy_factory = Factory(msg.sender)
 
     inflation_params: InflationParams = InflationParams({
         rate: CRV.rate(),
@@ -218,3 +299,21 @@ def initialize(_bridger: Bridger, _chain_id: uint256, _child: address):
     self.last_period = block.timestamp / WEEK
 
     CRV.approve(_bridger.address, max_value(uint256))
+
+
+@view
+@external
+def factory() -> Factory:
+    """
+    @notice Get the factory of this gauge
+    """
+    return self._clone_args()[0]
+
+
+@view
+@external
+def chain_id() -> uint256:
+    """
+    @notice Get the chain id of the child gauge
+    """
+    return self._clone_args()[1]
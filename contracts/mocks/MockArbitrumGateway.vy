@@ -0,0 +1,88 @@
+# pragma version 0.3.10
+from vyper.interfaces import ERC20
+
+
+interface Inbox:
+    def createRetryableTicket(
+        _to: address,
+        _l2_call_value: uint256,
+        _max_submission_cost: uint256,
+        _excess_fee_refund_address: address,
+        _call_value_refund_address: address,
+        _gas_limit: uint256,
+        _max_fee_per_gas: uint256,
+        _data: Bytes[2048],
+    ) -> uint256: payable
+
+
+event DepositInitiated:
+    _l1_token: address
+    _from: indexed(address)
+    _to: indexed(address)
+    _sequence_number: indexed(uint256)
+    _amount: uint256
+
+
+INBOX: public(immutable(Inbox))
+
+
+@external
+def __init__(_inbox: Inbox):
+    INBOX = _inbox
+
+
+@view
+@external
+def getGateway(_token: address) -> address:
+    return self
+
+
+@view
+@internal
+def _outbound_calldata(
+    _token: address, _from: address, _to: address, _amount: uint256, _data: Bytes[128]
+) -> Bytes[2048]:
+    return _abi_encode(
+        _token,
+        _from,
+        _to,
+        _amount,
+        _data,
+        method_id=method_id("finalizeInboundTransfer(address,address,address,uint256,bytes)"),
+    )
+
+
+@view
+@external
+def getOutboundCalldata(
+    _token: address, _from: address, _to: address, _amount: uint256, _data: Bytes[128]
+) -> Bytes[2048]:
+    return self._outbound_calldata(_token, _from, _to, _amount, _data)
+
+
+@payable
+@external
+def outboundTransferCustomRefund(
+    _token: address,
+    _refund_to: address,
+    _to: address,
+    _amount: uint256,
+    _max_gas: uint256,
+    _gas_price_bid: uint256,
+    _data: Bytes[128],
+):
+    max_submission_cost: uint256 = convert(extract32(_data, 0), uint256)
+    assert ERC20(_token).transferFrom(msg.sender, self, _amount)
+
+    ticket_id: uint256 = INBOX.createRetryableTicket(
+        _to,
+        0,
+        max_submission_cost,
+        _refund_to,
+        _refund_to,
+        _max_gas,
+        _gas_price_bid,
+        self._outbound_calldata(_token, msg.sender, _to, _amount, b""),
+        value=msg.value,
+    )
+    log DepositInitiated(_token, msg.sender, _to, ticket_id, _amount)
@@ -0,0 +1,54 @@
+# pragma version 0.3.10
+
+
+event RetryableTicketCreated:
+    _ticket_id: indexed(uint256)
+    _submission_fee: uint256
+    _refund: uint256
+
+
+# gas used by the L2 execution of every ticket
+l2_gas_used: public(uint256)
+ticket_count: public(uint256)
+
+
+@external
+def set_l2_gas_used(_gas: uint256):
+    self.l2_gas_used = _gas
+
+
+@view
+@external
+def calculateRetryableSubmissionFee(_data_length: uint256, _base_fee: uint256) -> uint256:
+    base_fee: uint256 = _base_fee
+    if base_fee == 0:
+        base_fee = block.basefee
+    return (1400 + 6 * _data_length) * base_fee
+
+
+@payable
+@external
+def createRetryableTicket(
+    _to: address,
+    _l2_call_value: uint256,
+    _max_submission_cost: uint256,
+    _excess_fee_refund_address: address,
+    _call_value_refund_address: address,
+    _gas_limit: uint256,
+    _max_fee_per_gas: uint256,
+    _data: Bytes[2048],
+) -> uint256:
+    submission_fee: uint256 = (1400 + 6 * len(_data)) * block.basefee
+    assert _max_submission_cost >= submission_fee  # dev: insufficient submission cost
+    assert msg.value >= _l2_call_value + _max_submission_cost + _gas_limit * _max_fee_per_gas
+
+    # the ticket is executed right away, unused submission cost and gas are refunded
+    fee: uint256 = submission_fee + min(self.l2_gas_used, _gas_limit) * _max_fee_per_gas
+    refund: uint256 = msg.value - _l2_call_value - fee
+    if refund != 0:
+        raw_call(_excess_fee_refund_address, b"", value=refund)
+
+    ticket_id: uint256 = self.ticket_count
+    self.ticket_count = ticket_id + 1
+    log RetryableTicketCreated(ticket_id, submission_fee, refund)
+    return ticket_id
@@ -0,0 +1,11 @@
+# pragma version 0.3.10
+
+
+balanceOf: public(HashMap[address, uint256])
+totalSupply: public(uint256)
+
+
+@external
+def set_balance(_user: address, _balance: uint256):
+    self.totalSupply = self.totalSupply + _balance - self.balanceOf[_user]
+    self.balanceOf[_user] = _balance
@@ -22,6 +22,9 @@ NETWORK_IDS = [
     1666600000,  # harmony
 ]
 
+MAX_TRANSMIT = 64
+MAX_PAGE = 256
+
 dev = accounts.load("dev")
 
 
@@ -29,13 +32,15 @@ def main():
     factory = RootGaugeFactory.at("0xabC000d88f23Bb45525E447528DBF656A9D55bf5")
     gauge_controller = Contract("0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB")  # gauge controller
 
+    # fetch all the gauges for each network in NETWORK_IDS, a page at a time
+    gauges = [
+        info[0]
+        for chain_id in NETWORK_IDS
+        for start in range(0, factory.get_gauge_count(chain_id), MAX_PAGE)
+        for info in factory.get_gauges(chain_id, start, MAX_PAGE)
+    ]
+
     with brownie.multicall:
-        # fetch all the gauges for each network in NETWORK_IDS
-        gauges = [
-            factory.get_gauge(chain_id, i)
-            for chain_id in NETWORK_IDS
-            for i in range(factory.get_gauge_count(chain_id))
-        ]
         # fetch each gauges gauge_type, gauges not voted in have no gauge_type
         gauge_types = [gauge_controller.gauge_types(gauge) for gauge in gauges]
 
@@ -47,15 +52,18 @@ def main():
             RootGauge.at(gauge_addr).total_emissions() for gauge_addr in valid_gauges
         ]
         # filter gauges that haven't emitted any CRV
-        transmission_set = list(compress(valid_gauges, map(lambda e: e == 0, gauge_emissions)))
+        new_gauges = list(compress(valid_gauges, map(lambda e: e == 0, gauge_emissions)))
+        # and skip those with nothing to bridge yet
+        pending = [RootGauge.at(gauge_addr).pending_emissions() for gauge_addr in new_gauges]
+        transmission_set = list(compress(new_gauges, map(lambda p: p != 0, pending)))
 
     gauges_to_emit = []
-    for gauge_addr in transmission_set:
-        try:
-            factory.transmit_emissions.call(gauge_addr)
-            factory.transmit_emissions(gauge_addr, {"from": dev, "priority_fee": "2 gwei"})
-        except Exception:
-            pass
+    for i in range(0, len(transmission_set), MAX_TRANSMIT):
+        batch = transmission_set[i : i + MAX_TRANSMIT]
+        # gauges which fail to transmit are skipped instead of reverting the batch,
+        # bridgers handling a single transfer per tx only bridge once per batch
+        tx = factory.transmit_emissions_many(batch, {"from": dev, "priority_fee": "2 gwei"})
+        gauges_to_emit += list(compress(batch, tx.return_value))
     if len(gauges_to_emit) != 0:
         print(gauges_to_emit)
     else:
@@ -1,36 +1,42 @@
 import csv
 
-import rlp
-from brownie import ZERO_ADDRESS, Recover, Script, accounts, web3
-from hexbytes import HexBytes
+from brownie import AnyCallProxy, RootGaugeFactory, accounts
+
+ANYCALL = "0x37414a8662bC1D25be3ee51Fb27C2686e2490A89"
+FACTORY = "0xabC000d88f23Bb45525E447528DBF656A9D55bf5"
+
+ARBITRUM_CHAIN_ID = 42161
+# arbitrum requires some ETH to bridge CRV, sent to the root gauge ahead of its deployment
+ARBITRUM_PREFUND = 5 * 10**17
+# execution budget of the factory for the child -> root callbacks of the deployments
+ANYCALL_BUDGET = 2 * 10**18
 
 with open("redeploy_data.csv") as f:
-    data = [(int(row[0]), *row[1:-2]) for i, row in enumerate(csv.reader(f)) if i != 0]
+    rows = [row for i, row in enumerate(csv.reader(f)) if i != 0]
 
-tx = {
-    "nonce": "0x",
-    "gasPrice": 40 * 10**9,
-    "gasLimit": 600000,
-    "to": "0x",
-    "value": 4 * 10**18,  # 4 ETH
-    "data": Script.deploy.encode_input(data),
-    "v": 27,
-    "r": 0x1234567890ABCDEF,
-    "s": 0x1234567890ABCDEF,
-}
+# chain_id, lp_token, salt, manager, value
+params = [
+    (
+        int(row[1]),
+        row[2],
+        row[3],
+        row[4],
+        ARBITRUM_PREFUND if int(row[1]) == ARBITRUM_CHAIN_ID else 0,
+    )
+    for row in rows
+]
 
 
 def main():
-    recover = Recover.deploy({"from": accounts[0]})
-    sighash = web3.keccak(rlp.encode([HexBytes(v) for k, v in tx.items() if k not in "vrs"]))
+    factory = RootGaugeFactory.at(FACTORY)
+    value = sum(p[-1] for p in params)
 
-    while (sender := recover.recover(sighash, tx["v"], tx["r"], tx["s"])) == ZERO_ADDRESS:
-        tx["r"] += 1
-    serialized = rlp.encode(list(map(HexBytes, tx.values()))).hex()
+    txparams = {"from": accounts[0], "value": value}
 
-    print(f"Send 4.03 ETH to account: {sender}")
-    print(
-        "Contract instance will be created and destroyed at:",
-        accounts.at(sender, force=True).get_deployment_address(0),
-    )
-    print(f"Then submit the following raw transaction: \n\n'{serialized}")
+    # root gauges are prefunded at their predicted address, check it before sending ETH
+    for root, row in zip(factory.deploy_child_gauges.call(params, txparams), rows):
+        assert root == row[5], f"Unexpected root gauge address for {row[7]}"
+
+    AnyCallProxy.at(ANYCALL).deposit(FACTORY, {"from": accounts[0], "value": ANYCALL_BUDGET})
+
+    factory.deploy_child_gauges(params, txparams)
@@ -0,0 +1,95 @@
+import brownie
+import pytest
+
+GAS_LIMIT = 1_000_000
+GAS_PRICE = 10**8
+SUBMISSION_MARGIN = 12_500
+L2_GAS_USED = 400_000
+
+
+@pytest.fixture(scope="module")
+def inbox(alice, MockArbitrumInbox):
+    inbox = MockArbitrumInbox.deploy({"from": alice})
+    inbox.set_l2_gas_used(L2_GAS_USED, {"from": alice})
+    return inbox
+
+
+@pytest.fixture(scope="module")
+def gateway(alice, inbox, MockArbitrumGateway):
+    return MockArbitrumGateway.deploy(inbox, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def refund(alice, ArbitrumRefund):
+    return ArbitrumRefund.deploy({"from": alice})
+
+
+@pytest.fixture(scope="module")
+def bridger(alice, root_crv_token, gateway, refund, ArbitrumBridger):
+    bridger = ArbitrumBridger.deploy(
+        root_crv_token,
+        gateway,
+        GAS_LIMIT,
+        GAS_PRICE,
+        SUBMISSION_MARGIN,
+        refund,
+        {"from": alice},
+    )
+    root_crv_token.approve(bridger, 2**256 - 1, {"from": alice})
+    return bridger
+
+
+def test_quote_matches_inbox(alice, bridger, gateway, inbox, root_crv_token):
+    data_length = len(gateway.getOutboundCalldata(root_crv_token, bridger, alice, 0, b""))
+    submission_fee = inbox.calculateRetryableSubmissionFee(data_length, 0)
+
+    assert bridger.max_submission_cost() == submission_fee * SUBMISSION_MARGIN // 10_000
+    assert bridger.cost() == GAS_LIMIT * GAS_PRICE + bridger.max_submission_cost()
+
+
+def test_bridge_refunds_excess(alice, bridger, gateway, refund, root_crv_token):
+    amount = root_crv_token.balanceOf(alice)
+    cost = bridger.cost()
+
+    tx = bridger.bridge(root_crv_token, alice, amount, {"from": alice, "value": cost})
+
+    ticket = tx.events["RetryableTicketCreated"]
+    assert tx.events["DepositInitiated"]["_to"] == alice
+    assert root_crv_token.balanceOf(gateway) == amount
+    assert refund.balance() == ticket["_refund"]
+    assert ticket["_refund"] == cost - ticket["_submission_fee"] - L2_GAS_USED * GAS_PRICE
+
+
+def test_refund_withdraw(alice, bob, bridger, refund, root_crv_token):
+    bridger.bridge(root_crv_token, alice, 0, {"from": alice, "value": bridger.cost()})
+    refund.commit_transfer_ownership(bob, {"from": alice})
+    refund.accept_transfer_ownership({"from": bob})
+    balance, refunded = bob.balance(), refund.balance()
+
+    refund.withdraw({"from": alice})
+
+    assert refund.balance() == 0
+    assert bob.balance() == balance + refunded
+
+
+def test_set_submission_data(alice, bridger):
+    bridger.set_submission_data(2 * GAS_LIMIT, GAS_PRICE, 20_000, {"from": alice})
+
+    assert bridger.gas_limit() == 2 * GAS_LIMIT
+    assert bridger.submission_margin() == 20_000
+
+
+def test_set_submission_data_guarded(alice, bob, bridger):
+    with brownie.reverts():
+        bridger.set_submission_data(GAS_LIMIT, GAS_PRICE, SUBMISSION_MARGIN, {"from": bob})
+    with brownie.reverts():
+        bridger.set_submission_data(GAS_LIMIT, GAS_PRICE, 9_999, {"from": alice})
+
+
+def test_set_refund(alice, bob, bridger):
+    tx = bridger.set_refund(bob, {"from": alice})
+
+    assert bridger.refund() == bob
+    assert "UpdateRefund" in tx.events
+    with brownie.reverts():
+        bridger.set_refund(alice, {"from": bob})
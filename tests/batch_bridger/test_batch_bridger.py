@@ -0,0 +1,230 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, compile_source
+
+WEEK = 86400 * 7
+MAX_PENDING = 29
+MAX_QUEUE = 4 * MAX_PENDING
+
+# bridger charging ETH, and a factory accepting any caller as a gauge
+MOCKS_SRC = {
+    "bridger": """
+cost: public(uint256)
+
+@external
+def __init__():
+    self.cost = 10**15
+
+@payable
+@external
+def bridge(_token: address, _to: address, _amount: uint256):
+    assert msg.value == self.cost
+""",
+    "factory": """
+@view
+@external
+def is_valid_gauge(_gauge: address) -> bool:
+    return True
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def distributor(alice, anycall, child_gauge_factory, EmissionsDistributor):
+    # the root bridger is deployed right after, its address is known ahead
+    batch_bridger = alice.get_deployment_address(alice.nonce + 1)
+    return EmissionsDistributor.deploy(child_gauge_factory, anycall, batch_bridger, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def batch_bridger(
+    alice,
+    chain,
+    anycall,
+    root_crv_token,
+    root_gauge_factory,
+    mock_bridger,
+    distributor,
+    BatchBridger,
+):
+    bridger = BatchBridger.deploy(
+        root_crv_token,
+        root_gauge_factory,
+        mock_bridger,
+        anycall,
+        distributor,
+        chain.id,
+        {"from": alice},
+    )
+    anycall.setWhitelist(bridger, distributor, chain.id, True, {"from": alice})
+    return bridger
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(
+    alice,
+    chain,
+    batch_bridger,
+    root_gauge,
+    root_gauge_factory,
+    root_gauge_controller,
+    child_gauge_factory,
+    child_gauge_impl,
+):
+    root_gauge_factory.set_child(
+        chain.id, batch_bridger, child_gauge_factory, child_gauge_impl, {"from": alice}
+    )
+    root_gauge.update_bridger({"from": alice})
+
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauge_controller.add_gauge(root_gauge, 0, 10**18, {"from": alice})
+    chain.mine(timedelta=3 * WEEK)
+
+
+def _transmit_and_flush(alice, root_gauge, root_gauge_factory, batch_bridger):
+    root_gauge_factory.transmit_emissions(root_gauge, {"from": alice})
+    return batch_bridger.flush({"from": alice})
+
+
+def test_emissions_are_queued(alice, root_gauge, root_gauge_factory, root_crv_token, batch_bridger):
+    root_gauge_factory.transmit_emissions(root_gauge, {"from": alice})
+
+    amount = root_crv_token.balanceOf(batch_bridger)
+    assert amount > 0
+    assert batch_bridger.pending(0) == (amount << 160) + int(root_gauge.child_gauge(), 16)
+
+
+def test_flush_bridges_total_once(
+    alice, root_gauge, root_gauge_factory, root_crv_token, batch_bridger, distributor, mock_bridger
+):
+    tx = _transmit_and_flush(alice, root_gauge, root_gauge_factory, batch_bridger)
+
+    bridges = [s for s in tx.subcalls if s.get("function") == "bridge(address,address,uint256)"]
+    assert len(bridges) == 1
+    assert bridges[0]["to"] == mock_bridger
+    assert bridges[0]["inputs"]["_to"] == distributor
+    assert bridges[0]["inputs"]["_amount"] == root_crv_token.balanceOf(batch_bridger)
+    assert tx.events["AnyCall"]["to"] == distributor
+    with brownie.reverts():
+        batch_bridger.pending(0)
+
+
+def test_relay_distributes(
+    alice,
+    chain,
+    anycall,
+    child_gauge,
+    child_crv_token,
+    child_gauge_factory,
+    root_gauge,
+    root_gauge_factory,
+    batch_bridger,
+    distributor,
+):
+    tx = _transmit_and_flush(alice, root_gauge, root_gauge_factory, batch_bridger)
+    amount = tx.events["Flush"]["_amount"]
+
+    # the batch arrives on the child chain ahead of the message
+    child_crv_token._mint_for_testing(distributor, amount, {"from": alice})
+    tx = anycall.anyExec(
+        batch_bridger, distributor, tx.events["AnyCall"]["data"], ZERO_ADDRESS, 1, {"from": alice}
+    )
+
+    assert tx.events["Distribute"].values() == [child_gauge, amount]
+    assert distributor.owed(child_gauge) == 0
+    # the gauge folds the CRV into its inflation rate straight away
+    assert child_crv_token.balanceOf(child_gauge_factory) == amount
+    assert child_gauge.inflation_rate(tx.timestamp // WEEK) > 0
+
+
+def test_message_ahead_of_batch(
+    alice,
+    anycall,
+    child_gauge,
+    child_crv_token,
+    child_gauge_factory,
+    root_gauge,
+    root_gauge_factory,
+    batch_bridger,
+    distributor,
+):
+    tx = _transmit_and_flush(alice, root_gauge, root_gauge_factory, batch_bridger)
+    amount = tx.events["Flush"]["_amount"]
+
+    anycall.anyExec(
+        batch_bridger, distributor, tx.events["AnyCall"]["data"], ZERO_ADDRESS, 1, {"from": alice}
+    )
+    assert distributor.owed(child_gauge) == amount
+
+    child_crv_token._mint_for_testing(distributor, amount, {"from": alice})
+    distributor.distribute([child_gauge], {"from": alice})
+
+    assert distributor.owed(child_gauge) == 0
+    assert child_crv_token.balanceOf(child_gauge_factory) == amount
+
+
+def test_only_root_bridger(alice, anycall, child_gauge, distributor):
+    with brownie.reverts():
+        distributor.receive_emissions(
+            [(10**18 << 160) + int(child_gauge.address, 16)], {"from": alice}
+        )
+
+
+def test_only_valid_gauges(alice, root_crv_token, batch_bridger):
+    with brownie.reverts("dev: invalid gauge"):
+        batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def costly_batch_bridger(alice, chain, anycall, root_crv_token, distributor, BatchBridger):
+    bridger, factory = [
+        compile_source(MOCKS_SRC[name], vyper_version="0.3.1").Vyper.deploy({"from": alice})
+        for name in ["bridger", "factory"]
+    ]
+    batch_bridger = BatchBridger.deploy(
+        root_crv_token, factory, bridger, anycall, distributor, chain.id, {"from": alice}
+    )
+    anycall.setWhitelist(batch_bridger, distributor, chain.id, True, {"from": alice})
+    root_crv_token.approve(batch_bridger, 2**256 - 1, {"from": alice})
+    return batch_bridger
+
+
+def test_queue_until_funded(alice, root_crv_token, costly_batch_bridger):
+    for _ in range(MAX_PENDING):
+        costly_batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+    # a full batch without the ETH to flush keeps queueing
+    assert costly_batch_bridger.pending(MAX_PENDING - 1) != 0
+
+    alice.transfer(costly_batch_bridger, 10**15)
+    tx = costly_batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+
+    assert tx.events["Flush"]["_count"] == MAX_PENDING + 1
+    assert len(tx.events["AnyCall"]) == 2
+    assert costly_batch_bridger.balance() == 0
+    with brownie.reverts():
+        costly_batch_bridger.pending(0)
+
+
+def test_queue_full(alice, root_crv_token, costly_batch_bridger):
+    for _ in range(MAX_QUEUE):
+        costly_batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+
+    with brownie.reverts("dev: queue full"):
+        costly_batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+
+    tx = costly_batch_bridger.flush({"from": alice, "value": 10**15})
+    assert tx.events["Flush"]["_count"] == MAX_QUEUE
+    assert len(tx.events["AnyCall"]) == MAX_QUEUE // MAX_PENDING
+
+
+def test_prefund_kept_for_full_batches(alice, bob, root_crv_token, costly_batch_bridger):
+    alice.transfer(costly_batch_bridger, 10**15)
+    costly_batch_bridger.bridge(root_crv_token, alice, 10**18, {"from": alice})
+
+    with brownie.reverts("dev: insufficient value"):
+        costly_batch_bridger.flush({"from": bob})
+    assert costly_batch_bridger.balance() == 10**15
+
+    tx = costly_batch_bridger.flush({"from": bob, "value": 10**15})
+    assert tx.events["Flush"]["_count"] == 1
+    assert costly_batch_bridger.balance() == 10**15
@@ -0,0 +1,85 @@
+import pytest
+
+VE_TOTAL_SUPPLY_SIG = "totalSupply()"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, bob, charlie, child_gauge, child_gauge_factory, lp_token, mock_voting_escrow):
+    child_gauge_factory.set_voting_escrow(mock_voting_escrow, {"from": alice})
+    child_gauge.update_voting_escrow({"from": alice})
+
+    mock_voting_escrow.set_balance(alice, 10**18, {"from": alice})
+    mock_voting_escrow.set_balance(charlie, 3 * 10**18, {"from": alice})
+
+    lp_token._mint_for_testing(alice, 10**24, {"from": alice})
+    lp_token.approve(child_gauge, 2**256 - 1, {"from": alice})
+    child_gauge.deposit(10**21, {"from": alice})
+    child_gauge.deposit(10**21, bob, {"from": alice})
+    child_gauge.user_checkpoint(alice, {"from": alice})
+
+
+def _ve_total_supply_calls(tx, mock_voting_escrow):
+    return len(
+        [
+            s
+            for s in tx.subcalls
+            if s["to"] == mock_voting_escrow and s.get("function") == VE_TOTAL_SUPPLY_SIG
+        ]
+    )
+
+
+def test_working_balances(alice, bob, child_gauge):
+    # alice holds 1/4 of the ve supply: 40% of 1e21 + 60% of 1/4 of 2e21
+    assert child_gauge.working_balances(alice) == 7 * 10**20
+    assert child_gauge.working_balances(bob) == 4 * 10**20
+    assert child_gauge.working_supply() == 11 * 10**20
+
+
+def test_transfer_reads_ve_supply_once(alice, bob, child_gauge, mock_voting_escrow):
+    tx = child_gauge.transfer(bob, 10**20, {"from": alice})
+
+    assert _ve_total_supply_calls(tx, mock_voting_escrow) == 1
+
+
+@pytest.mark.parametrize("method", ["deposit", "withdraw"])
+def test_deposit_withdraw_reads_ve_supply_once(alice, child_gauge, mock_voting_escrow, method):
+    tx = getattr(child_gauge, method)(10**20, {"from": alice})
+
+    assert _ve_total_supply_calls(tx, mock_voting_escrow) == 1
+
+
+def test_transfer_updates_both_balances(alice, bob, charlie, child_gauge):
+    child_gauge.transfer(charlie, 10**21, {"from": bob})
+
+    assert child_gauge.working_balances(bob) == 0
+    # charlie holds 3/4 of the ve supply: boost capped at the full balance
+    assert child_gauge.working_balances(charlie) == 10**21
+    assert child_gauge.working_supply() == 17 * 10**20
+
+
+def test_kick_many_lowers_decayed_boost(alice, bob, charlie, child_gauge, mock_voting_escrow):
+    mock_voting_escrow.set_balance(alice, 0, {"from": alice})
+    tx = child_gauge.kick_many([alice, bob], {"from": charlie})
+
+    assert child_gauge.working_balances(alice) == 4 * 10**20
+    assert child_gauge.working_supply() == 8 * 10**20
+    assert child_gauge.integrate_checkpoint_of(alice) == tx.timestamp
+    assert len(tx.events["UpdateLiquidityLimit"]) == 1
+
+
+def test_kick_many_skips_increases(alice, bob, charlie, child_gauge, mock_voting_escrow):
+    mock_voting_escrow.set_balance(bob, 10**18, {"from": alice})
+    tx = child_gauge.kick_many([alice, bob], {"from": charlie})
+
+    # bob gained ve and alice's share fell: a kick only ever lowers balances
+    assert child_gauge.working_balances(bob) == 4 * 10**20
+    assert child_gauge.working_balances(alice) == 64 * 10**19
+    assert child_gauge.working_supply() == 104 * 10**19
+    assert tx.events["UpdateLiquidityLimit"]["user"] == alice
+
+
+def test_kick_many_reads_ve_supply_once(alice, bob, charlie, child_gauge, mock_voting_escrow):
+    mock_voting_escrow.set_balance(alice, 0, {"from": alice})
+    tx = child_gauge.kick_many([alice, bob, charlie], {"from": charlie})
+
+    assert _ve_total_supply_calls(tx, mock_voting_escrow) == 1
@@ -20,8 +20,8 @@ def test_inflation_rate_increases(alice, chain, child_gauge, child_crv_token, ch
 
     # send rewards into the gauge
     child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
-    # interact with the gauge (necessary to update the inflation rate)
-    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+    # notify the gauge (necessary to update the inflation rate within the same block)
+    tx = child_gauge.notify_emissions({"from": alice})
     expected_inflation_rate = 10**24 // ((week_i + 1) * WEEK - tx.timestamp)
     assert child_gauge.inflation_rate(week_i) == expected_inflation_rate
 
@@ -43,8 +43,8 @@ def test_multiple_emissions_deposits(
 
     # send rewards into the gauge
     child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
-    # interact with the gauge (necessary to update the inflation rate)
-    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+    # notify the gauge (necessary to update the inflation rate within the same block)
+    tx = child_gauge.notify_emissions({"from": alice})
     expected_inflation_rate = 10**24 // ((week_i + 1) * WEEK - tx.timestamp)
     assert child_gauge.inflation_rate(week_i) == expected_inflation_rate
 
@@ -53,8 +53,8 @@ def test_multiple_emissions_deposits(
 
     # send rewards into the gauge new amount
     child_crv_token._mint_for_testing(child_gauge, 10**43, {"from": alice})
-    # interact with the gauge (necessary to update the inflation rate)
-    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+    # notify the gauge (necessary to update the inflation rate within the same block)
+    tx = child_gauge.notify_emissions({"from": alice})
     expected_inflation_rate += 10**43 // ((week_i + 1) * WEEK - tx.timestamp)
     assert child_gauge.inflation_rate(week_i) == expected_inflation_rate
 
@@ -67,8 +67,127 @@ def test_multiple_emissions_deposits(
 
     # send rewards into the gauge new amount
     child_crv_token._mint_for_testing(child_gauge, 10**35, {"from": alice})
-    # interact with the gauge (necessary to update the inflation rate)
-    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+    # notify the gauge (necessary to update the inflation rate within the same block)
+    tx = child_gauge.notify_emissions({"from": alice})
     # inflation will start from beginning of the week instead of last period time
     expected_inflation_rate = 10**35 // ((week_i + 1) * WEEK - tx.timestamp)
     assert child_gauge.inflation_rate(week_i) == expected_inflation_rate
+
+
+def test_emissions_swept_by_later_checkpoint(
+    alice, chain, child_gauge, child_crv_token, child_gauge_factory
+):
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    child_gauge.deposit(10**21, {"from": alice})
+
+    week_i = chain.time() // WEEK
+
+    # CRV bridged without a notification is picked up by the first checkpoint of a later block
+    child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
+    chain.sleep(1)
+    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+
+    expected_inflation_rate = 10**24 // ((week_i + 1) * WEEK - tx.timestamp)
+    assert child_gauge.inflation_rate(week_i) == expected_inflation_rate
+    assert child_crv_token.balanceOf(child_gauge) == 0
+    assert child_crv_token.balanceOf(child_gauge_factory) == 10**24
+    assert child_gauge.integrate_checkpoint() == tx.timestamp
+
+
+def test_notify_emissions_checkpoints_first(alice, chain, child_gauge, child_crv_token):
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    child_gauge.deposit(10**21, {"from": alice})
+    chain.sleep(3600)
+
+    period = child_gauge.period()
+    child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
+    tx = child_gauge.notify_emissions({"from": alice})
+
+    # the elapsed time is integrated before the new emissions start
+    assert child_gauge.period() == period + 1
+    assert child_gauge.integrate_checkpoint() == tx.timestamp
+    assert child_gauge.integrate_inv_supply(period + 1) == 0
+
+
+def _loop_integral(child_gauge, period_time, timestamp, working_supply):
+    # reference implementation of the original week-by-week catch-up loop
+    integral = 0
+    prev_week_time = period_time
+    week_time = min((period_time + WEEK) // WEEK * WEEK, timestamp)
+    for _ in range(256):
+        if working_supply != 0:
+            rate = child_gauge.inflation_rate(prev_week_time // WEEK)
+            integral += rate * 10**18 * (week_time - prev_week_time) // working_supply
+        if week_time == timestamp:
+            break
+        prev_week_time = week_time
+        week_time = min(week_time + WEEK, timestamp)
+    return integral
+
+
+@pytest.mark.parametrize("idle_weeks", [1, 2, 52, 256])
+def test_catch_up_matches_loop(alice, chain, child_gauge, child_crv_token, idle_weeks):
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    child_gauge.deposit(10**21, {"from": alice})
+
+    child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
+    child_gauge.notify_emissions({"from": alice})
+    chain.sleep(86400)
+    child_gauge.user_checkpoint(alice, {"from": alice})
+
+    period_time = child_gauge.integrate_checkpoint()
+    integral = child_gauge.integrate_inv_supply(child_gauge.period())
+    working_supply = child_gauge.working_supply()
+
+    chain.sleep(idle_weeks * WEEK)
+    tx = child_gauge.user_checkpoint(alice, {"from": alice})
+
+    expected = integral + _loop_integral(child_gauge, period_time, tx.timestamp, working_supply)
+    assert child_gauge.integrate_inv_supply(child_gauge.period()) == expected
+
+
+def test_catch_up_gas_is_constant(alice, chain, child_gauge, child_crv_token):
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    child_gauge.deposit(10**21, {"from": alice})
+    child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
+    child_gauge.notify_emissions({"from": alice})
+
+    gas_used = []
+    for idle_weeks in [1, 4, 16, 64, 256]:
+        chain.sleep(idle_weeks * WEEK)
+        gas_used.append(child_gauge.user_checkpoint(alice, {"from": alice}).gas_used)
+
+    # previously every idle week added a storage read and an iteration
+    assert max(gas_used) - min(gas_used) < 1000
+
+
+def test_period_written_once_per_block(alice, bob, chain, child_gauge):
+    child_gauge.deposit(10**21, {"from": alice})
+    chain.sleep(86400)
+
+    period = child_gauge.period()
+    tx = child_gauge.transfer(bob, 10**20, {"from": alice})
+
+    # both sides of the transfer share a single new period
+    assert child_gauge.period() == period + 1
+    assert child_gauge.integrate_checkpoint() == tx.timestamp
+    assert child_gauge.period_timestamp(period + 1) == tx.timestamp
+    assert child_gauge.integrate_inv_supply_of(alice) == child_gauge.integrate_inv_supply(
+        period + 1
+    )
+    assert child_gauge.integrate_inv_supply_of(bob) == child_gauge.integrate_inv_supply(period + 1)
+
+
+@pytest.mark.parametrize("idle_time", [0, 3600, WEEK, 3 * WEEK])
+def test_claimable_tokens_view(alice, bob, chain, child_gauge, child_crv_token, idle_time):
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    child_gauge.deposit(10**21, {"from": alice})
+    child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
+    child_gauge.notify_emissions({"from": alice})
+    chain.sleep(3600)
+    child_gauge.transfer(bob, 10**20, {"from": alice})
+
+    chain.sleep(idle_time)
+    chain.mine()
+    for acct in [alice, bob]:
+        assert child_gauge.claimable_tokens_view(acct) == child_gauge.claimable_tokens.call(acct)
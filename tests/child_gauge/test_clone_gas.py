@@ -0,0 +1,38 @@
+"""
+Deposit and withdraw cost of minimal proxy and immutable-args clone gauges.
+
+Run with `brownie test tests/child_gauge/test_clone_gas.py --gas` for a gas report
+of `deposit` and `withdraw` in both deployment modes.
+"""
+import pytest
+from brownie import Contract
+
+
+@pytest.fixture(scope="module")
+def clone_gauge(alice, child_gauge, child_gauge_factory, clone_blueprint, lp_token, ChildGauge):
+    child_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+    gauge_addr = child_gauge_factory.deploy_gauge(lp_token, 0x1, {"from": alice}).return_value
+    return Contract.from_abi("Child Gauge (clone)", gauge_addr, ChildGauge.abi)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, child_gauge, clone_gauge, lp_token):
+    lp_token._mint_for_testing(alice, 10**24, {"from": alice})
+    for gauge in [child_gauge, clone_gauge]:
+        lp_token.approve(gauge, 2**256 - 1, {"from": alice})
+        gauge.deposit(10**21, {"from": alice})
+
+
+def test_deposit_withdraw(alice, child_gauge, clone_gauge, lp_token):
+    gas_used = []
+    for gauge in [child_gauge, clone_gauge]:
+        deposit = gauge.deposit(10**20, {"from": alice})
+        withdraw = gauge.withdraw(10**20, {"from": alice})
+
+        assert lp_token.balanceOf(gauge) == 10**21
+        assert gauge.balanceOf(alice) == 10**21
+        gas_used.append((deposit.gas_used, withdraw.gas_used))
+
+    # clones read the LP token from code instead of storage
+    assert gas_used[1][0] < gas_used[0][0]
+    assert gas_used[1][1] < gas_used[0][1]
@@ -1,5 +1,7 @@
 import brownie
 import pytest
+from brownie import ChildGauge
+from eip712.messages import EIP712Message
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -67,3 +69,52 @@ def test_withdraw_new_epoch(accounts, chain, child_gauge, lp_token):
     assert lp_token.balanceOf(accounts[0]) == balance
     assert child_gauge.totalSupply() == 0
     assert child_gauge.balanceOf(accounts[0]) == 0
+
+
+def test_deposit_for_many(accounts, child_gauge, lp_token):
+    balance = lp_token.balanceOf(accounts[0])
+    addrs, values = accounts[1:5], [10**18, 0, 2 * 10**18, 3 * 10**18]
+
+    tx = child_gauge.deposit_for_many(addrs, values, {"from": accounts[0]})
+
+    assert [child_gauge.balanceOf(addr) for addr in addrs] == values
+    assert child_gauge.totalSupply() == sum(values)
+    assert lp_token.balanceOf(accounts[0]) == balance - sum(values)
+    assert len([e for e in tx.events["Transfer"] if e.address == lp_token]) == 1
+
+
+def test_deposit_for_many_length_mismatch(accounts, child_gauge):
+    with brownie.reverts():
+        child_gauge.deposit_for_many(accounts[1:3], [10**18], {"from": accounts[0]})
+
+
+def test_deposit_with_permit(accounts, chain, child_gauge, child_gauge_factory):
+    # gauge tokens support EIP-2612, use `child_gauge` as the LP token of another gauge
+    tx = child_gauge_factory.deploy_gauge(child_gauge, 1, {"from": accounts[0]})
+    gauge = ChildGauge.at(tx.return_value)
+    owner = accounts.add("0x416b8a7d9290502f5661da81f0cf43893e3d19cb9aea3c426cfb36e8186e9c09")
+    child_gauge.deposit(10**18, owner, {"from": accounts[0]})
+
+    class Permit(EIP712Message):
+        # EIP-712 Domain Fields
+        _name_: "string" = child_gauge.name()  # noqa: F821
+        _version_: "string" = child_gauge.version()  # noqa: F821
+        _chainId_: "uint256" = chain.id  # noqa: F821
+        _verifyingContract_: "address" = child_gauge.address  # noqa: F821
+        _salt_: "bytes32" = child_gauge.salt()  # noqa: F821
+
+        # EIP-2612 Data Fields
+        owner: "address"  # noqa: F821
+        spender: "address"  # noqa: F821
+        value: "uint256"  # noqa: F821
+        nonce: "uint256"  # noqa: F821
+        deadline: "uint256" = 2**256 - 1  # noqa: F821
+
+    permit = Permit(owner=owner.address, spender=gauge.address, value=10**18, nonce=0)
+    sig = owner.sign_message(permit)
+
+    gauge.deposit_with_permit(10**18, 2**256 - 1, sig.v, sig.r, sig.s, {"from": owner})
+
+    assert gauge.balanceOf(owner) == 10**18
+    assert child_gauge.balanceOf(gauge) == 10**18
+    assert child_gauge.nonces(owner) == 1
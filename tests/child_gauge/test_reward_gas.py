@@ -0,0 +1,50 @@
+"""
+Reward checkpoint cost across reward counts.
+
+Run with `brownie test tests/child_gauge/test_reward_gas.py --gas` for a gas report
+of `deposit`, `transfer` and `claim_rewards` with 1 to 8 reward tokens.
+"""
+import pytest
+from brownie_tokens import ERC20
+
+WEEK = 86400 * 7
+# ceiling of a transfer, which checkpoints the rewards of both parties without paying out.
+# Measured at 201,500 gas with 1 reward and 42,500 per additional reward
+# (46,000 before packing the reward storage)
+CHECKPOINT_GAS = 165_000
+CHECKPOINT_GAS_PER_REWARD = 44_000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, bob, child_gauge, lp_token):
+    lp_token._mint_for_testing(alice, 10**24, {"from": alice})
+    lp_token.approve(child_gauge, 2**256 - 1, {"from": alice})
+    child_gauge.deposit(10**21, {"from": alice})
+    child_gauge.deposit(0, {"from": bob})
+
+
+@pytest.mark.parametrize("reward_count", range(1, 9))
+def test_reward_checkpoints(alice, bob, chain, child_gauge, reward_count):
+    tokens = []
+    for i in range(reward_count):
+        token = ERC20(f"Reward {i}", f"R{i}", 18, deployer=alice)
+        token._mint_for_testing(alice, 10**24, {"from": alice})
+        token.approve(child_gauge, 2**256 - 1, {"from": alice})
+        child_gauge.add_reward(token, alice, {"from": alice})
+        child_gauge.deposit_reward_token(token, 10**24, {"from": alice})
+        tokens.append(token)
+
+    chain.sleep(3600)
+    child_gauge.deposit(10**20, {"from": alice})
+    chain.sleep(3600)
+    transfer = child_gauge.transfer(bob, 10**19, {"from": alice})
+    chain.sleep(3600)
+
+    claimable = [child_gauge.claimable_reward(alice, token) for token in tokens]
+    child_gauge.claim_rewards({"from": alice})
+
+    for token, amount in zip(tokens, claimable):
+        assert amount > 0
+        assert token.balanceOf(alice) >= amount
+        assert child_gauge.claimed_reward(alice, token) == token.balanceOf(alice)
+    assert transfer.gas_used < CHECKPOINT_GAS + CHECKPOINT_GAS_PER_REWARD * reward_count
@@ -1,5 +1,7 @@
 import brownie
+import pytest
 from brownie.test import given, strategy
+from brownie_tokens import ERC20
 from hypothesis import settings
 
 WEEK = 86400 * 7
@@ -135,3 +137,157 @@ def test_reward_remaining(alice, bob, charlie, child_gauge, reward_token, lp_tok
 
     child_gauge.recover_remaining(reward_token, {"from": charlie})
     assert reward_token.balanceOf(bob) == remaining
+
+
+def test_finished_streams_skipped(alice, bob, chain, child_gauge, lp_token):
+    lp_token._mint_for_testing(alice, 10**21, {"from": alice})
+    lp_token.approve(child_gauge, 10**21, {"from": alice})
+    child_gauge.deposit(10**21, {"from": alice})
+
+    tokens = []
+    for i in range(8):
+        token = ERC20(f"Reward {i}", f"R{i}", 18, deployer=alice)
+        token._mint_for_testing(bob, 10**20, {"from": alice})
+        token.approve(child_gauge, 10**20, {"from": bob})
+        child_gauge.add_reward(token, bob, {"from": alice})
+        child_gauge.deposit_reward_token(token, 10**20, {"from": bob})
+        tokens.append(token)
+
+    chain.sleep(2 * WEEK)
+    pending = child_gauge.withdraw(1, {"from": alice})
+    child_gauge.claim_rewards({"from": alice})
+    settled = child_gauge.withdraw(1, {"from": alice})
+
+    # every stream is over and fully claimed, none of them is loaded again
+    assert settled.gas_used < pending.gas_used - 8 * 5000
+    for token in tokens:
+        assert child_gauge.claimable_reward(alice, token) == 0
+
+    # funding a stream again brings it back for settled users
+    tokens[3]._mint_for_testing(bob, 10**20, {"from": alice})
+    tokens[3].approve(child_gauge, 10**20, {"from": bob})
+    child_gauge.deposit_reward_token(tokens[3], 10**20, {"from": bob})
+    chain.sleep(2 * WEEK)
+
+    balance = tokens[3].balanceOf(alice)
+    child_gauge.claim_rewards({"from": alice})
+    assert tokens[3].balanceOf(alice) - balance > 10**20 * 999 // 1000
+
+
+def test_queue_reward_epochs(alice, bob, chain, child_gauge, reward_token, lp_token):
+    lp_token._mint_for_testing(alice, 10**21, {"from": alice})
+    lp_token.approve(child_gauge, 10**21, {"from": alice})
+    child_gauge.deposit(10**21, {"from": alice})
+
+    amounts = [10**20, 3 * 10**20, 2 * 10**20]
+    reward_token._mint_for_testing(bob, sum(amounts), {"from": bob})
+    reward_token.approve(child_gauge, sum(amounts), {"from": bob})
+    child_gauge.add_reward(reward_token, bob, {"from": alice})
+    tx = child_gauge.queue_reward_epochs(
+        reward_token, amounts, [WEEK, 2 * WEEK, WEEK], {"from": bob}
+    )
+
+    # the stream was not running, the first epoch starts right away
+    start = tx.timestamp
+    assert child_gauge.reward_data(reward_token)["period_finish"] == start + WEEK
+    assert child_gauge.queued_reward_epochs(reward_token) == [
+        (3 * 10**20, 2 * WEEK),
+        (2 * 10**20, WEEK),
+    ]
+
+    chain.sleep(WEEK + 3600)
+    child_gauge.claim_rewards({"from": alice})
+
+    # the second epoch started when the first one finished
+    reward_data = child_gauge.reward_data(reward_token)
+    assert reward_data["period_finish"] == start + 3 * WEEK
+    assert reward_data["rate"] == pytest.approx(3 * 10**20 // (2 * WEEK))
+    assert child_gauge.queued_reward_epochs(reward_token) == [(2 * 10**20, WEEK)]
+
+    chain.sleep(4 * WEEK)
+    child_gauge.claim_rewards({"from": alice})
+
+    assert child_gauge.queued_reward_epochs(reward_token) == []
+    assert reward_token.balanceOf(alice) + child_gauge.reward_remaining(reward_token) == sum(
+        amounts
+    )
+    assert child_gauge.reward_remaining(reward_token) < 10**4
+
+
+def test_queued_epochs_match_weekly_deposits(alice, bob, chain, child_gauge, lp_token):
+    lp_token._mint_for_testing(alice, 10**21, {"from": alice})
+    lp_token.approve(child_gauge, 10**21, {"from": alice})
+    child_gauge.deposit(10**21, {"from": alice})
+
+    queued, weekly = [ERC20(f"Reward {i}", f"R{i}", 18, deployer=alice) for i in range(2)]
+    for token in (queued, weekly):
+        token._mint_for_testing(bob, 10**21, {"from": alice})
+        token.approve(child_gauge, 2**256 - 1, {"from": bob})
+        child_gauge.add_reward(token, bob, {"from": alice})
+
+    amounts = [10**20, 4 * 10**20, 2 * 10**20]
+    child_gauge.queue_reward_epochs(queued, amounts, [WEEK] * 3, {"from": bob})
+    child_gauge.deposit_reward_token(weekly, amounts[0], {"from": bob})
+    chain.mine(timedelta=WEEK)
+    for amount in amounts[1:]:
+        child_gauge.deposit_reward_token(weekly, amount, {"from": bob})
+        assert child_gauge.claimable_reward(alice, queued) == pytest.approx(
+            child_gauge.claimable_reward(alice, weekly), rel=1e-4
+        )
+        chain.mine(timedelta=WEEK)
+
+    child_gauge.claim_rewards({"from": alice})
+    assert queued.balanceOf(alice) == pytest.approx(weekly.balanceOf(alice), rel=1e-4)
+
+
+def test_queue_reward_epochs_guarded(alice, bob, child_gauge, reward_token):
+    child_gauge.add_reward(reward_token, bob, {"from": alice})
+
+    with brownie.reverts():
+        child_gauge.queue_reward_epochs(reward_token, [0], [WEEK], {"from": alice})
+    with brownie.reverts():
+        child_gauge.queue_reward_epochs(reward_token, [0, 0], [WEEK], {"from": bob})
+    with brownie.reverts("Epoch duration"):
+        child_gauge.queue_reward_epochs(reward_token, [0], [WEEK * 4 * 12 + 1], {"from": bob})
+
+    # the first epoch starts right away, leaving 15 in the queue
+    child_gauge.queue_reward_epochs(reward_token, [0] * 16, [WEEK] * 16, {"from": bob})
+    with brownie.reverts():
+        child_gauge.queue_reward_epochs(reward_token, [0] * 2, [WEEK] * 2, {"from": bob})
+
+
+def test_queue_reward_epochs_overflow(alice, bob, child_gauge, reward_token):
+    child_gauge.add_reward(reward_token, bob, {"from": alice})
+    reward_token._mint_for_testing(bob, 2**130, {"from": bob})
+    reward_token.approve(child_gauge, 2**256 - 1, {"from": bob})
+
+    # epochs are added to what is left of the stream, which must fit in 128 bits
+    with brownie.reverts():
+        child_gauge.queue_reward_epochs(reward_token, [2**127] * 2, [WEEK] * 2, {"from": bob})
+
+    child_gauge.queue_reward_epochs(reward_token, [2**127 - 1] * 2, [WEEK] * 2, {"from": bob})
+    with brownie.reverts():
+        child_gauge.queue_reward_epochs(reward_token, [2], [WEEK], {"from": bob})
+    with brownie.reverts():
+        child_gauge.deposit_reward_token(reward_token, 2, {"from": bob})
+
+
+def test_claimable_reward_across_epochs(alice, bob, chain, child_gauge, reward_token, lp_token):
+    lp_token._mint_for_testing(alice, 10**21 + 3, {"from": alice})
+    lp_token.approve(child_gauge, 2**256 - 1, {"from": alice})
+    child_gauge.deposit(10**21 + 3, {"from": alice})
+
+    reward_token._mint_for_testing(bob, 10**22, {"from": bob})
+    reward_token.approve(child_gauge, 2**256 - 1, {"from": bob})
+    child_gauge.add_reward(reward_token, bob, {"from": alice})
+    child_gauge.deposit_reward_token(reward_token, 10**21 + 11, {"from": bob})
+    child_gauge.queue_reward_epochs(
+        reward_token, [10**21 + 7, 3 * 10**21 + 13], [WEEK + 5, 5 * 86400], {"from": bob}
+    )
+
+    # every epoch starts with what is left of the previous one, without a checkpoint in between
+    chain.mine(timedelta=4 * WEEK)
+    claimable = child_gauge.claimable_reward(alice, reward_token)
+    child_gauge.claim_rewards({"from": alice})
+
+    assert reward_token.balanceOf(alice) == claimable
@@ -49,3 +49,47 @@ def test_new_root(alice, bob, charlie, child_gauge_factory):
 
     assert child_gauge_factory.root_factory() == ZERO_ADDRESS
     assert child_gauge_factory.root_implementation() == ZERO_ADDRESS
+
+
+def test_set_clone_blueprint(alice, child_gauge_factory, clone_blueprint):
+    tx = child_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+
+    assert child_gauge_factory.clone_blueprint() == clone_blueprint
+    assert tx.events["UpdateCloneBlueprint"].values() == [ZERO_ADDRESS, clone_blueprint]
+
+    child_gauge_factory.set_clone_blueprint(ZERO_ADDRESS, {"from": alice})
+    assert child_gauge_factory.clone_blueprint() == ZERO_ADDRESS
+
+
+def test_set_clone_blueprint_guarded(
+    alice, bob, child_gauge_factory, child_gauge_impl, clone_blueprint
+):
+    with brownie.reverts():
+        child_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": bob})
+
+    with brownie.reverts("dev: invalid blueprint"):
+        child_gauge_factory.set_clone_blueprint(child_gauge_impl, {"from": alice})
+
+
+def test_set_root_clone_args(alice, bob, charlie, child_gauge_factory):
+    child_gauge_factory.set_manager(bob, {"from": alice})
+
+    child_gauge_factory.set_root_clone_args(True, {"from": alice})  # owner
+    child_gauge_factory.set_root_clone_args(True, {"from": bob})  # manager
+
+    with brownie.reverts():
+        child_gauge_factory.set_root_clone_args(False, {"from": charlie})
+
+    assert child_gauge_factory.root_clone_args()
+
+
+def test_set_split_emission_requests(alice, bob, charlie, child_gauge_factory):
+    child_gauge_factory.set_manager(bob, {"from": alice})
+
+    child_gauge_factory.set_split_emission_requests(True, {"from": alice})  # owner
+    child_gauge_factory.set_split_emission_requests(True, {"from": bob})  # manager
+
+    with brownie.reverts():
+        child_gauge_factory.set_split_emission_requests(False, {"from": charlie})
+
+    assert child_gauge_factory.split_emission_requests()
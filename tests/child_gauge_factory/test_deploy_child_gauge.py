@@ -71,3 +71,89 @@ def test_deploy_child_gauge_repeat_salt(alice, child_gauge_factory, lp_token):
 
     with brownie.reverts():
         child_gauge_factory.deploy_gauge(ETH_ADDRESS, 0x0, {"from": alice})
+
+
+def test_deploy_child_gauge_clone_args(
+    alice,
+    chain,
+    child_gauge_factory,
+    child_gauge_impl,
+    clone_blueprint,
+    lp_token,
+    clone_init_code,
+    create2_address_of,
+    web3,
+    ChildGauge,
+):
+    child_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+    salt = encode(["(uint256,bytes32)"], [(chain.id, (0).to_bytes(32, "big"))])
+    expected = create2_address_of(
+        child_gauge_factory.address, web3.keccak(salt), clone_init_code(child_gauge_impl.address)
+    )
+
+    tx = child_gauge_factory.deploy_gauge(lp_token, 0x0, {"from": alice})
+    gauge = ChildGauge.at(tx.return_value)
+
+    assert tx.return_value == expected
+    # EIP1167 runtime followed by the LP token
+    assert web3.eth.get_code(expected)[45:] == encode(["address"], [lp_token.address])
+    assert gauge.lp_token() == lp_token
+    assert child_gauge_factory.clone_args() == ZERO_ADDRESS
+
+    # the LP token is not in storage, initialization is guarded by the first checkpoint
+    with brownie.reverts():
+        gauge.initialize(alice, alice, alice, {"from": alice})
+
+
+def test_deploy_child_gauges(
+    alice,
+    chain,
+    child_gauge_factory,
+    child_gauge_impl,
+    root_gauge_factory,
+    root_gauge_impl,
+    lp_token,
+    reward_token,
+    ChildGauge,
+):
+    params = [(lp_token, 0x0, alice), (reward_token, 0x1, alice)]
+
+    tx = child_gauge_factory.deploy_gauges(params, {"from": alice})
+    gauges = tx.return_value
+
+    assert len(gauges) == 2
+    assert child_gauge_factory.get_gauge_count() == 2
+    assert [child_gauge_factory.get_gauge(i) for i in range(2)] == gauges
+    for gauge, (token, salt, _) in zip(gauges, params):
+        assert child_gauge_factory.get_gauge_from_lp_token(token) == gauge
+        assert ChildGauge.at(gauge).root_gauge() == root_gauge_factory.deploy_gauge.call(
+            chain.id, salt, {"from": alice}
+        )
+
+
+def test_get_gauges(alice, bob, child_gauge_factory, lp_token, reward_token):
+    tokens = [lp_token, reward_token, lp_token]
+    gauges = [
+        child_gauge_factory.deploy_gauge(token, salt, bob, {"from": alice}).return_value
+        for salt, token in enumerate(tokens)
+    ]
+
+    expected = [(gauge, token, bob, 1) for gauge, token in zip(gauges, tokens)]
+    assert child_gauge_factory.get_gauges(0, 10) == expected
+    assert child_gauge_factory.get_gauges(1, 1) == expected[1:2]
+    assert child_gauge_factory.get_gauges(3, 10) == []
+
+
+def test_get_lp_token_gauges(alice, child_gauge_factory, lp_token):
+    gauges = [
+        child_gauge_factory.deploy_gauge(lp_token, salt, {"from": alice}).return_value
+        for salt in range(3)
+    ]
+
+    # replaced gauges are kept in the history of the LP token
+    assert child_gauge_factory.get_gauge_from_lp_token(lp_token) == gauges[-1]
+    assert child_gauge_factory.get_lp_token_gauge_count(lp_token) == 3
+    assert [child_gauge_factory.get_lp_token_gauge(lp_token, i) for i in range(3)] == gauges
+    page = child_gauge_factory.get_lp_token_gauges(lp_token, 1, 10)
+    assert [info[0] for info in page] == gauges[1:]
+    assert child_gauge_factory.get_lp_token_gauges(ETH_ADDRESS, 0, 10) == []
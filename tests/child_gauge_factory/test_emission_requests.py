@@ -0,0 +1,172 @@
+import pytest
+from brownie import ChildGauge, Contract, compile_source
+from brownie.convert import to_address
+from brownie_tokens import ERC20
+from eth_abi import decode
+
+WEEK = 86400 * 7
+MAX_EMISSION_REQUESTS = 29
+MAX_MINT = 32
+ANYCALL_SIG = "anyCall(address,bytes,address,uint256)"
+
+
+# unlike `MockBridger`, allows bridging many gauges in one call
+BRIDGER_SRC = """
+cost: public(uint256)
+
+@external
+def bridge(_token: address, _to: address, _amount: uint256):
+    pass
+
+@view
+@external
+def check(_addr: address) -> bool:
+    return True
+"""
+
+
+@pytest.fixture(scope="module")
+def batched_bridger(alice):
+    return compile_source(BRIDGER_SRC, vyper_version="0.3.1").Vyper.deploy({"from": alice})
+
+
+def _deploy_child_gauges(alice, child_gauge_factory, count):
+    gauges = []
+    for i in range(count):
+        lp_token = ERC20(f"LP {i}", f"LP{i}", 18, deployer=alice)
+        tx = child_gauge_factory.deploy_gauge(lp_token, i + 1, {"from": alice})
+        child_gauge_factory.set_mirrored(tx.return_value, True, {"from": alice})
+        gauges.append(Contract.from_abi("Child Gauge", tx.return_value, ChildGauge.abi))
+    return gauges
+
+
+def _decode_gauges(data):
+    assert data[:4] == bytes.fromhex("d344d065")  # transmit_emissions_many(address[])
+    return [to_address(gauge) for gauge in decode(["address[]"], data[4:])[0]]
+
+
+def _anycalls(tx):
+    return [s for s in tx.subcalls if s.get("function") == ANYCALL_SIG]
+
+
+def test_single_request_sent_immediately(alice, child_gauge_factory):
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 1)
+
+    tx = child_gauge_factory.mint(gauges[0], {"from": alice})
+
+    # requests never wait for a later transaction, even within the same week
+    assert len(_anycalls(tx)) == 1
+    assert _decode_gauges(tx.events["AnyCall"]["data"]) == gauges
+
+    tx = child_gauge_factory.mint(gauges[0], {"from": alice})
+    assert len(_anycalls(tx)) == 0
+
+
+def test_mint_many_sends_single_message(alice, child_gauge_factory):
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 3)
+
+    tx = child_gauge_factory.mint_many(gauges, {"from": alice})
+
+    assert len(_anycalls(tx)) == 1
+    event = tx.events["AnyCall"]
+    assert event["to"] == child_gauge_factory
+    assert _decode_gauges(event["data"]) == gauges
+
+
+def test_claim_many_sends_single_message(alice, child_gauge_factory):
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 3)
+
+    tx = child_gauge_factory.claim_many(gauges, {"from": alice})
+
+    assert len(_anycalls(tx)) == 1
+    assert _decode_gauges(tx.events["AnyCall"]["data"]) == gauges
+
+
+def test_split_when_full(alice, child_gauge_factory):
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, MAX_MINT)
+
+    tx = child_gauge_factory.mint_many(gauges, {"from": alice})
+
+    assert len(_anycalls(tx)) == 2
+    assert [_decode_gauges(e["data"]) for e in tx.events["AnyCall"]] == [
+        gauges[:MAX_EMISSION_REQUESTS],
+        gauges[MAX_EMISSION_REQUESTS:],
+    ]
+
+
+def test_only_new_requests_sent(alice, child_gauge_factory):
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 3)
+    child_gauge_factory.mint(gauges[1], {"from": alice})
+
+    tx = child_gauge_factory.mint_many(gauges, {"from": alice})
+
+    assert _decode_gauges(tx.events["AnyCall"]["data"]) == [gauges[0], gauges[2]]
+
+
+def test_relay_transmits_emissions(
+    alice,
+    chain,
+    child_gauge_factory,
+    child_gauge_impl,
+    root_gauge_factory,
+    root_gauge_controller,
+    batched_bridger,
+):
+    root_gauge_factory.set_child(
+        chain.id, batched_bridger, child_gauge_factory, child_gauge_impl, {"from": alice}
+    )
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauges = []
+    for i in range(3):
+        tx = root_gauge_factory.deploy_gauge(chain.id, i + 1, {"from": alice})
+        root_gauge_controller.add_gauge(tx.return_value, 0, 10**18, {"from": alice})
+        root_gauges.append(tx.return_value)
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 3)
+    assert [gauge.root_gauge() for gauge in gauges] == root_gauges
+
+    chain.mine(timedelta=3 * WEEK)
+    data = child_gauge_factory.mint_many(gauges, {"from": alice}).events["AnyCall"]["data"]
+
+    assert _decode_gauges(data) == gauges
+
+    # gauges share their address across chains, locally relay to the root counterparts
+    tx = root_gauge_factory.transmit_emissions_many(root_gauges, {"from": alice})
+
+    bridged = [
+        s["inputs"]["_to"]
+        for s in tx.subcalls
+        if s["to"] == batched_bridger and s.get("function") == "bridge(address,address,uint256)"
+    ]
+    assert bridged == gauges
+
+
+def test_split_requests_for_single_transfer_bridgers(
+    alice,
+    chain,
+    child_gauge_factory,
+    root_gauge_factory,
+    root_gauge_controller,
+    mock_bridger,
+):
+    # `mock_bridger` only bridges for tx.origin, a batch relayed at once bridges a single gauge
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauges = []
+    for i in range(3):
+        tx = root_gauge_factory.deploy_gauge(chain.id, i + 1, {"from": alice})
+        root_gauge_controller.add_gauge(tx.return_value, 0, 10**18, {"from": alice})
+        root_gauges.append(tx.return_value)
+    gauges = _deploy_child_gauges(alice, child_gauge_factory, 3)
+    chain.mine(timedelta=3 * WEEK)
+
+    child_gauge_factory.set_split_emission_requests(True, {"from": alice})
+    tx = child_gauge_factory.mint_many(gauges, {"from": alice})
+
+    assert len(_anycalls(tx)) == len(gauges)
+    for event, gauge, root_gauge in zip(tx.events["AnyCall"], gauges, root_gauges):
+        assert event["data"][:4] == bytes.fromhex("11bfb956")  # transmit_emissions(address)
+        assert to_address(decode(["address"], event["data"][4:])[0]) == gauge
+
+        # every message is relayed in its own transaction
+        relay = root_gauge_factory.transmit_emissions(root_gauge, {"from": alice})
+        assert relay.subcalls[-1]["to"] == mock_bridger
+        assert relay.subcalls[-1]["inputs"]["_to"] == gauge
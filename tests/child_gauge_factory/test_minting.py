@@ -1,6 +1,8 @@
 import math
 
 import pytest
+from brownie import ZERO_ADDRESS, ChildGauge, Contract
+from brownie_tokens import ERC20
 
 WEEK = 86400 * 7
 
@@ -20,7 +22,7 @@ def test_inflation_rate_increases(alice, chain, child_gauge, child_crv_token, ch
     child_crv_token._mint_for_testing(child_gauge, 10**24, {"from": alice})
 
     # check balance is forwarded to minter
-    child_gauge.user_checkpoint(alice, {"from": alice})
+    child_gauge.notify_emissions({"from": alice})
     assert child_crv_token.balanceOf(child_gauge) == 0
     assert child_crv_token.balanceOf(child_gauge_factory) == 10**24
 
@@ -35,6 +37,7 @@ def test_request_only_once_a_week(alice, child_gauge, child_gauge_factory):
     sig = "anyCall(address,bytes,address,uint256)"
     tx = child_gauge_factory.mint(child_gauge, {"from": alice})
     assert sig in {s.get("function") for s in tx.subcalls}
+    assert child_gauge_factory.last_request(child_gauge) == tx.timestamp
 
     tx = child_gauge_factory.mint(child_gauge, {"from": alice})
     assert sig not in {s.get("function") for s in tx.subcalls}
@@ -49,3 +52,68 @@ def test_request_only_if_has_counterpart(alice, child_gauge, child_gauge_factory
     child_gauge_factory.set_mirrored(child_gauge, True, {"from": alice})
     tx = child_gauge_factory.mint(child_gauge, {"from": alice})
     assert sig in {s.get("function") for s in tx.subcalls}
+
+
+def test_mint_many_single_transfer(alice, chain, child_gauge, child_crv_token, child_gauge_factory):
+    gauges = [child_gauge]
+    for i in range(2):
+        lp_token = ERC20(f"LP {i}", f"LP{i}", 18, deployer=alice)
+        tx = child_gauge_factory.deploy_gauge(lp_token, i + 1, {"from": alice})
+        gauges.append(Contract.from_abi("Child Gauge", tx.return_value, ChildGauge.abi))
+        lp_token._mint_for_testing(alice, 10**21, {"from": alice})
+        lp_token.approve(gauges[-1], 10**21, {"from": alice})
+    for gauge in gauges:
+        gauge.deposit(10**21, {"from": alice})
+
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    for gauge in gauges:
+        child_crv_token._mint_for_testing(gauge, 10**24, {"from": alice})
+        gauge.notify_emissions({"from": alice})
+    chain.sleep(WEEK)
+
+    tx = child_gauge_factory.mint_many(
+        [gauges[0], ZERO_ADDRESS, gauges[1], gauges[2]], {"from": alice}
+    )
+
+    minted = [child_gauge_factory.minted(alice, gauge) for gauge in gauges]
+    assert [e["_gauge"] for e in tx.events["Minted"]] == gauges
+    assert [e["_new_total"] for e in tx.events["Minted"]] == minted
+    assert len([e for e in tx.events["Transfer"] if e.address == child_crv_token]) == 1
+    assert child_crv_token.balanceOf(alice) == sum(minted)
+    assert math.isclose(sum(minted), 3 * 10**24)
+
+
+def test_claim_many(alice, bob, chain, child_gauge, child_crv_token, child_gauge_factory):
+    gauges = [child_gauge]
+    lp_token = ERC20("LP", "LP", 18, deployer=alice)
+    tx = child_gauge_factory.deploy_gauge(lp_token, 1, {"from": alice})
+    gauges.append(Contract.from_abi("Child Gauge", tx.return_value, ChildGauge.abi))
+    lp_token._mint_for_testing(alice, 10**21, {"from": alice})
+    lp_token.approve(gauges[1], 10**21, {"from": alice})
+
+    reward_tokens = []
+    for gauge in gauges:
+        gauge.deposit(10**21, {"from": alice})
+        token = ERC20("Reward", "RWD", 18, deployer=alice)
+        token._mint_for_testing(alice, 10**20, {"from": alice})
+        token.approve(gauge, 10**20, {"from": alice})
+        gauge.add_reward(token, alice, {"from": alice})
+        gauge.deposit_reward_token(token, 10**20, {"from": alice})
+        reward_tokens.append(token)
+    gauges[1].set_rewards_receiver(bob, {"from": alice})
+
+    chain.mine(timestamp=(chain.time() // WEEK) * WEEK + WEEK + 86400)
+    for gauge in gauges:
+        child_crv_token._mint_for_testing(gauge, 10**24, {"from": alice})
+        gauge.notify_emissions({"from": alice})
+    chain.sleep(WEEK)
+
+    child_gauge_factory.claim_many(gauges, {"from": alice})
+
+    minted = [child_gauge_factory.minted(alice, gauge) for gauge in gauges]
+    assert child_crv_token.balanceOf(alice) == sum(minted)
+    assert math.isclose(sum(minted), 2 * 10**24)
+    # rewards follow the default receiver of each gauge
+    assert math.isclose(reward_tokens[0].balanceOf(alice), 10**20)
+    assert math.isclose(reward_tokens[1].balanceOf(bob), 10**20)
+    assert reward_tokens[1].balanceOf(alice) == 0
@@ -1,6 +1,9 @@
 import pytest
 from brownie import Contract
 from brownie_tokens import ERC20
+from hexbytes import HexBytes
+
+from .functions import CLONE_INITCODE
 
 # ANYCALL DEPLOYMENT
 
@@ -58,11 +61,36 @@ def child_gauge(alice, child_gauge_impl, child_gauge_factory, lp_token, ChildGau
     return Contract.from_abi("Child Gauge", gauge_addr, ChildGauge.abi)
 
 
+@pytest.fixture(scope="module")
+def mock_voting_escrow(alice, MockVotingEscrow):
+    return MockVotingEscrow.deploy({"from": alice})
+
+
 @pytest.fixture(scope="module")
 def reward_forwarder(child_gauge, alice, RewardForwarder):
     return RewardForwarder.deploy(child_gauge, {"from": alice})
 
 
+@pytest.fixture(scope="module")
+def multi_reward_forwarder(alice, MultiRewardForwarder):
+    return MultiRewardForwarder.deploy(alice, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def proxy_admin(alice, bob, ProxyAdmin):
+    return ProxyAdmin.deploy([alice, bob], {"from": alice})
+
+
+# CLONE BLUEPRINT DEPLOYMENT (SHARED BY BOTH CHAINS)
+
+
+@pytest.fixture(scope="module")
+def clone_blueprint(alice):
+    blueprint = HexBytes("0xfe7100") + CLONE_INITCODE
+    deploy_code = HexBytes(f"0x61{len(blueprint):04x}3d81600a3d39f3") + blueprint
+    return alice.transfer(data=deploy_code).contract_address
+
+
 # ROOT CHAIN DAO
 
 
@@ -2,6 +2,13 @@ import pytest
 from brownie.convert import to_address
 from hexbytes import HexBytes
 
+# initcode of immutable-args clones, followed by the implementation address
+CLONE_INITCODE = HexBytes(
+    "0x63a51db7ff60e01b6000526000600060046000335afa1560575769363d3d373d3d3d363d7360b01b6000526e"
+    "5af43d82803e903d91602b57fd5bf360881b601e52601460143803600a393d6000602d3e3d602d016000f35b"
+    "600080fd"
+)
+
 
 @pytest.fixture
 def keccak(web3):
@@ -27,6 +34,23 @@ def vyper_proxy_init_code():
     return _f
 
 
+@pytest.fixture
+def clone_init_code():
+    """Calculate the initcode used by the gauge factories to deploy immutable-args clones.
+
+    The initcode fetches the args from `clone_args()` of the factory, and returns
+    the EIP1167 runtime with the args appended.
+
+    Arguments:
+        _target: The target implementation address
+    """
+
+    def _f(_target):
+        return HexBytes(CLONE_INITCODE + HexBytes(_target))
+
+    return _f
+
+
 @pytest.fixture
 def create2_address_of(keccak):
     """Calculate the CREATE2 deployment address of a contract.
@@ -11,10 +11,13 @@ def crv_token(alice):
 
 
 def test_arbitrum_bridger(alice, crv_token, ArbitrumBridger):
-    gas_limit, gas_price, submission_cost = 1_000_000, 2 * 10**9, 10**13
-    bridger = ArbitrumBridger.deploy(gas_limit, gas_price, submission_cost, {"from": alice})
+    gateway_router = "0x72Ce9c846789fdB6fC1f34aC4AD25Dd9ef7031ef"
+    gas_limit, gas_price, submission_margin = 1_000_000, 2 * 10**9, 12_500
+    bridger = ArbitrumBridger.deploy(
+        crv_token, gateway_router, gas_limit, gas_price, submission_margin, alice, {"from": alice}
+    )
 
-    assert bridger.cost() == gas_limit * gas_price + submission_cost
+    assert bridger.cost() == gas_limit * gas_price + bridger.max_submission_cost()
     assert bridger.check(alice) is True
 
     crv_token.approve(bridger, 2**256 - 1, {"from": alice})
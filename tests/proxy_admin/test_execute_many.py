@@ -0,0 +1,65 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS, Contract
+
+
+@pytest.fixture(scope="module", autouse=True)
+def transfer_factory_ownership_to_proxy_admin(alice, child_gauge_factory, proxy_admin):
+    child_gauge_factory.commit_transfer_ownership(proxy_admin, {"from": alice})
+    calldata = child_gauge_factory.accept_transfer_ownership.encode_input()
+    proxy_admin.execute(child_gauge_factory, calldata, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def gauges(alice, child_gauge_factory, lp_token, ChildGauge):
+    gauges = []
+    for i in range(4):
+        tx = child_gauge_factory.deploy_gauge(lp_token, i, {"from": alice})
+        gauges.append(Contract.from_abi("Child Gauge", tx.return_value, ChildGauge.abi))
+    return gauges
+
+
+def test_execute_many(alice, bob, chain, gauges, proxy_admin):
+    transactions = [(gauge, gauge.set_killed.encode_input(True), 0) for gauge in gauges]
+
+    for acct in [alice, bob]:
+        tx = proxy_admin.execute_many(transactions, {"from": acct})
+
+        assert all(gauge.is_killed() for gauge in gauges)
+        assert len(tx.events["TransactionExecuted"]) == len(gauges)
+        chain.undo()
+
+
+def test_execute_many_forwards_value(alice, charlie, proxy_admin):
+    balance = charlie.balance()
+    transactions = [(charlie, b"", 10**18), (ETH_ADDRESS, b"", 2 * 10**18)]
+    proxy_admin.execute_many(transactions, {"from": alice, "value": 3 * 10**18})
+
+    assert charlie.balance() == balance + 10**18
+    assert proxy_admin.balance() == 0
+
+
+def test_execute_many_invalid_value(alice, charlie, proxy_admin):
+    transactions = [(charlie, b"", 10**18)]
+
+    for value in [0, 2 * 10**18]:
+        with brownie.reverts("dev: invalid value"):
+            proxy_admin.execute_many(transactions, {"from": alice, "value": value})
+
+
+def test_execute_many_reverts_for_unauthorised_users(charlie, gauges, proxy_admin):
+    transactions = [(gauge, gauge.set_killed.encode_input(True), 0) for gauge in gauges]
+
+    with brownie.reverts("dev: only admin"):
+        proxy_admin.execute_many(transactions, {"from": charlie})
+
+
+def test_execute_many_is_atomic(alice, gauges, proxy_admin):
+    transactions = [(gauge, gauge.set_killed.encode_input(True), 0) for gauge in gauges]
+    # the proxy admin holds no gauge tokens, the last call fails
+    transactions.append((gauges[0], gauges[0].transfer.encode_input(alice, 1), 0))
+
+    with brownie.reverts():
+        proxy_admin.execute_many(transactions, {"from": alice})
+
+    assert not any(gauge.is_killed() for gauge in gauges)
@@ -0,0 +1,79 @@
+import brownie
+import pytest
+from brownie import ChildGauge
+from brownie_tokens import ERC20
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def gauges(alice, child_gauge, child_gauge_factory, lp_token):
+    gauges = [child_gauge]
+    for i in range(1, 3):
+        tx = child_gauge_factory.deploy_gauge(lp_token, i, {"from": alice})
+        gauges.append(ChildGauge.at(tx.return_value))
+    return gauges
+
+
+@pytest.fixture(scope="module")
+def reward_tokens(alice, multi_reward_forwarder):
+    tokens = [ERC20(f"Reward {i}", f"R{i}", 18, deployer=alice) for i in range(2)]
+    for token in tokens:
+        token._mint_for_testing(multi_reward_forwarder, 10**22, {"from": alice})
+    return tokens
+
+
+@pytest.fixture(scope="module")
+def routes(alice, gauges, reward_tokens, multi_reward_forwarder):
+    routes = [(gauge, token) for gauge in gauges for token in reward_tokens]
+    for gauge, token in routes:
+        gauge.add_reward(token, multi_reward_forwarder, {"from": alice})
+    return routes
+
+
+def test_deposit_reward_tokens(alice, multi_reward_forwarder, routes):
+    multi_reward_forwarder.allow(routes, {"from": alice})
+    deposits = [
+        (gauge, token, 10**20 * (i + 1), 2 * WEEK) for i, (gauge, token) in enumerate(routes)
+    ]
+
+    tx = multi_reward_forwarder.deposit_reward_tokens(deposits, {"from": alice})
+
+    for gauge, token, amount, epoch in deposits:
+        assert token.balanceOf(gauge) == amount
+        assert gauge.reward_data(token)["period_finish"] == tx.timestamp + epoch
+
+
+def test_deposit_reverts_without_allowance(alice, multi_reward_forwarder, routes):
+    multi_reward_forwarder.allow(routes[1:], {"from": alice})
+    gauge, token = routes[0]
+
+    with brownie.reverts():
+        multi_reward_forwarder.deposit_reward_tokens(
+            [(gauge, token, 10**20, WEEK)], {"from": alice}
+        )
+
+
+def test_deposit_reverts_for_unauthorised_caller(alice, bob, multi_reward_forwarder, routes):
+    multi_reward_forwarder.allow(routes, {"from": alice})
+    gauge, token = routes[0]
+
+    with brownie.reverts():
+        multi_reward_forwarder.deposit_reward_tokens(
+            [(gauge, token, 10**20, WEEK)], {"from": bob}
+        )
+
+
+def test_allow_reverts_for_unauthorised_caller(bob, multi_reward_forwarder, reward_tokens):
+    with brownie.reverts("dev: only owner"):
+        multi_reward_forwarder.allow([(bob, reward_tokens[0])], {"from": bob})
+
+    assert reward_tokens[0].allowance(multi_reward_forwarder, bob) == 0
+
+
+def test_recover(alice, bob, multi_reward_forwarder, reward_tokens):
+    multi_reward_forwarder.recover(reward_tokens[0], 10**20, bob, {"from": alice})
+
+    assert reward_tokens[0].balanceOf(bob) == 10**20
+    with brownie.reverts():
+        multi_reward_forwarder.recover(reward_tokens[0], 10**20, bob, {"from": bob})
@@ -82,3 +82,91 @@ def test_transmit_directly_fails(
 
     with brownie.reverts():
         root_gauge.transmit_emissions({"from": alice})
+
+
+def test_killed_checkpoint_skips_weights(alice, root_gauge, root_gauge_controller):
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauge_controller.add_gauge(root_gauge, 0, 10**18, {"from": alice})
+    root_gauge.set_killed(True, {"from": alice})
+
+    chain.mine(timedelta=10 * WEEK)
+    tx = root_gauge.user_checkpoint(alice, {"from": alice})
+
+    assert root_gauge.last_period() == tx.timestamp // WEEK
+    assert root_gauge.total_emissions() == 0
+    assert len(tx.subcalls) == 0
+
+
+def test_pending_emissions(alice, root_gauge, root_gauge_controller, mock_bridger):
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauge_controller.add_gauge(root_gauge, 0, 10**18, {"from": alice})
+    assert root_gauge.pending_emissions() == 0
+
+    chain.mine(timedelta=3 * WEEK)
+    pending = root_gauge.pending_emissions()
+    tx = root_gauge.transmit_emissions({"from": root_gauge.factory()})
+
+    assert pending > 0
+    assert tx.subcalls[-1]["inputs"]["_amount"] == pending
+
+
+def test_transmit_holds_below_min_bridge_amount(
+    alice, chain, root_gauge, root_gauge_factory, root_gauge_controller, root_crv_token
+):
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    root_gauge_controller.add_gauge(root_gauge, 0, 10**18, {"from": alice})
+
+    chain.mine(timedelta=3 * WEEK)
+    pending = root_gauge.pending_emissions()
+    root_gauge_factory.set_min_bridge_amount(chain.id, pending + 1, {"from": alice})
+    assert root_gauge_factory.bridge_shortfall(chain.id, 0, 1) == [1]
+
+    tx = root_gauge.transmit_emissions({"from": root_gauge_factory})
+
+    assert tx.return_value is False
+    assert tx.subcalls[-1]["function"] != "bridge(address,address,uint256)"
+    assert root_crv_token.balanceOf(root_gauge) == pending
+
+    root_gauge_factory.set_min_bridge_amount(chain.id, pending, {"from": alice})
+    assert root_gauge_factory.bridge_shortfall(chain.id, 0, 1) == [0]
+
+    tx = root_gauge.transmit_emissions({"from": root_gauge_factory})
+
+    assert tx.return_value is True
+    assert tx.subcalls[-1]["inputs"]["_amount"] == pending
+
+
+def test_transmit_clone_args(
+    alice,
+    chain,
+    root_gauge,
+    root_gauge_factory,
+    root_gauge_controller,
+    clone_blueprint,
+    mock_bridger,
+    RootGauge,
+):
+    root_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+    clone_gauge = RootGauge.at(
+        root_gauge_factory.deploy_gauge(chain.id, 0x1, {"from": alice}).return_value
+    )
+    assert clone_gauge.factory() == root_gauge_factory
+    assert clone_gauge.chain_id() == chain.id
+    with brownie.reverts():
+        clone_gauge.initialize(mock_bridger, chain.id, alice, {"from": alice})
+
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    for gauge in [root_gauge, clone_gauge]:
+        root_gauge_controller.add_gauge(gauge, 0, 10**18, {"from": alice})
+
+    chain.mine(timedelta=3 * WEEK)
+
+    gas_used = []
+    for gauge in [root_gauge, clone_gauge]:
+        tx = gauge.transmit_emissions({"from": root_gauge_factory})
+        assert tx.subcalls[-1]["to"] == mock_bridger
+        assert tx.subcalls[-1]["inputs"]["_to"] == gauge.child_gauge()
+        gas_used.append(tx.gas_used)
+
+    # clones read the factory and chain id from code instead of storage
+    assert gas_used[1] < gas_used[0]
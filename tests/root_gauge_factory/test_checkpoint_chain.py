@@ -0,0 +1,58 @@
+import pytest
+from brownie import RootGauge, chain
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def root_gauges(alice, root_gauge_factory, root_gauge_impl, root_gauge_controller):
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+    gauges = []
+    for i in range(3):
+        tx = root_gauge_factory.deploy_gauge(chain.id, i, {"from": alice})
+        root_gauge_controller.add_gauge(tx.return_value, 0, 10**18, {"from": alice})
+        gauges.append(RootGauge.at(tx.return_value))
+    return gauges
+
+
+def test_checkpoint_page(alice, root_gauge_factory, root_gauges):
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.checkpoint_chain(chain.id, 1, 5, {"from": alice})
+
+    current_period = tx.timestamp // WEEK
+    assert root_gauges[0].last_period() < current_period
+    assert [gauge.last_period() for gauge in root_gauges[1:]] == [current_period] * 2
+    assert root_gauges[1].total_emissions() == root_gauges[2].total_emissions() > 0
+
+
+def test_matches_single_checkpoint(alice, root_gauge_factory, root_gauges):
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.checkpoint_chain(chain.id, 0, 2, {"from": alice})
+    root_gauges[2].user_checkpoint(alice, {"from": alice})
+
+    assert root_gauges[2].last_period() == tx.timestamp // WEEK
+    assert [gauge.total_emissions() for gauge in root_gauges[:2]] == [
+        root_gauges[2].total_emissions()
+    ] * 2
+
+
+def test_pending_emissions_lens(alice, root_gauge_factory, root_gauges):
+    chain.mine(timedelta=3 * WEEK)
+
+    pending = root_gauge_factory.pending_emissions(chain.id, 0, 10)
+
+    assert pending == [gauge.pending_emissions() for gauge in root_gauges]
+    assert root_gauge_factory.pending_emissions(chain.id, 2, 10) == pending[2:]
+
+
+def test_checkpoint_many(alice, root_gauge_factory, root_gauges):
+    chain.mine(timedelta=3 * WEEK)
+    pending = root_gauge_factory.pending_emissions(chain.id, 0, 10)
+
+    tx = root_gauge_factory.checkpoint_many(root_gauges[::2], {"from": alice})
+
+    assert [root_gauges[i].total_emissions() for i in (0, 2)] == [pending[0], pending[2]]
+    assert root_gauges[0].last_period() == tx.timestamp // WEEK
+    assert root_gauges[1].total_emissions() == 0
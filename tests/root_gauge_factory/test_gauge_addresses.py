@@ -57,3 +57,49 @@ def test_gauge_address_chain_id(
     )
 
     assert root.child_gauge() == expected, "Bad child gauge calculation"
+
+
+def test_gauge_address_clone_args(
+    alice,
+    chain,
+    root_gauge_factory,
+    child_gauge_factory,
+    clone_blueprint,
+    lp_token,
+    child_gauge_impl,
+    RootGauge,
+    ChildGauge,
+):
+    for factory in [root_gauge_factory, child_gauge_factory]:
+        factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+    root_gauge_factory.set_child_clone_args(chain.id, True, {"from": alice})
+    child_gauge_factory.set_root_clone_args(True, {"from": alice})
+
+    child = Contract.from_abi(
+        "Child", child_gauge_factory.deploy_gauge(lp_token, SALT).return_value, abi=ChildGauge.abi
+    )
+    root = Contract.from_abi(
+        "Root",
+        root_gauge_factory.deploy_gauge(chain.id, SALT, {"from": alice}).return_value,
+        abi=RootGauge.abi,
+    )
+
+    assert child.root_gauge() == root, "Bad root gauge calculation"
+    assert root.child_gauge() == child, "Bad child gauge calculation"
+    assert root.factory() == root_gauge_factory
+    assert root.chain_id() == chain.id
+
+
+def test_predict_gauges(alice, chain, root_gauge_factory, child_gauge_factory, RootGauge):
+    salts = [i.to_bytes(32, "big") for i in range(4)]
+    predicted = root_gauge_factory.predict_gauges([(chain.id, salt) for salt in salts])
+
+    assert child_gauge_factory.predict_gauges(salts) == predicted
+    for salt, (root, child) in zip(salts, predicted):
+        gauge = Contract.from_abi(
+            "Root",
+            root_gauge_factory.deploy_gauge(chain.id, salt, {"from": alice}).return_value,
+            abi=RootGauge.abi,
+        )
+        assert gauge == root
+        assert gauge.child_gauge() == child
@@ -1,5 +1,5 @@
 import brownie
-from brownie import ETH_ADDRESS
+from brownie import ETH_ADDRESS, ZERO_ADDRESS
 
 
 def test_set_implementation(alice, root_gauge_impl, root_gauge_factory):
@@ -30,3 +30,55 @@ def test_set_child(alice, chain, root_gauge_factory):
 def test_set_child_updated(bob, chain, root_gauge_factory):
     with brownie.reverts():
         root_gauge_factory.set_child(chain.id, ETH_ADDRESS, ETH_ADDRESS, ETH_ADDRESS, {"from": bob})
+
+
+def test_set_min_bridge_amount(alice, chain, root_gauge_factory):
+    tx = root_gauge_factory.set_min_bridge_amount(chain.id, 10**18, {"from": alice})
+
+    assert root_gauge_factory.min_bridge_amount(chain.id) == 10**18
+    assert tx.events["UpdateMinBridgeAmount"].values() == [chain.id, 0, 10**18]
+
+
+def test_set_min_bridge_amount_guarded(bob, chain, root_gauge_factory):
+    with brownie.reverts():
+        root_gauge_factory.set_min_bridge_amount(chain.id, 10**18, {"from": bob})
+
+
+def test_set_clone_blueprint(alice, bob, root_gauge_factory, root_gauge_impl, clone_blueprint):
+    with brownie.reverts():
+        root_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": bob})
+    with brownie.reverts("dev: invalid blueprint"):
+        root_gauge_factory.set_clone_blueprint(root_gauge_impl, {"from": alice})
+
+    tx = root_gauge_factory.set_clone_blueprint(clone_blueprint, {"from": alice})
+
+    assert root_gauge_factory.clone_blueprint() == clone_blueprint
+    assert tx.events["UpdateCloneBlueprint"].values() == [ZERO_ADDRESS, clone_blueprint]
+
+
+def test_set_child_clone_args(alice, bob, chain, root_gauge_factory):
+    with brownie.reverts():
+        root_gauge_factory.set_child_clone_args(chain.id, True, {"from": bob})
+
+    tx = root_gauge_factory.set_child_clone_args(chain.id, True, {"from": alice})
+
+    assert root_gauge_factory.get_child_clone_args(chain.id)
+    assert tx.events["UpdateChildCloneArgs"].values() == [chain.id, True]
+
+
+def test_codehash_updated(
+    alice, chain, root_gauge_factory, root_gauge_impl, vyper_proxy_init_code, web3
+):
+    assert root_gauge_factory.gauge_codehash() == web3.keccak(
+        vyper_proxy_init_code(root_gauge_impl.address)
+    )
+
+    root_gauge_factory.set_child(chain.id, ETH_ADDRESS, ETH_ADDRESS, ETH_ADDRESS, {"from": alice})
+    assert root_gauge_factory.get_child_codehash(chain.id) == web3.keccak(
+        vyper_proxy_init_code(ETH_ADDRESS)
+    )
+
+    root_gauge_factory.set_child(chain.id, ETH_ADDRESS, ETH_ADDRESS, ZERO_ADDRESS, {"from": alice})
+    assert root_gauge_factory.get_child_codehash(chain.id) == b"\x00" * 32
+    with brownie.reverts():
+        root_gauge_factory.predict_gauges([(chain.id, 0x0)])
@@ -83,3 +83,80 @@ def test_deploy_gauge(alice, chain, root_gauge_factory, child_gauge_factory, moc
         "_to": root_gauge_factory.address,
         "_toChainID": chain.id,
     }
+
+
+def test_deploy_gauges(
+    alice,
+    chain,
+    root_gauge_factory,
+    root_gauge_impl,
+    vyper_proxy_init_code,
+    create2_address_of,
+    web3,
+):
+    params = [(chain.id, i, 10**17 * i) for i in range(3)]
+    expected = [
+        create2_address_of(
+            root_gauge_factory.address,
+            web3.keccak(encode(["(uint256,bytes32)"], [(chain.id, i.to_bytes(32, "big"))])),
+            vyper_proxy_init_code(root_gauge_impl.address),
+        )
+        for i in range(3)
+    ]
+
+    with brownie.reverts("dev: invalid value"):
+        root_gauge_factory.deploy_gauges(params, {"from": alice, "value": 10**17})
+
+    tx = root_gauge_factory.deploy_gauges(params, {"from": alice, "value": 3 * 10**17})
+
+    assert tx.return_value == expected
+    assert root_gauge_factory.get_gauge_count(chain.id) == 3
+    assert [root_gauge_factory.get_gauge(chain.id, i) for i in range(3)] == expected
+    assert [web3.eth.get_balance(gauge) for gauge in expected] == [0, 10**17, 2 * 10**17]
+    assert len(tx.events["DeployedGauge"]) == 3
+
+
+def test_deploy_child_gauges(
+    alice,
+    chain,
+    root_gauge_factory,
+    root_gauge_impl,
+    child_gauge_factory,
+    vyper_proxy_init_code,
+    create2_address_of,
+    web3,
+):
+    params = [(chain.id, ETH_ADDRESS, i, alice, 10**17 * i) for i in range(3)]
+
+    tx = root_gauge_factory.deploy_child_gauges(params, {"from": alice, "value": 3 * 10**17})
+
+    sig = "anyCall(address,bytes,address,uint256)"
+    assert [s["inputs"]["_data"] for s in tx.subcalls if s.get("function") == sig] == [
+        HexString(child_gauge_factory.deploy_gauge.encode_input(ETH_ADDRESS, i, alice), "bytes")
+        for i in range(3)
+    ]
+    for i, root in enumerate(tx.return_value):
+        salt = web3.keccak(encode(["(uint256,bytes32)"], [(chain.id, i.to_bytes(32, "big"))]))
+        assert root == create2_address_of(
+            root_gauge_factory.address, salt, vyper_proxy_init_code(root_gauge_impl.address)
+        )
+        assert web3.eth.get_balance(root) == 10**17 * i
+
+    # the root gauge deployed by the child gauge callback holds the prefunded ETH
+    gauge = root_gauge_factory.deploy_gauge(chain.id, 2, {"from": alice}).return_value
+    assert gauge == tx.return_value[2]
+    assert web3.eth.get_balance(gauge) == 2 * 10**17
+
+
+def test_get_gauges(alice, chain, root_gauge_factory):
+    gauges = [
+        root_gauge_factory.deploy_gauge(chain.id, salt, {"from": alice}).return_value
+        for salt in range(3)
+    ]
+    predicted = root_gauge_factory.predict_gauges([(chain.id, salt) for salt in range(3)])
+    children = [child for _, child in predicted]
+
+    expected = [(gauge, child, False) for gauge, child in zip(gauges, children)]
+    assert root_gauge_factory.get_gauges(chain.id, 0, 10) == expected
+    assert root_gauge_factory.get_gauges(chain.id, 1, 1) == expected[1:2]
+    assert root_gauge_factory.get_gauges(chain.id + 1, 0, 10) == []
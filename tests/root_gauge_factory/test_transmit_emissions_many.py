@@ -0,0 +1,165 @@
+import pytest
+from brownie import compile_source
+
+WEEK = 86400 * 7
+
+# bridger charging ETH for each transfer
+COSTLY_SRC = """
+cost: public(uint256)
+
+@external
+def __init__(_cost: uint256):
+    self.cost = _cost
+
+@payable
+@external
+def bridge(_token: address, _to: address, _amount: uint256):
+    assert msg.value == self.cost
+
+@view
+@external
+def check(_addr: address) -> bool:
+    return True
+"""
+
+
+# same check as `MultichainBridger`, which handles a single transfer per tx
+RESTRICTED_SRC = """
+cost: public(uint256)
+
+@external
+def bridge(_token: address, _to: address, _amount: uint256):
+    pass
+
+@view
+@external
+def check(_addr: address) -> bool:
+    return _addr == tx.origin
+"""
+
+
+@pytest.fixture(scope="module")
+def costly_bridger(alice):
+    return compile_source(COSTLY_SRC, vyper_version="0.3.1").Vyper.deploy(10**15, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def free_bridger(alice):
+    return compile_source(COSTLY_SRC, vyper_version="0.3.1").Vyper.deploy(0, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def restricted_bridger(alice):
+    return compile_source(RESTRICTED_SRC, vyper_version="0.3.1").Vyper.deploy({"from": alice})
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, root_gauge_controller):
+    root_gauge_controller.add_type("Test", 10**18, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def deploy_gauges(
+    alice,
+    chain,
+    root_gauge_factory,
+    root_gauge_controller,
+    child_gauge_factory,
+    child_gauge_impl,
+    RootGauge,
+):
+    salt = [0]
+
+    def deploy(bridger, emitting):
+        """Deploy a root gauge for each entry of `emitting`, voted for if True"""
+        root_gauge_factory.set_child(
+            chain.id, bridger, child_gauge_factory, child_gauge_impl, {"from": alice}
+        )
+        gauges = []
+        for is_emitting in emitting:
+            salt[0] += 1
+            tx = root_gauge_factory.deploy_gauge(chain.id, salt[0], {"from": alice})
+            gauge = RootGauge.at(tx.return_value)
+            if is_emitting:
+                root_gauge_controller.add_gauge(gauge, 0, 10**18, {"from": alice})
+            gauges.append(gauge)
+        return gauges
+
+    return deploy
+
+
+def test_outcome_per_gauge(alice, chain, root_gauge_factory, free_bridger, deploy_gauges):
+    # the gauge without weight has nothing to mint and fails
+    gauges = deploy_gauges(free_bridger, [True, False, True])
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.transmit_emissions_many(gauges, {"from": alice})
+
+    assert tx.return_value == [True, False, True]
+
+
+def test_invalid_gauges_skipped(alice, bob, chain, root_gauge_factory, free_bridger, deploy_gauges):
+    gauges = deploy_gauges(free_bridger, [True])
+    chain.mine(timedelta=3 * WEEK)
+    balance = bob.balance()
+
+    tx = root_gauge_factory.transmit_emissions_many(
+        [bob] + gauges, {"from": alice, "value": 10**18}
+    )
+
+    assert tx.return_value == [False, True]
+    assert bob.balance() == balance
+    assert root_gauge_factory.balance() == 0
+
+
+def test_top_up_and_refund(alice, chain, root_gauge_factory, costly_bridger, deploy_gauges):
+    gauges = deploy_gauges(costly_bridger, [True, True])
+    chain.mine(timedelta=3 * WEEK)
+    alice.transfer(gauges[1], 4 * 10**14)
+    balance = alice.balance()
+
+    tx = root_gauge_factory.transmit_emissions_many(gauges, {"from": alice, "value": 10**18})
+
+    assert tx.return_value == [True, True]
+    assert costly_bridger.balance() == 2 * 10**15
+    assert root_gauge_factory.balance() == 0
+    assert alice.balance() == balance - 16 * 10**14 - tx.gas_used * tx.gas_price
+
+
+def test_no_top_up_without_emissions(
+    alice, chain, root_gauge_factory, costly_bridger, deploy_gauges
+):
+    gauges = deploy_gauges(costly_bridger, [False, True])
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.transmit_emissions_many(gauges, {"from": alice, "value": 10**15})
+
+    # the gauge which can't bridge keeps no ETH, the value goes to the other one
+    assert tx.return_value == [False, True]
+    assert gauges[0].balance() == 0
+    assert costly_bridger.balance() == 10**15
+
+
+def test_insufficient_value_skips(alice, chain, root_gauge_factory, costly_bridger, deploy_gauges):
+    gauges = deploy_gauges(costly_bridger, [True, True])
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.transmit_emissions_many(gauges, {"from": alice, "value": 10**15 + 1})
+
+    # partial top ups are not sent, what is left is refunded
+    assert tx.return_value == [True, False]
+    assert gauges[1].balance() == 0
+    assert root_gauge_factory.balance() == 0
+
+
+def test_restricted_bridger_once_per_call(
+    alice, chain, root_gauge_factory, free_bridger, restricted_bridger, deploy_gauges
+):
+    gauges = deploy_gauges(restricted_bridger, [False, True, True])
+    gauges += deploy_gauges(free_bridger, [True])
+    chain.mine(timedelta=3 * WEEK)
+
+    tx = root_gauge_factory.transmit_emissions_many(gauges, {"from": alice})
+
+    # the failed gauge does not use up the bridger, gauges of other bridgers are unaffected
+    assert tx.return_value == [False, True, False, True]
@@ -1,6 +1,6 @@
 import brownie
 import pytest
-from brownie import ETH_ADDRESS
+from brownie import ETH_ADDRESS, Contract
 
 
 @pytest.fixture(scope="module")
@@ -250,3 +250,150 @@ def test_set_call_proxy_revert_for_unauthorised_users(
     for acct in [bob, charlie, default_e_admin]:
         with brownie.reverts():
             root_gauge_factory_proxy.set_call_proxy(root_gauge_factory, ETH_ADDRESS, {"from": acct})
+
+
+def test_set_min_bridge_amount_success_for_authorised_users(
+    root_gauge_factory,
+    root_gauge_factory_proxy,
+    chain,
+    transfer_factory_ownership_to_proxy,
+    default_owner,
+):
+
+    manager = root_gauge_factory_proxy.manager()
+    for acct in [manager, default_owner]:
+        root_gauge_factory_proxy.set_min_bridge_amount(
+            root_gauge_factory, chain.id, 10**18, {"from": acct}
+        )
+        assert root_gauge_factory.min_bridge_amount(chain.id) == 10**18
+        chain.undo()
+
+
+def test_set_min_bridge_amount_revert_for_unauthorised_users(
+    bob,
+    charlie,
+    chain,
+    root_gauge_factory,
+    root_gauge_factory_proxy,
+    transfer_factory_ownership_to_proxy,
+    default_e_admin,
+):
+
+    for acct in [bob, charlie, default_e_admin]:
+        with brownie.reverts():
+            root_gauge_factory_proxy.set_min_bridge_amount(
+                root_gauge_factory, chain.id, 10**18, {"from": acct}
+            )
+
+
+def test_set_child_clone_args_success_for_authorised_users(
+    root_gauge_factory,
+    root_gauge_factory_proxy,
+    chain,
+    transfer_factory_ownership_to_proxy,
+    default_owner,
+):
+
+    manager = root_gauge_factory_proxy.manager()
+    for acct in [manager, default_owner]:
+        root_gauge_factory_proxy.set_child_clone_args(
+            root_gauge_factory, chain.id, True, {"from": acct}
+        )
+        assert root_gauge_factory.get_child_clone_args(chain.id)
+        chain.undo()
+
+
+def test_set_child_clone_args_revert_for_unauthorised_users(
+    bob,
+    charlie,
+    chain,
+    root_gauge_factory,
+    root_gauge_factory_proxy,
+    transfer_factory_ownership_to_proxy,
+    default_e_admin,
+):
+
+    for acct in [bob, charlie, default_e_admin]:
+        with brownie.reverts():
+            root_gauge_factory_proxy.set_child_clone_args(
+                root_gauge_factory, chain.id, True, {"from": acct}
+            )
+
+
+@pytest.fixture(scope="module")
+def root_gauges(alice, chain, root_gauge, root_gauge_factory, RootGauge):
+    gauges = [root_gauge]
+    for salt in range(1, 4):
+        tx = root_gauge_factory.deploy_gauge(chain.id, salt, {"from": alice})
+        gauges.append(Contract.from_abi("Root Gauge", tx.return_value, RootGauge.abi))
+    return gauges
+
+
+def test_set_killed_many_success_for_authorised_admin(
+    chain,
+    root_gauges,
+    root_gauge_factory_proxy,
+    transfer_factory_ownership_to_proxy,
+    default_owner,
+    default_e_admin,
+):
+
+    for authorised_admin in [default_owner, default_e_admin]:
+        root_gauge_factory_proxy.set_killed_many(root_gauges, True, {"from": authorised_admin})
+        assert all(gauge.is_killed() for gauge in root_gauges)
+        chain.undo()
+
+
+def test_set_killed_many_reverts_for_unauthorised_users(
+    alice, bob, charlie, root_gauges, root_gauge_factory_proxy, transfer_factory_ownership_to_proxy
+):
+
+    for unauthorised_acct in [alice, bob, charlie]:
+        with brownie.reverts():
+            root_gauge_factory_proxy.set_killed_many(root_gauges, True, {"from": unauthorised_acct})
+
+
+def test_set_killed_many_is_atomic(
+    alice,
+    root_gauges,
+    root_gauge_factory_proxy,
+    transfer_factory_ownership_to_proxy,
+    default_e_admin,
+):
+
+    # a gauge not owned by the proxy reverts the whole batch
+    with brownie.reverts():
+        root_gauge_factory_proxy.set_killed_many(
+            root_gauges + [alice], True, {"from": default_e_admin}
+        )
+    assert not any(gauge.is_killed() for gauge in root_gauges)
+
+
+def test_set_child_gauge_many_success_for_authorised_users(
+    bob, charlie, root_gauges, root_gauge_factory_proxy, transfer_factory_ownership_to_proxy
+):
+    owner = root_gauge_factory_proxy.ownership_admin()
+    children = [bob, charlie] * 2
+    root_gauge_factory_proxy.set_child_gauge_many(root_gauges, children, {"from": owner})
+    assert [gauge.child_gauge() for gauge in root_gauges] == children
+
+
+def test_set_child_gauge_many_revert_for_unauthorised_users(
+    bob,
+    charlie,
+    root_gauges,
+    root_gauge_factory_proxy,
+    default_e_admin,
+    transfer_factory_ownership_to_proxy,
+):
+    for acct in [bob, charlie, default_e_admin]:
+        with brownie.reverts():
+            root_gauge_factory_proxy.set_child_gauge_many(root_gauges, [acct] * 4, {"from": acct})
+
+
+def test_set_child_gauge_many_length_mismatch(
+    bob, root_gauges, root_gauge_factory_proxy, transfer_factory_ownership_to_proxy
+):
+    owner = root_gauge_factory_proxy.ownership_admin()
+    with brownie.reverts("dev: length mismatch"):
+        root_gauge_factory_proxy.set_child_gauge_many(root_gauges, [bob] * 3, {"from": owner})